@@ -0,0 +1,62 @@
+"""
+Name: AwesomeNova
+Updated at: 10/17/2026
+
+asyncio entry points for converter.py, for services that run conversions inside an event loop. Each conversion runs in
+a thread of an executor, which reads the input files, converts the reactions, and writes the output files, so the event
+loop is never blocked by a conversion and any number of them can be awaited at once. Reactions can also be converted in
+worker processes by passing workers, which keeps the event loop thread from sharing the interpreter with them.
+
+Cancelling the task awaiting a conversion stops the conversion at its next chunk. Output files that existed before are
+left untouched, and the task raises CancelledError once the conversion has cleaned up after itself.
+
+This is an example of converting a network from a coroutine:
+    success = await async_converter.convert_aleae_to_marlea("init.in", "react.r", "MARlea_crn.csv", "W", ["S.1"])
+"""
+import asyncio
+import functools
+import threading
+
+import converter
+
+
+async def run_conversion(start_conversion, executor, *args, **options):
+    """
+    Run a conversion in an executor and cancel it if the awaiting task is cancelled
+    :param start_conversion: converter.start_a_to_m_conversion or converter.start_m_to_a_conversion
+    :param executor: concurrent.futures executor to run the conversion in, or None for the event loop's default one
+    :return: True if the conversion finished without halting
+    """
+    cancel_event = threading.Event()
+    future = asyncio.get_running_loop().run_in_executor(
+        executor, functools.partial(start_conversion, *args, cancel_event=cancel_event, **options))
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        cancel_event.set()
+        await asyncio.wait([future])                                        # Let the writers discard their output
+        raise
+
+
+async def convert_aleae_to_marlea(aleae_in_filename, aleae_r_filename, marlea_filename, waste='', aether=None,
+                                  pipeline_enabled=False, executor=None, **options):
+    """
+    Convert a pair of Aleae files into a MARlea file without blocking the event loop
+    :param executor: concurrent.futures executor to run the conversion in, or None for the event loop's default one
+    :param options: keyword arguments of converter.start_a_to_m_conversion, such as workers or use_cache
+    :return: True if the conversion finished without halting
+    """
+    return await run_conversion(converter.start_a_to_m_conversion, executor, aleae_in_filename, aleae_r_filename,
+                                marlea_filename, waste, [] if aether is None else aether, pipeline_enabled, **options)
+
+
+async def convert_marlea_to_aleae(marlea_filename, aleae_in_filename, aleae_r_filename, waste='', aether=None,
+                                  pipeline_enabled=False, executor=None, **options):
+    """
+    Convert a MARlea file into a pair of Aleae files without blocking the event loop
+    :param executor: concurrent.futures executor to run the conversion in, or None for the event loop's default one
+    :param options: keyword arguments of converter.start_m_to_a_conversion, such as workers or use_cache
+    :return: True if the conversion finished without halting
+    """
+    return await run_conversion(converter.start_m_to_a_conversion, executor, aleae_in_filename, aleae_r_filename,
+                                marlea_filename, waste, [] if aether is None else aether, pipeline_enabled, **options)
@@ -0,0 +1,131 @@
+"""
+Name: AwesomeNova
+Updated at: 10/17/2026
+
+Batch conversion for converter.py. A directory tree is searched for Aleae networks (a .in and a .r file sharing a stem in
+the same directory) and MARlea networks (.csv files), and every network found is converted by a pool of worker
+processes. The output directory mirrors the layout of the input directory.
+
+This is the template for a batch conversion:
+'python converter.py batch <--input> <input directory> <--output> <output directory> [--mode] [--jobs] [--no_cache] [--waste] [--aether]'
+"""
+import contextlib
+import io
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import converter
+
+A_TO_M = "a-to-m"
+M_TO_A = "m-to-a"
+
+
+def find_networks(input_dir, mode):
+    """
+    Walk a directory tree and collect every network that can be converted
+    :param input_dir: root of the directory tree to search
+    :param mode: 'a-to-m', 'm-to-a', or 'all' to pick which networks are collected
+    :return: list of (conversion mode, list of input paths, path of the network relative to input_dir without extension)
+    """
+    networks = []
+    for dir_path, dir_names, filenames in os.walk(input_dir):
+        dir_names.sort()                                                    # Keep discovery order stable between runs
+        stems = {}
+        for filename in sorted(filenames):
+            stem, ext = os.path.splitext(filename)
+            stems.setdefault(stem, set()).add(ext)
+
+        for stem, exts in stems.items():
+            rel_stem = os.path.relpath(os.path.join(dir_path, stem), input_dir)
+            if mode != M_TO_A and ".in" in exts and ".r" in exts:
+                networks.append((A_TO_M, [os.path.join(dir_path, stem + ".in"), os.path.join(dir_path, stem + ".r")],
+                                 rel_stem))
+            if mode != A_TO_M and ".csv" in exts:
+                networks.append((M_TO_A, [os.path.join(dir_path, stem + ".csv")], rel_stem))
+    return networks
+
+
+def convert_network(job):
+    """
+    Convert one network inside a worker process. Anything the converter prints is captured so that the diagnostics of
+    each network are reported together instead of being interleaved with other workers.
+    :param job: tuple of (mode, input paths, output stem, waste, aether, pipeline_enabled, use_cache)
+    :return: tuple of (success, seconds taken, number of input bytes, captured diagnostics)
+    """
+    mode, input_files, output_stem, waste, aether, pipeline_enabled, use_cache = job
+    os.makedirs(os.path.dirname(output_stem) or ".", exist_ok=True)
+    diagnostics = io.StringIO()
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(diagnostics):
+        try:
+            if mode == A_TO_M:
+                success = converter.start_a_to_m_conversion(input_files[0], input_files[1], output_stem + ".csv",
+                                                            waste, aether, pipeline_enabled, use_cache=use_cache)
+            else:
+                success = converter.start_m_to_a_conversion(output_stem + ".in", output_stem + ".r", input_files[0],
+                                                            waste, aether, pipeline_enabled, use_cache=use_cache)
+        except Exception as e:                                              # One broken network must not end the batch
+            print(type(e).__name__ + ":", e)
+            success = False
+    elapsed = time.perf_counter() - start
+
+    num_bytes = sum(os.path.getsize(filename) for filename in input_files if os.path.isfile(filename))
+    return success, elapsed, num_bytes, diagnostics.getvalue()
+
+
+def run_batch(input_dir, output_dir, mode="all", waste='', aether=None, pipeline_enabled=False, jobs=None,
+              use_cache=True):
+    """
+    Convert every network found under input_dir with a pool of worker processes and report the results
+    :param input_dir: root of the directory tree holding the input networks
+    :param output_dir: root of the directory tree the converted networks are written to
+    :param mode: 'a-to-m', 'm-to-a', or 'all'
+    :param waste: a specified chemical that will be converted to a NULL in the products
+    :param aether: list of chemicals that will be converted to a NULL in the reactants
+    :param pipeline_enabled: enable pipelined execution within each conversion
+    :param jobs: number of worker processes, defaulting to the number of cores
+    :param use_cache: reuse and store converted networks in the conversion cache
+    :return: True if every network was converted without halting
+    """
+    if not os.path.isdir(input_dir):
+        print("Error: Input directory", input_dir, "does not exist")
+        return False
+
+    networks = find_networks(input_dir, mode)
+    if len(networks) == 0:
+        print("No networks found in", input_dir)
+        return True
+
+    aether = [] if aether is None else aether
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    tasks = [(net_mode, input_files, os.path.join(output_dir, rel_stem), waste, aether, pipeline_enabled, use_cache)
+             for net_mode, input_files, rel_stem in networks]
+
+    failures = []
+    total_bytes = 0
+    total_conversion_time = 0.0
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as executor:
+        chunk_size = max(1, len(tasks) // (jobs * 4))                       # Amortize process hand-offs for small files
+        for (net_mode, input_files, rel_stem), result in zip(networks, executor.map(convert_network, tasks,
+                                                                                     chunksize=chunk_size)):
+            success, elapsed, num_bytes, diagnostics = result
+            total_bytes += num_bytes
+            total_conversion_time += elapsed
+            if not success:
+                failures.append((net_mode, input_files, diagnostics))
+    wall_time = time.perf_counter() - start
+
+    print("Converted", len(networks) - len(failures), "of", len(networks), "networks in",
+          f"{wall_time:.3f}s using {min(jobs, len(tasks))} worker process(es)")
+    print(f"Throughput: {len(networks) / wall_time:.1f} networks/s, {total_bytes / wall_time / 1e6:.2f} MB/s "
+          f"({total_conversion_time:.3f}s of conversion time across all workers)")
+    for net_mode, input_files, diagnostics in failures:
+        print("Failed (" + net_mode + "):", " ".join(input_files))
+        for line in diagnostics.splitlines():
+            if line.strip() != "":
+                print("    " + line)
+    return len(failures) == 0
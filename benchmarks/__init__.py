@@ -0,0 +1,4 @@
+"""
+Benchmarks for converter.py. Every benchmark is run from the root of the repo as a module, e.g.
+'python -m benchmarks.tokenizer'.
+"""
@@ -0,0 +1,142 @@
+"""
+Name: AwesomeNova
+Updated at: 10/17/2026
+
+Generates synthetic chemical reaction networks for the benchmarks. Each network is written both as an Aleae .in/.r pair
+and as a MARlea .csv file holding the same reactions, so both conversions can be timed on it. The size and shape of the
+network are configurable:
+    reactions, species: number of reactions and of chemicals
+    max_order: most molecules on either side of a reaction
+    duplicate_ratio: fraction of reactions that repeat an earlier reaction word for word
+    waste_ratio, aether_ratio: fraction of reactions whose products are the waste chemical W or whose reactants are the
+    aether chemical S, which convert to and from NULL with '--waste W --aether S'
+    comment_ratio: comment rows per reaction in the MARlea file (Aleae files have no comments)
+    init_ratio: fraction of chemicals given a nonzero initial count
+
+This is the template for generating a network from the root of the repo:
+'python -m benchmarks.generator -o <directory> [--name NAME] [--reactions N] [--species N] [--max_order N]
+[--duplicate_ratio R] [--waste_ratio R] [--aether_ratio R] [--comment_ratio R] [--init_ratio R] [--seed N]'
+"""
+import argparse
+import os
+import random
+
+WASTE = "W"
+AETHER = "S"
+
+
+def random_side(rng, names, max_order):
+    """Return the terms of one side of a reaction as (chemical, coefficient) pairs, holding 1 to max_order molecules."""
+    coeffs = {}
+    for _ in range(rng.randint(1, max_order)):
+        name = rng.choice(names)
+        coeffs[name] = coeffs.get(name, 0) + 1
+    return list(coeffs.items())
+
+
+def random_reaction(rng, names, max_order, waste_ratio, aether_ratio):
+    """
+    Return a random reaction
+    :return: tuple of (reactant terms, product terms, rate), where an empty side stands for the aether in the reactants
+    or the waste in the products
+    """
+    reactants = [] if rng.random() < aether_ratio else random_side(rng, names, max_order)
+    products = [] if rng.random() < waste_ratio else random_side(rng, names, max_order)
+    if len(reactants) == 0 and len(products) == 0:                         # NULL => NULL is not a reaction
+        products = random_side(rng, names, max_order)
+    return reactants, products, str(rng.randint(1, 1000))
+
+
+def aleae_line(reactants, products, rate):
+    """
+    Return the .r line of a reaction, with the aether and the waste standing in for empty sides. The aether catalyzes
+    the reaction, so it is a product as well, like in the .r files converted from MARlea.
+    """
+    if len(reactants) == 0:
+        reactants, products = [(AETHER, 1)], [(AETHER, 1)] + products
+    if len(products) == 0:
+        products = [(WASTE, 1)]
+    return " : ".join(" ".join(chem + " " + str(coeff) for chem, coeff in terms)
+                      for terms in (reactants, products)) + " : " + rate + "\n"
+
+
+def marlea_row(reactants, products, rate):
+    """Return the MARlea row of a reaction, with NULL standing in for empty sides."""
+    sides = [" + ".join(chem if coeff == 1 else str(coeff) + " " + chem for chem, coeff in terms) if len(terms) > 0
+             else "NULL" for terms in (reactants, products)]
+    return sides[0] + " => " + sides[1] + "," + rate + "\r\n"
+
+
+def generate_network(directory, name="net", reactions=100000, species=1000, max_order=2, duplicate_ratio=0.0,
+                     waste_ratio=0.0, aether_ratio=0.0, comment_ratio=0.0, init_ratio=0.7, seed=0):
+    """
+    Write a random network as an Aleae .in/.r pair and as a MARlea file into a directory
+    :return: paths of the .in, .r, and .csv files
+    """
+    rng = random.Random(seed)
+    names = ["X" + str(i) for i in range(species)]
+    in_path, r_path, csv_path = (os.path.join(directory, name + ext) for ext in (".in", ".r", ".csv"))
+    os.makedirs(directory, exist_ok=True)
+
+    with open(in_path, "w") as f_in, open(csv_path, "w", newline='') as f_csv:
+        for chem in names:
+            amount = rng.randint(1, 100) if rng.random() < init_ratio else 0
+            f_in.write(chem + " " + str(amount) + " N\n")
+            if amount > 0:                                                  # MARlea has no zero initial counts
+                f_csv.write(chem + "," + str(amount) + "\r\n")
+        f_in.write(WASTE + " 0 N\n" + AETHER + " 1 N\n")
+
+    written = []
+    with open(r_path, "w") as f_r, open(csv_path, "a", newline='') as f_csv:
+        for _ in range(reactions):
+            if len(written) > 0 and rng.random() < duplicate_ratio:
+                reaction = rng.choice(written)
+            else:
+                reaction = random_reaction(rng, names, max_order, waste_ratio, aether_ratio)
+                written.append(reaction)
+            f_r.write(aleae_line(*reaction))
+
+            comments = int(comment_ratio) + (rng.random() < comment_ratio % 1)
+            f_csv.write("// generated comment,\r\n" * comments)
+            f_csv.write(marlea_row(*reaction))
+    return in_path, r_path, csv_path
+
+
+def add_network_args(arg_parser):
+    """Add the options of generate_network() to an argument parser."""
+    arg_parser.add_argument("--reactions", type=int, default=100000, help="Number of reactions")
+    arg_parser.add_argument("--species", type=int, default=1000, help="Number of chemicals")
+    arg_parser.add_argument("--max_order", type=int, default=2, help="Most molecules on either side of a reaction")
+    arg_parser.add_argument("--duplicate_ratio", type=float, default=0.0,
+                            help="Fraction of reactions that repeat an earlier one")
+    arg_parser.add_argument("--waste_ratio", type=float, default=0.0, help="Fraction of reactions producing waste")
+    arg_parser.add_argument("--aether_ratio", type=float, default=0.0,
+                            help="Fraction of reactions with the aether as reactant")
+    arg_parser.add_argument("--comment_ratio", type=float, default=0.0,
+                            help="Comment rows per reaction in the MARlea file")
+    arg_parser.add_argument("--init_ratio", type=float, default=0.7,
+                            help="Fraction of chemicals with a nonzero initial count")
+    arg_parser.add_argument("--seed", type=int, default=0, help="Seed of the random generator")
+
+
+def network_options(args):
+    """Return the options of generate_network() from parsed arguments."""
+    return {"reactions": args.reactions, "species": args.species, "max_order": args.max_order,
+            "duplicate_ratio": args.duplicate_ratio, "waste_ratio": args.waste_ratio,
+            "aether_ratio": args.aether_ratio, "comment_ratio": args.comment_ratio, "init_ratio": args.init_ratio,
+            "seed": args.seed}
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(prog="benchmarks.generator")
+    arg_parser.add_argument("-o", "--output", required=True, help="Directory the network is written to")
+    arg_parser.add_argument("--name", default="net", help="Name the network files are given")
+    add_network_args(arg_parser)
+    args = arg_parser.parse_args()
+
+    for path in generate_network(args.output, args.name, **network_options(args)):
+        print("Wrote", path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Name: AwesomeNova
+Updated at: 10/17/2026
+
+Times both conversions of one network sequentially and with pipelined execution for a range of chunk sizes, i.e. the
+number of lines the stages hand each other at a time. Small chunks show the cost of passing single lines through the
+queues. The network comes from benchmarks/generator.py.
+
+Pipelined execution does not beat sequential execution. Reading, converting, and writing are all CPU-bound Python, and
+the stage threads share the GIL, so they take turns instead of running at once: with chunks, pipelined runs take about
+as long as sequential ones (between 0.8x and 1.2x from run to run), and never less than the CPU time of all the stages
+together. Converting on more cores takes --workers, which moves conversion into separate processes.
+
+This is the template for running the benchmark from the root of the repo:
+'python -m benchmarks.pipeline [--reactions N] [--chunk_sizes N N ...] [--repeat N]'
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import converter
+from benchmarks.generator import generate_network
+
+
+def time_conversion(start_conversion, paths, pipeline_enabled, chunk_size, repeat):
+    """Return the best of repeat runs of one conversion in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        start_conversion(*paths, '', [], pipeline_enabled, chunk_size=chunk_size, use_cache=False)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(prog="benchmarks.pipeline")
+    arg_parser.add_argument("--reactions", type=int, default=100000, help="Number of reactions in the network")
+    arg_parser.add_argument("--chunk_sizes", type=int, nargs='+', default=[1, 16, 256, 4096],
+                            help="Chunk sizes to time")
+    arg_parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement; the best one is reported")
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        in_path, r_path, csv_path = generate_network(directory, reactions=args.reactions,
+                                                     species=args.reactions // 2, init_ratio=1.0)
+        out_stem = os.path.join(directory, "out")
+        conversions = {"a-to-m": (converter.start_a_to_m_conversion, (in_path, r_path, out_stem + ".csv")),
+                       "m-to-a": (converter.start_m_to_a_conversion, (out_stem + ".in", out_stem + ".r", csv_path))}
+
+        print(f"{args.reactions:,} reactions, best of {args.repeat} run(s), {os.cpu_count()} core(s)")
+        for mode, (start_conversion, paths) in conversions.items():
+            for chunk_size in args.chunk_sizes:
+                sequential = time_conversion(start_conversion, paths, False, chunk_size, args.repeat)
+                pipelined = time_conversion(start_conversion, paths, True, chunk_size, args.repeat)
+                print(f"{mode}  chunk size {chunk_size:>6}:   sequential {sequential:8.3f}s   "
+                      f"pipelined {pipelined:8.3f}s   ({sequential / pipelined:5.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Name: AwesomeNova
+Updated at: 10/17/2026
+
+Times both conversions of a generated network (see benchmarks/generator.py) sequentially and pipelined, and records
+the best time, the lines converted per second, and the peak resident memory of each as JSON. Every run happens in a
+fresh process so that peak memory belongs to that run alone. Results saved with --output can be given to a later run
+with --baseline, which prints how each measurement changed since.
+
+This is the template for running the benchmark from the root of the repo:
+'python -m benchmarks.runner [--output results.json] [--baseline results.json] [--repeat N] [--modes ...]
+[--workers N] [generator options, see benchmarks.generator]'
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import converter
+from benchmarks.generator import WASTE, AETHER, generate_network, add_network_args, network_options
+
+try:
+    import resource
+except ImportError:                                                         # Not available on Windows
+    resource = None
+
+MODES = ["a-to-m", "a-to-m-pipelined", "m-to-a", "m-to-a-pipelined"]
+
+
+def peak_rss_mb():
+    """Return the peak resident memory of this process in MB, or None where it cannot be measured."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1 << 20) if sys.platform == "darwin" else peak / 1024    # Bytes on macOS, kilobytes elsewhere
+
+
+def count_lines(filename):
+    """Return the number of lines in a file."""
+    with open(filename, "rb") as f:
+        return sum(block.count(b"\n") for block in iter(lambda: f.read(1 << 20), b""))
+
+
+def timed_conversion(task):
+    """
+    Run one conversion inside a fresh worker process
+    :param task: tuple of (mode, path of the network without extension, output directory, workers)
+    :return: tuple of (seconds taken, peak resident memory in MB, whether the conversion succeeded)
+    """
+    mode, stem, out_dir, workers = task
+    pipeline_enabled = mode.endswith("-pipelined")
+    start = time.perf_counter()
+    if mode.startswith("a-to-m"):
+        success = converter.start_a_to_m_conversion(stem + ".in", stem + ".r", os.path.join(out_dir, "out.csv"),
+                                                    WASTE, [AETHER], pipeline_enabled, workers, use_cache=False)
+    else:
+        success = converter.start_m_to_a_conversion(os.path.join(out_dir, "out.in"), os.path.join(out_dir, "out.r"),
+                                                    stem + ".csv", WASTE, [AETHER], pipeline_enabled, workers,
+                                                    use_cache=False)
+    return time.perf_counter() - start, peak_rss_mb(), success
+
+
+def run_benchmark(options, modes, repeat, workers):
+    """
+    Generate a network and time each mode on it
+    :param options: keyword arguments of generate_network()
+    :return: the results as a JSON object
+    """
+    results = {"generated": time.strftime("%Y-%m-%dT%H:%M:%S"), "python": platform.python_version(),
+               "platform": platform.platform(), "cpus": os.cpu_count(), "network": options, "workers": workers,
+               "results": {}}
+    with tempfile.TemporaryDirectory() as directory:
+        in_path, r_path, csv_path = generate_network(directory, **options)
+        input_lines = {"a-to-m": count_lines(in_path) + count_lines(r_path), "m-to-a": count_lines(csv_path)}
+        stem = os.path.join(directory, "net")
+
+        with ProcessPoolExecutor(1, max_tasks_per_child=1) as executor:
+            for mode in modes:
+                runs = [executor.submit(timed_conversion, (mode, stem, directory, workers)).result()
+                        for _ in range(repeat)]
+                best = min(seconds for seconds, _, _ in runs)
+                lines = input_lines[mode[:6]]
+                peaks = [peak for _, peak, _ in runs if peak is not None]
+                results["results"][mode] = {"seconds": best, "runs": [seconds for seconds, _, _ in runs],
+                                            "input_lines": lines, "lines_per_second": lines / best,
+                                            "peak_rss_mb": max(peaks) if len(peaks) > 0 else None,
+                                            "success": all(success for _, _, success in runs)}
+    return results
+
+
+def print_results(results, baseline=None):
+    """Print a table of the results, with the change since a baseline if one is given."""
+    network = results["network"]
+    print(f"{network['reactions']:,} reactions, {network['species']:,} chemicals, best of "
+          f"{len(next(iter(results['results'].values()))['runs'])} run(s)")
+    for mode, result in results["results"].items():
+        peak = "n/a" if result["peak_rss_mb"] is None else f"{result['peak_rss_mb']:.0f} MB"
+        line = (f"{mode:<18} {result['seconds']:8.3f}s   {result['lines_per_second']:12,.0f} lines/s   "
+                f"peak {peak:>7}" + ("" if result["success"] else "   (halted)"))
+        if baseline is not None and mode in baseline["results"]:
+            line += f"   {baseline['results'][mode]['seconds'] / result['seconds']:5.2f}x vs baseline"
+        print(line)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(prog="benchmarks.runner")
+    arg_parser.add_argument("--output", help="Path of a JSON file the results are written to")
+    arg_parser.add_argument("--baseline", help="Path of a JSON file from an earlier run to compare against")
+    arg_parser.add_argument("--repeat", type=int, default=3, help="Runs per mode; the best one is reported")
+    arg_parser.add_argument("--modes", nargs='+', choices=MODES, default=MODES, help="Conversions to time")
+    arg_parser.add_argument("-w", "--workers", type=int, default=1, help="Worker processes of each conversion")
+    add_network_args(arg_parser)
+    args = arg_parser.parse_args()
+
+    baseline = None
+    if args.baseline is not None:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline["network"] != network_options(args):
+            print("Warning: the baseline was measured on a different network")
+
+    results = run_benchmark(network_options(args), args.modes, args.repeat, args.workers)
+    print_results(results, baseline)
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
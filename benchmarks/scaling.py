@@ -0,0 +1,67 @@
+"""
+Name: AwesomeNova
+Updated at: 10/17/2026
+
+Times both conversions on networks that grow from a thousand to a million reactions, with the number of chemicals
+growing alongside them, and fits the growth of the conversion time. An exponent close to 1 means conversion time
+grows linearly with the size of the network. The networks come from benchmarks/generator.py, with every chemical
+initialized.
+
+This is the template for running the benchmark from the root of the repo:
+'python -m benchmarks.scaling [--sizes N N ...] [--species_ratio R] [--pipeline_enable]'
+"""
+import argparse
+import math
+import os
+import tempfile
+import time
+
+import converter
+from benchmarks.generator import generate_network
+
+
+def fit_exponent(sizes, seconds):
+    """Least-squares slope of log(seconds) against log(size)."""
+    xs, ys = [math.log(n) for n in sizes], [math.log(t) for t in seconds]
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    return (sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+            / sum((x - mean_x) ** 2 for x in xs))
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(prog="benchmarks.scaling")
+    arg_parser.add_argument("--sizes", type=int, nargs='+', default=[1000, 10000, 100000, 1000000],
+                            help="Numbers of reactions to convert")
+    arg_parser.add_argument("--species_ratio", type=float, default=0.5,
+                            help="Number of chemicals per reaction in each network")
+    arg_parser.add_argument("-p", "--pipeline_enable", action='store_true', help="Enable pipelined execution")
+    args = arg_parser.parse_args()
+
+    timings = {"a-to-m": [], "m-to-a": []}
+    with tempfile.TemporaryDirectory() as directory:
+        for size in args.sizes:
+            num_species = max(1, int(size * args.species_ratio))
+            in_path, r_path, csv_path = generate_network(directory, reactions=size, species=num_species,
+                                                         init_ratio=1.0)
+
+            start = time.perf_counter()
+            converter.start_a_to_m_conversion(in_path, r_path, os.path.join(directory, "out.csv"), '', [],
+                                              args.pipeline_enable, use_cache=False)
+            timings["a-to-m"].append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            converter.start_m_to_a_conversion(os.path.join(directory, "out.in"), os.path.join(directory, "out.r"),
+                                              csv_path, '', [], args.pipeline_enable, use_cache=False)
+            timings["m-to-a"].append(time.perf_counter() - start)
+
+            print(f"{size:>9,} reactions, {num_species:>9,} chemicals:   "
+                  f"a-to-m {timings['a-to-m'][-1]:8.3f}s ({timings['a-to-m'][-1] / size * 1e6:6.2f} us/reaction)   "
+                  f"m-to-a {timings['m-to-a'][-1]:8.3f}s ({timings['m-to-a'][-1] / size * 1e6:6.2f} us/reaction)")
+
+    if len(args.sizes) > 1:
+        for mode, seconds in timings.items():
+            print(f"{mode}: conversion time grows as size^{fit_exponent(args.sizes, seconds):.2f}")
+
+
+if __name__ == "__main__":
+    main()
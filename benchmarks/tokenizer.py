@@ -0,0 +1,104 @@
+"""
+Name: AwesomeNova
+Updated at: 10/17/2026
+
+Measures how many lines per second AleaeTokenizer and MARleaTokenizer get through. The tokenizers from before the
+single-pass rewrite are kept here as LegacyAleaeTokenizer and LegacyMARleaTokenizer, so both can be compared on the
+same lines.
+
+This is the template for running the benchmark from the root of the repo:
+'python -m benchmarks.tokenizer [--lines N] [--repeat N]'
+"""
+import argparse
+import random
+import re
+import time
+
+from converter import (Tokenizer, AleaeTokenizer, MARleaTokenizer, NodeEnum, ALEAE_FIELD_SEPARATOR,
+                       MARLEA_TERM_SEPARATOR, MARLEA_ARROW, MARLEA_NULL)
+
+
+class LegacyAleaeTokenizer(Tokenizer):
+    """AleaeTokenizer as it was before the single-pass rewrite."""
+    def tokenize(self):
+        num_field_sep = 0
+        for token in self.line.strip().split():
+            if re.fullmatch(r'\d+', token.strip()) is not None and num_field_sep < 2:
+                self.tokens.append((NodeEnum.COEFF, token.strip()))
+            elif re.fullmatch(r'\d+', token.strip()) is not None:
+                self.tokens.append((NodeEnum.RATE, token.strip()))
+            elif (re.fullmatch(rf'{MARLEA_ARROW}', token.strip()) is not None
+                  or re.fullmatch(rf'{MARLEA_NULL}', token.strip()) is not None):
+                return False
+            elif re.fullmatch(rf'{ALEAE_FIELD_SEPARATOR}', token.strip()) is not None:
+                self.tokens.append((NodeEnum.FIELD_SEP, token.strip()))
+                num_field_sep += 1
+            elif re.fullmatch(r'[^+: ]+', token.strip()) is not None:
+                self.tokens.append((NodeEnum.CHEM, token.strip()))
+            else:
+                return False
+        return True
+
+
+class LegacyMARleaTokenizer(Tokenizer):
+    """MARleaTokenizer as it was before the single-pass rewrite."""
+    def tokenize(self):
+        for token in self.line.strip().split():
+            if re.fullmatch(f'{MARLEA_ARROW}', token.strip()) is not None:
+                self.tokens.append((NodeEnum.MARLEA_ARROW, token.strip()))
+            elif re.fullmatch(f'{MARLEA_NULL}', token.strip()) is not None:
+                self.tokens.append((NodeEnum.MARLEA_NULL, token.strip()))
+            elif re.fullmatch(f'[{MARLEA_TERM_SEPARATOR}]', token.strip()) is not None:
+                self.tokens.append((NodeEnum.TERM_SEP, token.strip()))
+            elif re.fullmatch(r'\d+', token.strip()) is not None:
+                self.tokens.append((NodeEnum.COEFF, token.strip()))
+            elif re.fullmatch(r'[^+: ]+', token.strip()) is not None:
+                self.tokens.append((NodeEnum.CHEM, token.strip()))
+            else:
+                return False
+        return True
+
+
+def make_lines(num_lines, seed=0):
+    """Build matching Aleae and MARlea reaction lines with one to three terms per side."""
+    rng = random.Random(seed)
+    aleae_lines, marlea_lines = [], []
+    for _ in range(num_lines):
+        sides = []
+        for _ in range(2):
+            sides.append([("X" + str(rng.randrange(1000)), rng.randint(1, 3)) for _ in range(rng.randint(1, 3))])
+        rate = str(rng.randint(1, 1000))
+        aleae_lines.append(" : ".join(" ".join(chem + " " + str(coeff) for chem, coeff in side) for side in sides)
+                           + " : " + rate + "\n")
+        marlea_lines.append(" => ".join(" + ".join(chem if coeff == 1 else str(coeff) + " " + chem
+                                                   for chem, coeff in side) for side in sides))
+    return aleae_lines, marlea_lines
+
+
+def time_tokenizer(tokenizer_class, lines, repeat):
+    """Return the best lines per second out of several runs over the same lines."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for line in lines:
+            tokenizer_class(line).tokenize()
+        best = min(best, time.perf_counter() - start)
+    return len(lines) / best
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(prog="benchmarks.tokenizer")
+    arg_parser.add_argument("--lines", type=int, default=100000, help="Number of reaction lines to tokenize")
+    arg_parser.add_argument("--repeat", type=int, default=3, help="Number of runs; the fastest one is reported")
+    args = arg_parser.parse_args()
+
+    aleae_lines, marlea_lines = make_lines(args.lines)
+    for name, legacy, current, lines in (("Aleae", LegacyAleaeTokenizer, AleaeTokenizer, aleae_lines),
+                                         ("MARlea", LegacyMARleaTokenizer, MARleaTokenizer, marlea_lines)):
+        before = time_tokenizer(legacy, lines, args.repeat)
+        after = time_tokenizer(current, lines, args.repeat)
+        print(f"{name:>6}: before {before:>12,.0f} lines/s   after {after:>12,.0f} lines/s   speedup {after / before:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
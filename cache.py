@@ -0,0 +1,145 @@
+"""
+Name: AwesomeNova
+Updated at: 10/17/2026
+
+On-disk cache of finished conversions for converter.py. Each entry is keyed on a hash of the input file(s), the
+conversion mode, the waste and aether chemicals, and converter.py itself, so an entry is only reused when converting
+again would give the same output. Entries are evicted least recently used first once the cache grows past its size cap.
+
+The cache lives in $XDG_CACHE_HOME/aleae-marlea-converter (~/.cache/aleae-marlea-converter by default). It is bypassed
+with --no_cache and emptied with --clear_cache.
+"""
+import hashlib
+import os
+import shutil
+
+DEFAULT_MAX_SIZE = 1 << 30                  # Bytes of cached output kept before the least recently used is evicted
+HASH_BLOCK_SIZE = 1 << 20                   # Bytes of an input file hashed at a time
+CONVERTER_FILENAME = os.path.join(os.path.dirname(os.path.abspath(__file__)), "converter.py")
+
+
+def default_cache_dir():
+    """Return the directory the cache is kept in unless another one is given."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "aleae-marlea-converter")
+
+
+def hash_file(digest, filename):
+    """Feed the contents of a file into a hash object, a block at a time."""
+    with open(filename, "rb") as f:
+        block = f.read(HASH_BLOCK_SIZE)
+        while len(block) > 0:
+            digest.update(block)
+            block = f.read(HASH_BLOCK_SIZE)
+
+
+def copy_file_atomic(src, dst):
+    """Copy a file through a temporary file next to its destination, so the destination is never half-written."""
+    temp_dst = dst + "." + str(os.getpid()) + ".tmp"
+    shutil.copyfile(src, temp_dst)
+    os.replace(temp_dst, dst)
+
+
+class ConversionCache:
+    """
+    A directory of cached conversions. Each entry is a subdirectory named after its key that holds the output files of
+    a conversion, numbered in the order they were given. The modification time of an entry is its last use.
+    """
+    def __init__(self, cache_dir=None, max_size=DEFAULT_MAX_SIZE):
+        self.cache_dir = default_cache_dir() if cache_dir is None else cache_dir
+        self.max_size = max_size
+
+    def key(self, mode, input_filenames, waste, aether):
+        """
+        Hash everything that decides the output of a conversion
+        :param mode: 'a-to-m' or 'm-to-a'
+        :param input_filenames: paths of the input files in the order the conversion takes them
+        :param waste: the waste chemical of the conversion
+        :param aether: list of aether chemicals of the conversion, in order
+        :return: the key of the conversion, or None if an input file cannot be read
+        """
+        digest = hashlib.sha256()
+        digest.update("\0".join([mode, waste, *aether]).encode() + b"\0\0")
+        try:
+            hash_file(digest, CONVERTER_FILENAME)                           # Outputs of other versions are never reused
+            for filename in input_filenames:
+                file_digest = hashlib.sha256()
+                hash_file(file_digest, filename)
+                digest.update(file_digest.digest())
+        except OSError:
+            return None
+        return digest.hexdigest()
+
+    def fetch(self, key, output_filenames):
+        """
+        Copy the outputs of a cached conversion into place
+        :return: True if the conversion was cached with every one of the outputs and they were copied
+        """
+        entry_dir = os.path.join(self.cache_dir, key)
+        if not all(os.path.isfile(os.path.join(entry_dir, str(i))) for i in range(len(output_filenames))):
+            return False
+
+        try:
+            for i, filename in enumerate(output_filenames):
+                copy_file_atomic(os.path.join(entry_dir, str(i)), filename)
+            os.utime(entry_dir)                                             # Mark the entry as recently used
+        except OSError:
+            return False
+        return True
+
+    def store(self, key, output_filenames):
+        """
+        Add the outputs of a finished conversion to the cache and evict old entries if the cache is too large. An entry
+        holding fewer outputs of the same conversion is replaced.
+        """
+        try:
+            if sum(os.path.getsize(filename) for filename in output_filenames) > self.max_size:
+                return
+
+            temp_dir = os.path.join(self.cache_dir, key + "." + str(os.getpid()) + ".tmp")
+            os.makedirs(temp_dir, exist_ok=True)
+            for i, filename in enumerate(output_filenames):
+                shutil.copyfile(filename, os.path.join(temp_dir, str(i)))
+            entry_dir = os.path.join(self.cache_dir, key)
+            try:
+                if os.path.isdir(entry_dir) and len(os.listdir(entry_dir)) < len(output_filenames):
+                    shutil.rmtree(entry_dir, ignore_errors=True)
+                os.rename(temp_dir, entry_dir)
+            except OSError:                                                 # Another process cached it first
+                shutil.rmtree(temp_dir, ignore_errors=True)
+        except OSError:
+            return
+        self.evict()
+
+    def entries(self):
+        """Return (last use, size, path) of every entry in the cache."""
+        entries = []
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return entries
+
+        for name in names:
+            entry_dir = os.path.join(self.cache_dir, name)
+            if name.endswith(".tmp") or not os.path.isdir(entry_dir):
+                continue
+            try:
+                size = sum(entry.stat().st_size for entry in os.scandir(entry_dir))
+                entries.append((os.path.getmtime(entry_dir), size, entry_dir))
+            except OSError:                                                 # Evicted by another process meanwhile
+                continue
+        return entries
+
+    def evict(self):
+        """Remove the least recently used entries until the cache is no larger than its size cap."""
+        entries = sorted(self.entries())
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, entry_dir in entries:
+            if total_size <= self.max_size:
+                break
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            total_size -= size
+
+    def clear(self):
+        """Remove every entry in the cache."""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
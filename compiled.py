@@ -0,0 +1,477 @@
+"""
+Name: AwesomeNova
+Updated at: 10/17/2026
+
+Precompiled networks for converter.py. A network is compiled once from Aleae or MARlea files into a binary file holding
+its interned species table, each line of its .in file as a chemical ID, initial count, and threshold, the stoichiometry of each reaction as
+arrays of chemical IDs and coefficients, and the rate of each reaction. Aleae and MARlea files can then be emitted from it
+as many times as needed without tokenizing or parsing anything. Compiled files are memory-mapped, so loading one takes a
+few milliseconds however large the network is. Loading checks the header and the bounds of every section, and emitting
+checks the offsets and IDs inside them first, so a truncated or corrupt file is reported instead of emitted.
+
+Networks are stored the way they look in Aleae, with the waste and aether chemicals given when compiling standing in for
+MARlea's NULL. Those chemicals are flagged, so emitting a MARlea file gives the same file as a-to-m, and emitting Aleae
+files from a network compiled from a MARlea file gives the same files as m-to-a. Counts and coefficients are stored as
+numbers, so leading zeros are not kept. A chemical initialized more than once keeps every one of its lines, as it does
+in a-to-m.
+
+Layout of a compiled file, in little-endian byte order:
+    header: magic, version, numbers of species, declarations (.in lines), reactions, and terms, ID of the waste
+    chemical (-1 for none), and the offset and length of each section
+    sections, each starting at a multiple of 8 bytes, in the order of SECTIONS
+
+This is the template for compiling a network and emitting files from it:
+'python converter.py compile -i <.in and .r files | .csv file> -o <network.crnb> [--waste] [--aether]'
+'python converter.py emit -i <network.crnb> -o <.csv file | .in and .r files>'
+"""
+import csv
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+import converter
+
+MAGIC = b"CRNB"
+VERSION = 2
+COMPILED_SUFFIX = ".crnb"
+THRESHOLD_SYMBOLS = ("N", "LT", "LE", "GE", "GT")
+DECLARED = 1                                # Flag of a chemical that has a line in the .in file
+AETHER = 2                                  # Flag of an aether chemical
+SECTIONS = (("name_offsets", "Q"),          # Byte offsets of each name in text, one more than there are species
+            ("flags", "B"),
+            ("declared_chems", "I"),        # Chemical of each .in line, in the order of the lines
+            ("counts", "q"),                # Initial count of each .in line
+            ("threshold_symbols", "B"),     # Indices into THRESHOLD_SYMBOLS
+            ("threshold_values", "q"),      # -1 where the threshold has no value
+            ("side_offsets", "Q"),          # Offsets of each reaction's reactants and products into the terms
+            ("rate_offsets", "Q"),          # Byte offsets of each rate in text, one more than there are reactions
+            ("term_chems", "I"),
+            ("term_coeffs", "I"),
+            ("text", "B"))                  # Names and rates in UTF-8
+HEADER = struct.Struct("<4sIqqqqq" + "QQ" * len(SECTIONS))
+MAX_COEFF = (1 << 32) - 1
+MAX_COUNT = (1 << 63) - 1
+
+
+def to_number(text, limit):
+    """Return a count or a coefficient as a number, or None if it is not a decimal number of at most limit."""
+    text = text.strip()
+    if not text.isdecimal() or int(text) > limit:
+        return None
+    return int(text)
+
+
+class NetworkBuilder:
+    """A network being compiled. Chemicals are numbered in the order they are first declared or used."""
+    def __init__(self, waste='', aether=()):
+        self.waste = waste
+        self.aether_names = frozenset(aether)
+        self.ids = {}
+        self.names = []
+        self.waste_id = -1
+        self.flags = bytearray()
+        self.declared_chems = array("I")
+        self.counts = array("q")
+        self.threshold_symbols = bytearray()
+        self.threshold_values = array("q")
+        self.side_offsets = array("Q", [0])
+        self.term_chems = array("I")
+        self.term_coeffs = array("I")
+        self.rates = []
+
+    def intern(self, name):
+        """Return the ID of a chemical, adding it without an initial count if it has not been seen yet."""
+        chem_id = self.ids.get(name)
+        if chem_id is None:
+            chem_id = self.ids[name] = len(self.names)
+            self.names.append(name)
+            self.flags.append(AETHER if name in self.aether_names else 0)
+            if name == self.waste:
+                self.waste_id = chem_id
+        return chem_id
+
+    def declare(self, fields):
+        """
+        Declare a chemical from the fields of a checked Aleae .in line. A chemical can be declared more than once, and
+        every line is kept.
+        :return: False if the line cannot be stored
+        """
+        count = to_number(fields[1], MAX_COUNT)
+        value = to_number(fields[3], MAX_COUNT) if len(fields) > 3 else -1
+        if count is None or value is None:
+            print("Amount or threshold value too large:", fields)
+            return False
+        chem_id = self.intern(fields[0])
+        self.flags[chem_id] |= DECLARED
+        self.declared_chems.append(chem_id)
+        self.counts.append(count)
+        self.threshold_symbols.append(THRESHOLD_SYMBOLS.index(fields[2].strip()))
+        self.threshold_values.append(value)
+        return True
+
+    def add_reaction(self, sides, rate):
+        """
+        Add a reaction
+        :param sides: reactants and products, each a list of (chemical name, coefficient text) pairs
+        :param rate: text of the rate as it is written in Aleae
+        :return: False if a coefficient cannot be stored
+        """
+        for terms in sides:
+            for chem, coeff in terms:
+                number = to_number(coeff, MAX_COEFF)
+                if number is None:
+                    print("Coefficient too large:", coeff)
+                    return False
+                self.term_chems.append(self.intern(chem))
+                self.term_coeffs.append(number)
+            self.side_offsets.append(len(self.term_chems))
+        self.rates.append(rate)
+        return True
+
+    def write(self, filename):
+        """Write the network to a compiled file, replacing it only once it has been written completely."""
+        text = bytearray()
+        name_offsets, rate_offsets = array("Q", [0]), array("Q")
+        for name in self.names:
+            text += name.encode()
+            name_offsets.append(len(text))
+        rate_offsets.append(len(text))
+        for rate in self.rates:
+            text += rate.encode()
+            rate_offsets.append(len(text))
+
+        sections = {"name_offsets": name_offsets, "flags": self.flags, "declared_chems": self.declared_chems,
+                    "counts": self.counts,
+                    "threshold_symbols": self.threshold_symbols, "threshold_values": self.threshold_values,
+                    "side_offsets": self.side_offsets, "rate_offsets": rate_offsets, "term_chems": self.term_chems,
+                    "term_coeffs": self.term_coeffs, "text": text}
+        blobs, places = [], []
+        offset = HEADER.size
+        for name, typecode in SECTIONS:
+            data = array(typecode, sections[name])
+            if sys.byteorder == "big":
+                data.byteswap()
+            offset += -offset % 8
+            blobs.append((offset, data.tobytes()))
+            places += [offset, len(data)]
+            offset += len(blobs[-1][1])
+
+        temp_filename = filename + "." + str(os.getpid()) + ".tmp"
+        with open(temp_filename, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, len(self.names), len(self.declared_chems), len(self.rates),
+                                len(self.term_chems), self.waste_id, *places))
+            for offset, blob in blobs:
+                f.write(bytes(offset - f.tell()))
+                f.write(blob)
+        os.replace(temp_filename, filename)
+
+
+def compile_aleae(aleae_in_filename, aleae_r_filename, waste='', aether=()):
+    """
+    Compile a pair of Aleae files, checking them like a-to-m does
+    :return: NetworkBuilder holding the network, or None if the files are invalid
+    """
+    builder = NetworkBuilder(waste, aether)
+    species = converter.SpeciesTable(waste, aether)                        # Only used by the full parser
+    for filename, is_in_file in ((aleae_in_filename, True), (aleae_r_filename, False)):
+        f = converter.open_file_read(filename)
+        if f is None:
+            return None
+        with f:
+            for line in f:
+                if is_in_file:
+                    fields = line.split(" ")
+                    if not converter.check_aleae_in_line(fields) or not builder.declare(fields):
+                        return None
+                    species.declare(fields[0])
+                elif not add_aleae_line(builder, species, line):
+                    return None
+    return builder
+
+
+def add_aleae_line(builder, species, line):
+    """Add a reaction from an Aleae .r file to a NetworkBuilder, returning False if the line is invalid."""
+    if converter.ALEAE_FAST_PATTERN.fullmatch(line) is not None:
+        reactants, products, rate = line.split(converter.ALEAE_FIELD_SEPARATOR)
+        sides = []
+        for side in (reactants, products):
+            symbols = side.split()
+            sides.append(list(zip(symbols[::2], symbols[1::2])))
+        if all(species.is_declared(chem) for terms in sides for chem, _ in terms):
+            return builder.add_reaction(sides, rate.strip())
+
+    a_parser = converter.AleaeParser(line, species)                         # Reports what is wrong with the line
+    reaction = a_parser.parse_line() if a_parser.tokenize() else None
+    if reaction is None:
+        return False
+    return builder.add_reaction([[(species.names[chem_id], coeff) for chem_id, coeff in zip(chems, coeffs)]
+                                 for chems, coeffs in zip(reaction.chems, reaction.coeffs)], reaction.rate)
+
+
+def compile_marlea(marlea_filename, waste='', aether=()):
+    """
+    Compile a MARlea file by converting it the way m-to-a does and storing the Aleae lines it converts to
+    :return: NetworkBuilder holding the network, or None if the file is invalid
+    """
+    builder = NetworkBuilder(waste, aether)
+    session = converter.ConversionSession(waste, aether)
+    for init_lines in session.declare_marlea_chems(session.read_marlea_init(marlea_filename)):
+        if not all(builder.declare(line.split(" ")) for line in init_lines):
+            return None
+    for in_lines, lines in session.marlea_to_aleae_converter(session.read_marlea_reactions(marlea_filename)):
+        if not all(builder.declare(line.split(" ")) for line in in_lines): # Chemicals found in the reactions
+            return None
+        for line in lines:
+            reactants, products, rate = line.split(converter.ALEAE_FIELD_SEPARATOR, 2)
+            sides = []
+            for side in (reactants, products):
+                symbols = side.split()
+                sides.append(list(zip(symbols[::2], symbols[1::2])))
+            if not builder.add_reaction(sides, rate[1:-1]):                # Drop the space and the newline
+                return None
+    return builder if session.finish() else None
+
+
+class CompiledNetwork:
+    """
+    A compiled network, memory-mapped from its file. Its sections are memoryviews of the file named after SECTIONS,
+    so nothing is read until it is used. Close it, or use it in a with statement, once done with it.
+    """
+    def __init__(self, filename):
+        with open(filename, "rb") as f:
+            self.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.views = []
+        try:
+            self.load()
+        except BaseException:
+            self.close()
+            raise
+
+    def section_lengths(self):
+        """Return the number of items each section must hold, by name, or None where it depends on the file."""
+        species, declarations, reactions, terms = self.species, self.declarations, self.reactions, self.terms
+        return {"name_offsets": species + 1, "flags": species, "declared_chems": declarations,
+                "counts": declarations, "threshold_symbols": declarations, "threshold_values": declarations,
+                "side_offsets": 2 * reactions + 1, "rate_offsets": reactions + 1, "term_chems": terms,
+                "term_coeffs": terms, "text": None}
+
+    def load(self):
+        """Check the header and the bounds of every section, and map each section into a memoryview."""
+        size = len(self.mmap)
+        if size < HEADER.size or self.mmap[:len(MAGIC)] != MAGIC:
+            raise ValueError("not a compiled network")
+        magic, version, self.species, self.declarations, self.reactions, self.terms, self.waste_id, *places = \
+            HEADER.unpack_from(self.mmap)
+        if version != VERSION:
+            raise ValueError("not a compiled network of version " + str(VERSION))
+        if min(self.species, self.declarations, self.reactions, self.terms) < 0 \
+                or not -1 <= self.waste_id < self.species:
+            raise ValueError("invalid compiled network: bad counts in the header")
+
+        view = memoryview(self.mmap)
+        self.views.append(view)
+        lengths = self.section_lengths()
+        for (name, typecode), offset, length in zip(SECTIONS, places[::2], places[1::2]):
+            end = offset + length * struct.calcsize(typecode)
+            if offset < HEADER.size or offset % 8 != 0 or end > size:
+                raise ValueError("invalid compiled network: section " + name + " is out of bounds")
+            if lengths[name] is not None and length != lengths[name]:
+                raise ValueError("invalid compiled network: section " + name + " has the wrong length")
+            section = view[offset:end].cast(typecode)
+            self.views.append(section)
+            if sys.byteorder == "big" and typecode != "B":
+                section = array(typecode, section)
+                section.byteswap()
+            setattr(self, name, section)
+
+    def check(self):
+        """
+        Check that the offsets and chemical IDs inside the sections stay within the network. This reads every section,
+        so it is done before emitting rather than when loading.
+        :raise ValueError: if the compiled network is corrupt
+        """
+        for name, offsets, first, last in (("name_offsets", self.name_offsets, 0, self.rate_offsets[0]),
+                                           ("rate_offsets", self.rate_offsets, self.name_offsets[-1], len(self.text)),
+                                           ("side_offsets", self.side_offsets, 0, self.terms)):
+            if offsets[0] != first or offsets[-1] != last or any(a > b for a, b in zip(offsets, offsets[1:])):
+                raise ValueError("invalid compiled network: section " + name + " holds offsets out of order")
+        for name, chems in (("declared_chems", self.declared_chems), ("term_chems", self.term_chems)):
+            if len(chems) > 0 and max(chems) >= self.species:
+                raise ValueError("invalid compiled network: section " + name + " holds unknown chemicals")
+        if len(self.threshold_symbols) > 0 and max(self.threshold_symbols) >= len(THRESHOLD_SYMBOLS):
+            raise ValueError("invalid compiled network: section threshold_symbols holds unknown thresholds")
+        try:
+            str(self.text, "utf-8")
+        except UnicodeDecodeError:
+            raise ValueError("invalid compiled network: section text is not UTF-8") from None
+
+    def close(self):
+        for view in reversed(self.views):                                   # The map cannot close while viewed
+            view.release()
+        self.views.clear()
+        self.mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def names(self):
+        """Return the names of the chemicals by ID."""
+        offsets, text = self.name_offsets, self.text
+        return [str(text[offsets[i]:offsets[i + 1]], "utf-8") for i in range(self.species)]
+
+    def rates(self):
+        """Return the rates of the reactions as they are written in Aleae."""
+        offsets, text = self.rate_offsets, self.text
+        return [str(text[offsets[i]:offsets[i + 1]], "utf-8") for i in range(self.reactions)]
+
+    def in_lines(self, names):
+        """Yield the .in lines of the network, in the order they were compiled."""
+        counts, symbols, values = self.counts, self.threshold_symbols, self.threshold_values
+        for i, chem_id in enumerate(self.declared_chems):
+            value = values[i]
+            yield (names[chem_id] + " " + str(counts[i]) + " " + THRESHOLD_SYMBOLS[symbols[i]]
+                   + ("" if value == -1 else " " + str(value)) + "\n")
+
+    def emit_aleae(self, aleae_in_filename, aleae_r_filename):
+        """
+        Write the network to a pair of Aleae files
+        :return: True if both files were written
+        """
+        names = self.names()
+        f_in = converter.open_file_write(aleae_in_filename)
+        f_r = converter.open_file_write(aleae_r_filename) if f_in is not None else None
+        if f_r is None:
+            if f_in is not None:
+                converter.discard_file_write(f_in)
+            return False
+
+        try:
+            f_in.writelines(self.in_lines(names))
+            chems, coeffs = self.term_chems.tolist(), self.term_coeffs.tolist()
+            term_prefixes = [name + " " for name in names]
+            for reaction, rate in enumerate(self.rates()):
+                f_r.write(self.r_line(term_prefixes, chems, coeffs, reaction, rate))
+        except BaseException:
+            converter.discard_file_write(f_in)
+            converter.discard_file_write(f_r)
+            raise
+        converter.close_file_write(f_in, aleae_in_filename)
+        converter.close_file_write(f_r, aleae_r_filename)
+        return True
+
+    def r_line(self, term_prefixes, chems, coeffs, reaction, rate):
+        """Return the .r line of a reaction, given the name of each chemical followed by a space."""
+        side_offsets = self.side_offsets
+        start, middle, end = side_offsets[2 * reaction], side_offsets[2 * reaction + 1], side_offsets[2 * reaction + 2]
+        return ("".join(term_prefixes[chems[k]] + str(coeffs[k]) + " " for k in range(start, middle)) + ": "
+                + "".join(term_prefixes[chems[k]] + str(coeffs[k]) + " " for k in range(middle, end))
+                + ": " + rate + "\n")
+
+    def marlea_side(self, names, chems, coeffs, start, end, is_reactants):
+        """Return one side of a reaction in MARlea, turning the waste and aether chemicals into NULL like a-to-m."""
+        flags, waste_id = self.flags, self.waste_id
+        terms = []
+        for k in range(start, end):
+            chem_id = chems[k]
+            if flags[chem_id] & AETHER and is_reactants or chem_id == waste_id:
+                return converter.MARLEA_NULL                               # The whole side becomes a NULL
+            elif not flags[chem_id] & AETHER:
+                terms.append(names[chem_id] if coeffs[k] == 1 else str(coeffs[k]) + " " + names[chem_id])
+        return " + ".join(terms) if len(terms) > 0 else converter.MARLEA_NULL
+
+    def emit_marlea(self, marlea_filename):
+        """
+        Write the network to a MARlea file. A reaction that would be NULL => NULL once the waste and aether
+        chemicals are removed halts the emission like it halts a-to-m, since MARlea does not accept it.
+        :return: True if the file was written
+        """
+        names = self.names()
+        f = converter.open_file_write(marlea_filename)
+        if f is None:
+            return False
+
+        try:
+            writer = csv.writer(f, "excel")
+            flags, counts = self.flags, self.counts
+            writer.writerows([names[chem_id], str(counts[i])] for i, chem_id in enumerate(self.declared_chems)
+                             if counts[i] != 0 and not flags[chem_id] & AETHER)
+            writer.writerow([])                                             # Blank row before the reactions
+
+            chems, coeffs = self.term_chems.tolist(), self.term_coeffs.tolist()
+            halted = []
+
+            def rows():
+                side_offsets, marlea_side = self.side_offsets, self.marlea_side
+                for reaction, rate in enumerate(self.rates()):
+                    reactants = marlea_side(names, chems, coeffs, side_offsets[2 * reaction],
+                                            side_offsets[2 * reaction + 1], True)
+                    products = marlea_side(names, chems, coeffs, side_offsets[2 * reaction + 1],
+                                           side_offsets[2 * reaction + 2], False)
+                    if reactants == converter.MARLEA_NULL and products == converter.MARLEA_NULL:
+                        converter.report_null_reaction(self.r_line([name + " " for name in names], chems, coeffs,
+                                                                   reaction, rate))
+                        halted.append(reaction)
+                        return
+                    yield [reactants + " => " + products, " " + rate.strip()]
+
+            writer.writerows(rows())
+        except BaseException:
+            converter.discard_file_write(f)
+            raise
+        if len(halted) > 0:
+            converter.discard_file_write(f)
+            print("Emission has been halted. Existing output MARlea files were left untouched.")
+            return False
+        converter.close_file_write(f, marlea_filename)
+        return True
+
+
+def compile_network(input_filenames, compiled_filename, waste='', aether=()):
+    """
+    Compile a network and write it to a compiled file
+    :param input_filenames: the .in and .r files of an Aleae network, or the .csv file of a MARlea network
+    :return: True on success
+    """
+    if len(input_filenames) == 2:
+        builder = compile_aleae(input_filenames[0], input_filenames[1], waste, aether)
+    else:
+        builder = compile_marlea(input_filenames[0], waste, aether)
+    if builder is None:
+        print("Compilation has been halted. No compiled network was written.")
+        return False
+
+    try:
+        builder.write(compiled_filename)
+    except OSError as e:
+        print("Error: Could not write", compiled_filename + ":", e.strerror)
+        return False
+    print("Compiled", len(builder.names), "chemicals and", len(builder.rates), "reactions into", compiled_filename)
+    return True
+
+
+def emit_network(compiled_filename, output_filenames):
+    """
+    Write the Aleae or MARlea files of a compiled network
+    :param output_filenames: the .in and .r files of an Aleae network, or the .csv file of a MARlea network
+    :return: True on success
+    """
+    try:
+        network = CompiledNetwork(compiled_filename)
+    except (OSError, ValueError) as e:
+        print("Error: Could not load", compiled_filename + ":", e)
+        return False
+
+    with network:
+        try:
+            network.check()
+        except ValueError as e:
+            print("Error: Could not load", compiled_filename + ":", e)
+            return False
+        if len(output_filenames) == 2:
+            return network.emit_aleae(output_filenames[0], output_filenames[1])
+        return network.emit_marlea(output_filenames[0])
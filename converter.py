@@ -1,38 +1,55 @@
 """
 Name: AwesomeNova
-Updated at: 4/12/2025
+Updated at: 10/17/2026
 
 Script for converting Aleae files into MARlea ones and vice versa via sequential or pipelined execution. Please read the
 README to learn how to use it. The script checks for whether an input file given to it is valid, specified by the
 documentation for Aleae and MARlea, if and only if the user enables it. Any converted file will be valid if a given
 input file or set of files is valid.
 
+The tokenizers, parsers, and conversion stages can be imported by other scripts without any gui being built. The gui
+lives in gui.py and is only loaded when summoned with the 'gui' command.
+
 There are no major bugs found in the code at the moment. However, if you encountered a bug or issue while using this script,
 please send an issue on the GitHub repo or push a fix of the code on a separate branch and make a pull request.
 """
 import argparse
+import contextlib
+import functools
+import io
 import os.path
 import os
 import sys
 import csv
 import queue
-import tkinter
 import re
+import shutil
+import tempfile
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
 from enum import IntEnum, StrEnum
-from threading import Thread
-from tkinter import Tk, ttk, StringVar, BooleanVar, filedialog, messagebox
+from threading import Thread, get_ident
+
+from cache import ConversionCache
+from incremental import a_to_m_index, m_to_a_index, index_filename
+from instrumentation import MAIN_PROFILE, ConversionStats, ConversionProfiler, profile_worker_process
 
 ALEAE_FIELD_SEPARATOR = ':'
 MARLEA_TERM_SEPARATOR = '+'
 MARLEA_ARROW = "=>"
 MARLEA_NULL = 'NULL'
+ALEAE_THRESHOLD_SYMBOLS = frozenset({"LE", "LT", "GE", "GT", "N"})
 
-input_file_reader_to_converter_queue = queue.Queue()                  # Setup queues for inter-thread communication
-input_file_reader_to_output_writer_queue = queue.Queue()
-input_file_reader_to_converter_auxilliary_queue = queue.Queue()
-converter_to_output_file_writer_queue_0 = queue.Queue()
-converter_to_output_file_writer_queue_1 = queue.Queue()
 END_PROCEDURE = "fin"
+DEFAULT_CHUNK_SIZE = 1024                   # Lines or rows handed from one stage to the next at a time
+READ_BLOCK_SIZE = 1 << 20                   # Characters read from an input file at a time
+DEFAULT_FLUSH_SIZE = 1 << 20                # Bytes of output buffered before they are written to a file
+DEFAULT_QUEUE_CAPACITY = 16                 # Chunks a queue between pipelined stages holds before its writer waits
+DEFAULT_MEMO_SIZE = 1 << 16                 # Converted reactions a session remembers for repeated lines
+MEMO_WINDOW = 4096                          # Reactions over which the hit rate of a memo is measured
+MEMO_MIN_HITS = MEMO_WINDOW // 20           # Hits per window below which a memo is bypassed for a while
+MEMO_BYPASS_WINDOWS = 16                    # Windows a memo is bypassed for before it is tried again
 
 
 class ReactionParts(IntEnum):
@@ -42,207 +59,6 @@ class ReactionParts(IntEnum):
     NUM_FIELDS = 3
 
 
-gui_root = Tk()                                                        # Set up the gui
-gui_root.title("Aleae-MARlea File Converter")
-gui_root.minsize(500, 300)
-button_frame = ttk.Frame(gui_root, padding="8 8 12 12")
-file_frame = ttk.Frame(gui_root, padding="8 8 12 12")
-waste_aether_frame = ttk.Frame(gui_root, padding="8 8 12 12")
-conversion_button_frame = ttk.Frame(gui_root, padding="8 8 12 12")
-button_frame.grid(column=0, row=0, sticky=(tkinter.N, tkinter.W, tkinter.E, tkinter.S))
-file_frame.grid(column=1, row=0)
-waste_aether_frame.grid(column=0, row=1)
-conversion_button_frame.grid(column= 1, row=1)
-gui_root.columnconfigure(0, weight=1)
-gui_root.columnconfigure(1, weight=1)
-gui_root.columnconfigure(2, weight=1)
-gui_root.rowconfigure(list(range(10)), weight=1)
-
-radio_button_label = ttk.Label(button_frame, text="Conversion mode select:")
-radio_button_label.grid(column=0, row=0, sticky=tkinter.W)
-flag_label = ttk.Label(button_frame, text="Select enable flags:")
-flag_label.grid(column=0, row=4, sticky=tkinter.W)
-
-input_label = ttk.Label(file_frame, text="Input Files")
-output_label = ttk.Label(file_frame, text="Output Files")
-selected_input_in_file_label = ttk.Label(file_frame, text="Selected File:")
-selected_input_r_file_label = ttk.Label(file_frame, text="Selected File:")
-selected_input_marlea_file_label = ttk.Label(file_frame, text="Selected File:")
-selected_output_in_file_label = ttk.Label(file_frame, text="Selected File:")
-selected_output_r_file_label = ttk.Label(file_frame, text="Selected File:")
-selected_output_marlea_file_label = ttk.Label(file_frame, text="Selected File:")
-
-waste_aether_label = ttk.Label(waste_aether_frame, text="Enter waste and aether chemicals \n(Separate aether chemicals by whitespace)")
-waste_label = ttk.Label(waste_aether_frame, text="Waste:")
-aether_label = ttk.Label(waste_aether_frame, text="Aether:")
-
-gui_input_mode = StringVar()
-
-gui_a_to_m_aleae_file_in = ""                                           # Initialize gui file variables
-gui_a_to_m_aleae_file_r = ""
-gui_a_to_m_marlea_file = ""
-
-gui_m_to_a_marlea_file = ""
-gui_m_to_a_aleae_file_in = ""
-gui_m_to_a_aleae_file_r = ""
-
-gui_pipeline_enable=BooleanVar()
-
-gui_waste=StringVar()
-gui_aether=StringVar()
-
-
-def open_file_dialog_in():
-    """Prompt the user with an open file dialog and set the .in file variable to user input."""
-    global gui_a_to_m_aleae_file_in
-    gui_a_to_m_aleae_file_in = filedialog.askopenfilename(title="Select a File", filetypes=[("Aleae initialization files", "*.in")])
-    if gui_a_to_m_aleae_file_in:
-        selected_input_in_file_label.config(text=f"Selected File: {gui_a_to_m_aleae_file_in}")
-
-def open_file_dialog_r():
-    """Prompt the user with an open file dialog and set the .r file variable to user input."""
-    global gui_a_to_m_aleae_file_r
-    gui_a_to_m_aleae_file_r = filedialog.askopenfilename(title="Select a File", filetypes=[("Aleae reaction files", "*.r")])
-    if gui_a_to_m_aleae_file_r:
-        selected_input_r_file_label.config(text=f"Selected File: {gui_a_to_m_aleae_file_r}")
-
-def open_file_dialog_csv():
-    """Prompt the user with a open file dialog and set the .csv file variable to user input."""
-    global gui_m_to_a_marlea_file
-    gui_m_to_a_marlea_file = filedialog.askopenfilename(title="Select a File", filetypes=[("MARlea files", "*.csv")])
-    if gui_m_to_a_marlea_file:
-        selected_input_marlea_file_label.config(text=f"Selected File: {gui_m_to_a_marlea_file}")
-
-
-def save_file_dialog_in():
-    """Prompt the user with a save file dialog and set the .in file variable for output."""
-    global gui_m_to_a_aleae_file_in
-    gui_m_to_a_aleae_file_in = filedialog.asksaveasfilename(title="Select a File", filetypes=[("Aleae initialization files", "*.in")])
-    if gui_m_to_a_aleae_file_in:
-        selected_output_in_file_label.config(text=f"Selected File: {gui_m_to_a_aleae_file_in}")
-
-def save_file_dialog_r():
-    """Prompt the user with an save file dialog and set the .r file variable for output."""
-    global gui_m_to_a_aleae_file_r
-    gui_m_to_a_aleae_file_r = filedialog.asksaveasfilename(title="Select a File", filetypes=[("Aleae reaction files", "*.r")])
-    if gui_m_to_a_aleae_file_r:
-        selected_output_r_file_label.config(text=f"Selected File: {gui_m_to_a_aleae_file_r}")
-
-def save_file_dialog_csv():
-    """Prompt the user with a save file dialog and set the .csv file variable for output."""
-    global gui_a_to_m_marlea_file
-    gui_a_to_m_marlea_file = filedialog.asksaveasfilename(title="Select a File", filetypes=[("MARlea files", "*.csv")])
-    if gui_a_to_m_marlea_file:
-        selected_output_marlea_file_label.config(text=f"Selected File: {gui_a_to_m_marlea_file}")
-
-
-a_to_m_in_buttons = ttk.Button(file_frame, text="Open File", command=open_file_dialog_in)
-a_to_m_r_buttons = ttk.Button(file_frame, text="Open File", command=open_file_dialog_r)
-a_to_m_out_btn = ttk.Button(file_frame, text="Create File", command=save_file_dialog_csv)
-
-m_to_a_buttons = ttk.Button(file_frame, text="Open File", command=open_file_dialog_csv)
-m_to_a_in_out_btn = ttk.Button(file_frame, text="Create File", command=save_file_dialog_in)
-m_to_a_r_out_btn = ttk.Button(file_frame, text="Create File", command=save_file_dialog_r)
-
-
-def aleae_to_marlea_btns():
-    """Setup and change buttons when a-to-m mode is set."""
-    selected_input_marlea_file_label.grid_remove()
-    selected_output_in_file_label.grid_remove()
-    selected_output_r_file_label.grid_remove()
-    m_to_a_buttons.grid_remove()
-    m_to_a_r_out_btn.grid_remove()
-    m_to_a_in_out_btn.grid_remove()
-
-    input_label.grid(column=1, row=0, sticky=tkinter.S)
-    selected_input_in_file_label.grid(column=1, row=1, sticky=tkinter.W)
-    selected_input_r_file_label.grid(column=1, row=2, sticky=tkinter.W)
-    output_label.grid(column=1, row=3, sticky=tkinter.S)
-
-    selected_output_marlea_file_label.grid(column=1, row=4, sticky=tkinter.W)
-    a_to_m_in_buttons.grid(column=0, row=1, sticky=tkinter.E)
-    a_to_m_r_buttons.grid(column=0, row=2, sticky=tkinter.E)
-    a_to_m_out_btn.grid(column=0, row=4, sticky=tkinter.N)
-
-
-def marlea_to_aleae_btns():
-    """Setup and change buttons when m-to-a mode is set."""
-    a_to_m_in_buttons.grid_remove()
-    a_to_m_r_buttons.grid_remove()
-    a_to_m_out_btn.grid_remove()
-    selected_input_in_file_label.grid_remove()
-    selected_input_r_file_label.grid_remove()
-    selected_output_marlea_file_label.grid_remove()
-
-    input_label.grid(column=1, row=0, sticky=tkinter.S)
-    selected_input_marlea_file_label.grid(column=1, row=1, sticky=tkinter.W)
-    output_label.grid(column=1, row=2, sticky=tkinter.S)
-
-    selected_output_in_file_label.grid(column=1, row=3, sticky=tkinter.W)
-    selected_output_r_file_label.grid(column=1, row=4, sticky=tkinter.W)
-    m_to_a_buttons.grid(column=0, row=1, sticky=tkinter.E)
-    m_to_a_in_out_btn.grid(column=0, row=3, sticky=tkinter.N)
-    m_to_a_r_out_btn.grid(column=0, row=4, sticky=tkinter.N)
-
-
-# Set up the buttons and checkboxes for the gui
-a_to_m_check = ttk.Radiobutton(button_frame, text='Aleae to MARlea', variable=gui_input_mode, value='a-to-m', command=aleae_to_marlea_btns)
-m_to_a_check = ttk.Radiobutton(button_frame, text='MARlea to Aleae', variable=gui_input_mode, value='m-to-a', command=marlea_to_aleae_btns)
-a_to_m_check.grid(column=0, row=1, sticky=tkinter.SW)
-m_to_a_check.grid(column=0, row=2, sticky=tkinter.SW)
-
-pipeline_widget = ttk.Checkbutton(button_frame, text="Enable pipelined execution", variable=gui_pipeline_enable, onvalue=True, offvalue=False)
-pipeline_widget.grid(column=0, row=6, sticky=tkinter.SW)
-
-waste_aether_label.grid(column=2, row=0)
-waste_entry = ttk.Entry(waste_aether_frame, textvariable=gui_waste)
-waste_entry.grid(column=2, row=1, sticky=tkinter.NW)
-waste_label.grid(column=1, row=1, sticky=tkinter.E)
-aether_entry = ttk.Entry(waste_aether_frame, textvariable=gui_aether)
-aether_label.grid(column=1, row=2, sticky=tkinter.E)
-aether_entry.grid(column=2, row=2, sticky=tkinter.NW)
-
-
-def gui_start_conversion():
-    """The entry point for gui execution. """
-    if gui_input_mode.get() == "":
-        return
-
-    if "," in gui_aether.get() or "//" in gui_aether.get():
-        messagebox.showerror(title="Invalid aether terms", message="Please enter aether terms as instructed.")
-        return
-    elif len(gui_waste.get().split()) > 1 or "," in gui_waste.get() or "//" in gui_waste.get():
-        messagebox.showerror(title="Invalid waste term", message="Please enter only one waste term. No commas or '//' strings.")
-        return
-
-    if gui_input_mode.get() == "a-to-m":
-        global gui_a_to_m_aleae_file_in
-        global gui_a_to_m_aleae_file_r
-
-
-        if gui_a_to_m_aleae_file_in == "" or gui_a_to_m_aleae_file_r == "" or gui_a_to_m_marlea_file == "":
-            messagebox.showerror(title="Missing files", message="All files need to be entered.")
-            return
-        else:
-            start_a_to_m_conversion(gui_a_to_m_aleae_file_in, gui_a_to_m_aleae_file_r, gui_a_to_m_marlea_file,
-                                    gui_waste.get(), gui_aether.get(), gui_pipeline_enable.get())
-    elif gui_input_mode.get() == "m-to-a":
-        global gui_m_to_a_marlea_file
-
-        if gui_m_to_a_marlea_file == "" or gui_m_to_a_aleae_file_in == "" or gui_m_to_a_aleae_file_r == "":
-            messagebox.showerror(title="Missing files", message="All files need to be entered.")
-            return
-        else:
-            start_m_to_a_conversion(gui_m_to_a_aleae_file_in, gui_m_to_a_aleae_file_r, gui_m_to_a_marlea_file,
-                                    gui_waste.get(), gui_aether.get(), gui_pipeline_enable.get())
-
-    messagebox.showinfo(title="Conversion Complete", message="Input files have been converted.")
-
-
-confirm_btn = ttk.Button(gui_root, text="Start Conversion", command=gui_start_conversion)
-confirm_btn.grid(column=1, row=1)
-
-
 def open_file_read(filename):
     """The function attempts to open an input file for reading."""
     if os.path.isfile(filename):
@@ -253,30 +69,45 @@ def open_file_read(filename):
     return None
 
 
-def open_file_write(filename):
-    """The function attempts to open an Aleae or MARlea input file for writing."""
-    if os.path.isfile(filename):
+def open_file_write(filename, flush_size=DEFAULT_FLUSH_SIZE):
+    """
+    The function attempts to open an Aleae or MARlea output file for writing. The output is written to a temporary file
+    next to it, which close_file_write() renames over the output file, so a half-written output file is never seen.
+    Conversions that fail call discard_file_write() instead, so the previous output file is kept.
+    :param flush_size: bytes of output buffered before they are written, or 1 to write every line as it comes
+    """
+    if not os.path.isdir(filename):
+        temp_filename = filename + "." + str(os.getpid()) + "." + str(get_ident()) + ".tmp"
         try:
-            return open(filename, "w", newline='')
+            f = open(temp_filename, "w", buffering=flush_size, newline='')
+            if os.path.isfile(filename):
+                shutil.copymode(filename, temp_filename)                   # Keep the permissions of the old output
+            return f
         except OSError:
             print("Input file " + filename + " failed to be opened.")
     else:
-        try:
-            return open(filename, "x", newline='')
-        except OSError:
-            print("Input file " + filename + " failed to be opened.")
+        print("Input file " + filename + " failed to be opened.")
     return None
 
 
+def close_file_write(f, filename):
+    """Close an output file opened by open_file_write() and move it into place."""
+    f.close()
+    os.replace(f.name, filename)
+
+
+def discard_file_write(f):
+    """Close an output file opened by open_file_write() and remove it without touching the output file."""
+    f.close()
+    os.remove(f.name)
+
+
 def remove_empty_str_elems(lst):
     return [i for i in lst if i != ""]
 
 
 class NodeEnum(StrEnum):
-    EQUATION = "EQUATION"
-    FIELD = "FIELD"
     RATE = "RATE"
-    TERM = "TERM"
     COEFF = "COEFF"
     CHEM = "CHEM"
     FIELD_SEP = "FIELD_SEP"
@@ -285,17 +116,113 @@ class NodeEnum(StrEnum):
     MARLEA_ARROW = "MARLEA_ARROW"
 
 
-class AleaeMARLeaNode:
-    def __init__(self, type, value, children):
-        self.type = type
-        self.value = value
-        self.children = children
+# Each tokenizer scans a line in a single pass with one precompiled pattern. Every match is a whitespace separated
+# symbol, and any symbol that fits no named group falls through to MISMATCH. Aleae symbols may glue a coefficient, a
+# field separator, and a chemical together (e.g. "1:" or ":A"), and a coefficient found after the second field
+# separator is the rate of the reaction.
+ALEAE_TOKEN_PATTERN = re.compile(rf"""
+    \s*(?:
+        (?P<ARROW>{re.escape(MARLEA_ARROW)})(?!\S)
+      | (?P<NULL>{MARLEA_NULL})(?!\S)
+      | (?=\S)
+        (?P<COEFF>\d+(?=[{ALEAE_FIELD_SEPARATOR}\s]|$))?
+        (?P<FIELD_SEP>{ALEAE_FIELD_SEPARATOR})?
+        (?P<CHEM>(?<![^\s{ALEAE_FIELD_SEPARATOR}])[^+{ALEAE_FIELD_SEPARATOR}\s]+)?
+        (?!\S)
+      | (?P<MISMATCH>\S+)
+    )""", re.VERBOSE)
+
+MARLEA_TOKEN_PATTERN = re.compile(rf"""
+    \s*(?:
+        (?P<ARROW>{re.escape(MARLEA_ARROW)})
+      | (?P<NULL>{MARLEA_NULL})
+      | (?P<TERM_SEP>{re.escape(MARLEA_TERM_SEPARATOR)})
+      | (?P<COEFF>\d+)
+      | (?P<CHEM>[^+:\s]+)
+      | (?P<MISMATCH>\S+)
+    )(?!\S)""", re.VERBOSE)
+
+# Well-formed reactions whose symbols are all separated by whitespace are translated straight from line to line. A
+# chemical is any symbol the tokenizers read as a chemical, i.e. neither an arrow, a NULL, nor a number. Lines that do
+# not match are handed to the full parsers, which report what is wrong with them.
+FAST_CHEM = rf"(?!(?:{re.escape(MARLEA_ARROW)}|{MARLEA_NULL}|\d+)(?!\S))[^+{ALEAE_FIELD_SEPARATOR}\s]+"
+ALEAE_FAST_PATTERN = re.compile(rf"""
+    \s*(?:{FAST_CHEM}\s+\d+\s+)*{ALEAE_FIELD_SEPARATOR}
+    \s+(?:{FAST_CHEM}\s+\d+\s+)*{ALEAE_FIELD_SEPARATOR}
+    \s+\d+\s*""", re.VERBOSE)
+FAST_MARLEA_SIDE = rf"""(?:{MARLEA_NULL}|(?:(?!1\s)\d+\s+)?{FAST_CHEM}
+                          (?:\s+{re.escape(MARLEA_TERM_SEPARATOR)}\s+(?:(?!1\s)\d+\s+)?{FAST_CHEM})*)"""
+MARLEA_FAST_PATTERN = re.compile(rf"\s*{FAST_MARLEA_SIDE}\s+{re.escape(MARLEA_ARROW)}\s+{FAST_MARLEA_SIDE}\s*",
+                                 re.VERBOSE)
+
+MARLEA_TOKEN_TYPES = {"ARROW": NodeEnum.MARLEA_ARROW, "NULL": NodeEnum.MARLEA_NULL, "TERM_SEP": NodeEnum.TERM_SEP,
+                      "COEFF": NodeEnum.COEFF, "CHEM": NodeEnum.CHEM}
+
+
+class SpeciesTable:
+    """
+    Interns every chemical of a conversion once and assigns it a dense integer ID. Flags for each chemical are kept in
+    bytearrays indexed by ID, so checking whether a chemical was declared or is an aether chemical is an array lookup.
+    The waste chemical and the aether chemicals are interned first.
+
+    When undeclared_uses is a set rather than None, chemicals used before they are declared are interned and collected
+    in it instead of being rejected, so reactions can be converted before the whole .in file has been read.
+    """
+    __slots__ = ("ids", "names", "declared", "aether", "waste_id", "aether_ids", "undeclared_uses")
+
+    def __init__(self, waste='', aether=()):
+        self.ids = dict()
+        self.names = []
+        self.declared = bytearray()                 # Chemicals initialized in a .in file, a MARlea file, or the output
+        self.aether = bytearray()
+        self.waste_id = self.intern(waste) if waste != '' else -1
+        self.aether_ids = [self.intern(chem) for chem in aether]
+        for chem_id in self.aether_ids:
+            self.aether[chem_id] = 1
+        self.undeclared_uses = None
+
+    def __len__(self):
+        return len(self.names)
+
+    def intern(self, name):
+        """Return the ID of a chemical, assigning the next free ID if it has not been seen yet."""
+        chem_id = self.ids.get(name)
+        if chem_id is None:
+            chem_id = len(self.names)
+            self.ids[name] = chem_id
+            self.names.append(sys.intern(name))
+            self.declared.append(0)
+            self.aether.append(0)
+        return chem_id
+
+    def declare(self, name):
+        """Intern a chemical and mark it as initialized."""
+        chem_id = self.intern(name)
+        self.declared[chem_id] = 1
+        return chem_id
+
+    def is_declared(self, name):
+        chem_id = self.ids.get(name)
+        return chem_id is not None and self.declared[chem_id] == 1
+
+
+class Reaction:
+    """
+    A parsed reaction. Each side is a pair of parallel lists, one for the IDs of its chemicals in a SpeciesTable and
+    one for their coefficients, indexed by ReactionParts.REACTANTS and ReactionParts.PRODUCTS. A side without any terms
+    is MARlea's NULL.
+    """
+    __slots__ = ("chems", "coeffs", "rate")
+
+    def __init__(self, rate=None):
+        self.chems = ([], [])
+        self.coeffs = ([], [])
+        self.rate = rate
 
 
 class Tokenizer:
     def __init__(self, line):
         self.line = line
-        self.equ = self.line.strip().split()
         self.tokens = []
         self.cursor = 0
 
@@ -359,18 +286,13 @@ class Parser:
         return self.equation()
 
     @staticmethod
-    def construct_line(root):
+    def construct_line(reaction):
         pass
 
-    def __create_term(self, child0, child1=None):
-        if child1 is None:
-            return AleaeMARLeaNode(NodeEnum.TERM, None, [child0])
-        return AleaeMARLeaNode(NodeEnum.TERM, None, [child0, child1])
-
     def equation(self):
         pass
 
-    def field(self, sub_root):
+    def field(self, reaction, side):
         pass
 
 
@@ -380,88 +302,62 @@ class AleaeTokenizer(Tokenizer):
 
     def tokenize(self):
         num_field_sep = 0
-        for token in self.equ:
-            if re.fullmatch(r'\d+', token.strip()) is not None and num_field_sep < 2:
-                self.tokens.append((NodeEnum.COEFF, token.strip()))
-            elif re.fullmatch(r'\d+', token.strip()) is not None:
-                self.tokens.append((NodeEnum.RATE, token.strip()))
-            elif (re.fullmatch(rf'{MARLEA_ARROW}', token.strip()) is not None
-                  or re.fullmatch(rf'{MARLEA_NULL}', token.strip()) is not None):
-                self.investigate("Invalid use of MARLEA symbols:", token.strip())
+        for match in ALEAE_TOKEN_PATTERN.finditer(self.line):
+            if match.lastgroup == "MISMATCH":
+                self.investigate("Unrecognized symbol:", "'"+match.group("MISMATCH")+"'")
                 return False
-            elif re.fullmatch(rf'{ALEAE_FIELD_SEPARATOR}', token.strip()) is not None:
-                self.tokens.append((NodeEnum.FIELD_SEP, token.strip()))
-                num_field_sep += 1
-            elif re.fullmatch(r'[^+: ]+', token.strip()) is not None:
-                self.tokens.append((NodeEnum.CHEM, token.strip()))
-            elif re.fullmatch(rf'\d+{ALEAE_FIELD_SEPARATOR}', token.strip()) is not None:
-                self.tokens.append((NodeEnum.COEFF, token.strip().strip(ALEAE_FIELD_SEPARATOR)))
-                self.tokens.append((NodeEnum.FIELD_SEP, token.strip(r'\d+')))
-                num_field_sep += 1
-            elif re.fullmatch(rf'{ALEAE_FIELD_SEPARATOR}[^+: ]+', token.strip()) is not None:
-                self.tokens.append((NodeEnum.FIELD_SEP, token.strip(r'[^+ ]+')))
-                self.tokens.append((NodeEnum.CHEM, token.strip().strip(ALEAE_FIELD_SEPARATOR)))
-                num_field_sep += 1
-            elif re.fullmatch(rf'\d+{ALEAE_FIELD_SEPARATOR}[^+: ]+', token.strip()) is not None:
-                self.tokens.append((NodeEnum.COEFF, re.sub(rf'(\d+){ALEAE_FIELD_SEPARATOR}([^+: ]+)', r'\1', token.strip())))
-                self.tokens.append((NodeEnum.FIELD_SEP, re.sub(rf'\d+{ALEAE_FIELD_SEPARATOR}[^+: ]+', ALEAE_FIELD_SEPARATOR, token.strip())))
-                self.tokens.append((NodeEnum.CHEM, re.sub(rf'(\d+){ALEAE_FIELD_SEPARATOR}[^+: ]+)', r'\2', token.strip())))
-                num_field_sep += 1
-            else:
-                self.investigate("Unrecognized symbol:", "'"+token.strip()+"'")
+            elif match.lastgroup == "ARROW" or match.lastgroup == "NULL":
+                self.investigate("Invalid use of MARLEA symbols:", match.group(match.lastgroup))
                 return False
+
+            coeff, field_sep, chem = match.group("COEFF", "FIELD_SEP", "CHEM")
+            if coeff is not None:
+                self.tokens.append((NodeEnum.COEFF if num_field_sep < 2 else NodeEnum.RATE, coeff))
+            if field_sep is not None:
+                self.tokens.append((NodeEnum.FIELD_SEP, field_sep))
+                num_field_sep += 1
+            if chem is not None:
+                self.tokens.append((NodeEnum.CHEM, chem))
         return True
 
 
 class AleaeParser(Parser):
-    def __init__(self, line, all_chems):
+    def __init__(self, line, species):
         super().__init__(line, AleaeTokenizer(line))
-        self.all_chems = all_chems
+        self.species = species
 
     def parse_line(self):
         return self.equation()
 
     @staticmethod
-    def construct_line(root):
+    def construct_line(reaction, species):
+        names = species.names
         new_equ = ''
-        for child in root.children:
-            if child.type == NodeEnum.RATE:
-                new_equ += child.value
-            elif child.type == NodeEnum.FIELD:
-                temp = child.children
-                while temp is not None:
-                    new_equ += temp.value[0][1] + " " + temp.value[1][1] + " "
-                    temp = temp.children
-                new_equ += ": "
-
-        return new_equ
+        for side in (ReactionParts.REACTANTS, ReactionParts.PRODUCTS):
+            for chem_id, coeff in zip(reaction.chems[side], reaction.coeffs[side]):
+                new_equ += names[chem_id] + " " + coeff + " "
+            new_equ += ": "
+        return new_equ + reaction.rate
 
     @staticmethod
-    def convert_tree_to_marlea(old_root, waste='', aether=[]):
-        new_root = AleaeMARLeaNode(NodeEnum.EQUATION, None, [])
-
-        for i in range(ReactionParts.NUM_FIELDS.value - 1):
-            field = old_root.children[i]
-            new_root.children.append(AleaeMARLeaNode(NodeEnum.FIELD, None, None))
-            new_root.children[i].children = AleaeMARLeaNode(NodeEnum.TERM, None, None)
-            temp_term = field.children
-            new_node = new_root.children[i].children
-            while temp_term is not None:
-                if temp_term.value[0][1] in set(aether) and i == 0 or temp_term.value[0][1] == waste:
-                    new_root.children[i].children = AleaeMARLeaNode(NodeEnum.MARLEA_NULL, MARLEA_NULL, None)
-                elif temp_term.value[0][1] not in set(aether):
-                    if temp_term.value[1][1] == '1': new_node.value = None, temp_term.value[0]
-                    else: new_node.value = temp_term.value[1], temp_term.value[0]
-
-                    if temp_term.children is not None:
-                        new_node.children = AleaeMARLeaNode(NodeEnum.TERM, None, None)
-                        new_node = new_node.children
-                temp_term = temp_term.children
-        return new_root
+    def convert_tree_to_marlea(old_reaction, species):
+        new_reaction = Reaction(old_reaction.rate)
+        aether, waste_id = species.aether, species.waste_id
+
+        for side in (ReactionParts.REACTANTS, ReactionParts.PRODUCTS):
+            new_chems, new_coeffs = new_reaction.chems[side], new_reaction.coeffs[side]
+            for chem_id, coeff in zip(old_reaction.chems[side], old_reaction.coeffs[side]):
+                if aether[chem_id] and side == ReactionParts.REACTANTS or chem_id == waste_id:
+                    new_chems.clear()                                       # The whole side becomes a NULL
+                    new_coeffs.clear()
+                    break
+                elif not aether[chem_id]:
+                    new_chems.append(chem_id)
+                    new_coeffs.append(coeff)
+        return new_reaction
 
 
     def equation(self):
-        root = AleaeMARLeaNode(NodeEnum.EQUATION, self.line, [])
         sep_pos = []
 
         while self.tokenizer.peek_next_token() is not None:
@@ -471,7 +367,10 @@ class AleaeParser(Parser):
             else:
                 self.tokenizer.move_cursor_by_offset(1)
 
-        if len(sep_pos) != 2:
+        if len(sep_pos) == 0:
+            self.investigate("Blank line or missing field separators:", self.line.strip())
+            return None
+        elif len(sep_pos) != 2:
             self.investigate("Invalid use of field separators:", self.tokenizer.peek_token_at(sep_pos[len(sep_pos)-1])[1])
             return None
 
@@ -482,41 +381,37 @@ class AleaeParser(Parser):
             self.investigate("Invalid rate field:", self.tokenizer.peek_token_at(sep_pos[1]+1)[1])
             return None
 
-        root.children.append(AleaeMARLeaNode(NodeEnum.FIELD, None, None))
-        root.children.append(AleaeMARLeaNode(NodeEnum.FIELD, None, None))
-        root.children.append(AleaeMARLeaNode(NodeEnum.RATE, self.tokenizer.peek_token_at(sep_pos[1]+1)[1], None))
+        reaction = Reaction(self.tokenizer.peek_token_at(sep_pos[1]+1)[1])
         self.tokenizer.set_cursor_pos(0)
 
-        if not self.field(root.children[0]): return None
+        if not self.field(reaction, ReactionParts.REACTANTS): return None
         self.tokenizer.set_cursor_pos(sep_pos[0] + 1)
-        if not self.field(root.children[1]): return None
+        if not self.field(reaction, ReactionParts.PRODUCTS): return None
 
-        return root
+        return reaction
 
 
-    def field(self, sub_root):
-        first_term = AleaeMARLeaNode(NodeEnum.TERM, None, None)
-
-        cur_term = first_term
+    def field(self, reaction, side):
+        chems, coeffs = reaction.chems[side], reaction.coeffs[side]
         token0, token1 = self.expect(NodeEnum.CHEM), self.expect(NodeEnum.COEFF)
         while token0 is not None and token1 is not None:
-            if token0[1] not in self.all_chems:
-                self.investigate("Chem missing in .in file:", self.tokenizer.check_token_at_cursor(-2)[1])
-                return False
+            chem_id = self.species.ids.get(token0[1])
+            if chem_id is None or not self.species.declared[chem_id]:
+                if self.species.undeclared_uses is None:
+                    self.investigate("Chem missing in .in file:", self.tokenizer.check_token_at_cursor(-2)[1])
+                    return False
+                chem_id = self.species.intern(token0[1])                # Checked once the .in file has been read
+                self.species.undeclared_uses.add(chem_id)
 
-            cur_term.value = token0, token1
+            chems.append(chem_id)
+            coeffs.append(token1[1])
             token0, token1 = self.expect(NodeEnum.CHEM), self.expect(NodeEnum.COEFF)
-            if token0 is not None and token1 is not None:
-                cur_term.children = AleaeMARLeaNode(NodeEnum.TERM, None, None)
-                cur_term = cur_term.children
 
         test_token = self.tokenizer.peek_next_token()
         if test_token is None or test_token[0] != NodeEnum.FIELD_SEP:
             self.investigate("Invalid term:", self.tokenizer.check_token_at_cursor(-1)[1],
                              self.tokenizer.check_token_at_cursor(0)[1])
             return False
-
-        sub_root.children = first_term
         return True
 
 
@@ -525,96 +420,66 @@ class MARleaTokenizer(Tokenizer):
         super().__init__(line)
 
     def tokenize(self):
-        num_marlea_nulls = 0
-
-        for i, token in enumerate(self.equ):
-            if re.fullmatch(f'{MARLEA_ARROW}', token.strip()) is not None:
-                self.tokens.append((NodeEnum.MARLEA_ARROW, token.strip()))
-            elif re.fullmatch(f'{MARLEA_NULL}', token.strip()) is not None:
-                self.tokens.append((NodeEnum.MARLEA_NULL, token.strip()))
-                num_marlea_nulls += 1
-            elif re.fullmatch(f'[{MARLEA_TERM_SEPARATOR}]', token.strip()) is not None:
-                self.tokens.append((NodeEnum.TERM_SEP, token.strip()))
-            elif re.fullmatch(r'\d+', token.strip()) is not None:
-                self.tokens.append((NodeEnum.COEFF, token.strip()))
-            elif re.fullmatch(r'[^+: ]+', token.strip()) is not None:
-                self.tokens.append((NodeEnum.CHEM, token.strip()))
-            else:
-                self.investigate("Unrecognized symbol:", "'"+token.strip()+"'")
+        for match in MARLEA_TOKEN_PATTERN.finditer(self.line):
+            kind = match.lastgroup
+            if kind == "MISMATCH":
+                self.investigate("Unrecognized symbol:", "'"+match.group(kind)+"'")
                 return False
+            self.tokens.append((MARLEA_TOKEN_TYPES[kind], match.group(kind)))
         return True
 
 
 class MARleaParser(Parser):
-    def __init__(self, line):
+    def __init__(self, line, species):
         super().__init__(line, MARleaTokenizer(line))
-        self.found_chems = set()
+        self.species = species
 
     def parse_line(self):
         return self.equation()
 
     @staticmethod
-    def construct_line(root):
-        new_equ = ''
-
-        for i, field in enumerate(root.children):
-            temp = field.children
-            while temp is not None:
-                if temp.type == NodeEnum.MARLEA_NULL:
-                    new_equ += temp.value
-                elif temp.value[0] is not None:
-                    new_equ += temp.value[0][1] + " " + temp.value[1][1]
-                else:
-                    new_equ += temp.value[1][1]
-
-                temp = temp.children
-                if temp is not None: new_equ += " + "
-
-            if i < 1: new_equ += " => "
-
-        return new_equ
+    def construct_line(reaction, species):
+        """Return the MARlea equation of a reaction, or None if both of its sides are NULL, which MARlea rejects."""
+        names = species.names
+        fields = []
+        for side in (ReactionParts.REACTANTS, ReactionParts.PRODUCTS):
+            if len(reaction.chems[side]) == 0:
+                fields.append(MARLEA_NULL)
+            else:
+                fields.append(" + ".join(names[chem_id] if coeff == "1" else coeff + " " + names[chem_id]
+                                         for chem_id, coeff in zip(reaction.chems[side], reaction.coeffs[side])))
+        if fields[0] == MARLEA_NULL and fields[1] == MARLEA_NULL:
+            return None
+        return fields[0] + " => " + fields[1]
 
     @staticmethod
-    def convert_tree_to_aleae(old_root, rate, waste='', aether=[]):
-        new_root = AleaeMARLeaNode(NodeEnum.EQUATION, None, [])
+    def convert_tree_to_aleae(old_reaction, rate, species):
+        new_reaction = Reaction(rate)
+        aether_ids, waste_id = species.aether_ids, species.waste_id
 
         aether_found = False
-        for i in range(ReactionParts.NUM_FIELDS.value - 1):
-            field = old_root.children[i]
-            new_root.children.append(AleaeMARLeaNode(NodeEnum.FIELD, None, None))
-            new_root.children[i].children = AleaeMARLeaNode(NodeEnum.TERM, None, None)
-            temp_term = field.children
-            new_node = new_root.children[i].children
-            while temp_term is not None:
-                if temp_term.type == NodeEnum.MARLEA_NULL:
-                    if i == ReactionParts.REACTANTS.value and len(aether) > 0:
-                        new_node.value = (NodeEnum.CHEM, aether[0]), (NodeEnum.COEFF, '1')
-                        aether_found = True
-                    elif i == ReactionParts.PRODUCTS.value and waste != '':
-                        new_node.value = (NodeEnum.CHEM, waste), (NodeEnum.COEFF, '1')
-                else:
-                    if aether_found:
-                        new_node.value = (NodeEnum.CHEM, aether[0]), (NodeEnum.COEFF, '1')
-                        aether_found = False
-                        new_node.children = AleaeMARLeaNode(NodeEnum.TERM, None, None)
-                        new_node = new_node.children
-
-                    if temp_term.value[0] is None:
-                        new_node.value = temp_term.value[1], (NodeEnum.COEFF, "1")
-                    else:
-                        new_node.value = temp_term.value[1], temp_term.value[0]
-
-                if temp_term.children is not None:
-                    new_node.children = AleaeMARLeaNode(NodeEnum.TERM, None, None)
-                    new_node = new_node.children
-                temp_term = temp_term.children
-
-        new_root.children.append(AleaeMARLeaNode(NodeEnum.RATE, rate, None))
-        return new_root
+        for side in (ReactionParts.REACTANTS, ReactionParts.PRODUCTS):
+            new_chems, new_coeffs = new_reaction.chems[side], new_reaction.coeffs[side]
+            if len(old_reaction.chems[side]) == 0:                          # Substitute the NULL
+                if side == ReactionParts.REACTANTS and len(aether_ids) > 0:
+                    new_chems.append(aether_ids[0])
+                    new_coeffs.append('1')
+                    aether_found = True
+                elif side == ReactionParts.PRODUCTS and waste_id != -1:
+                    new_chems.append(waste_id)
+                    new_coeffs.append('1')
+                continue
+
+            if aether_found:                                                # The aether catalyzes the reaction
+                new_chems.append(aether_ids[0])
+                new_coeffs.append('1')
+                aether_found = False
+            new_chems.extend(old_reaction.chems[side])
+            new_coeffs.extend(old_reaction.coeffs[side])
+        return new_reaction
 
 
     def equation(self):
-        root = AleaeMARLeaNode(NodeEnum.EQUATION, self.line, [])
         sep_pos = 0
         num_marlea_arrows = 0
 
@@ -626,31 +491,31 @@ class MARleaParser(Parser):
             else:
                 self.tokenizer.move_cursor_by_offset(1)
 
-        if num_marlea_arrows != 1:
+        if num_marlea_arrows == 0:
+            self.investigate("Missing MARlea arrow:", self.line.strip())
+            return None
+        elif num_marlea_arrows != 1:
             self.investigate("Invalid or missing use of MARlea arrow:", self.tokenizer.peek_token_at(sep_pos)[1])
             return None
 
-        root.children.append(AleaeMARLeaNode(NodeEnum.FIELD, None, None))
-        root.children.append(AleaeMARLeaNode(NodeEnum.FIELD, None, None))
+        reaction = Reaction()
         self.tokenizer.set_cursor_pos(0)
 
-        if not self.field(root.children[0]): return None
+        if not self.field(reaction, ReactionParts.REACTANTS): return None
         self.tokenizer.set_cursor_pos(sep_pos + 1)
-        if not self.field(root.children[1]): return None
+        if not self.field(reaction, ReactionParts.PRODUCTS): return None
 
-        return root
+        return reaction
 
 
-    def field(self, sub_root):
+    def field(self, reaction, side):
         token = self.tokenizer.peek_next_token()
         if token is None or token[0] == NodeEnum.MARLEA_ARROW:
             self.investigate("Empty field")
             return False
 
         null_token = self.expect(NodeEnum.MARLEA_NULL)
-        if null_token is not None:
-            sub_root.children = AleaeMARLeaNode(NodeEnum.MARLEA_NULL, MARLEA_NULL, None)
-
+        if null_token is not None:                                          # A NULL side is left without terms
             token0, token1 = self.expect(NodeEnum.MARLEA_ARROW), self.expect(NodeEnum.MARLEA_NULL)
             if token0 is None and self.tokenizer.get_cursor_pos() < len(self.tokenizer.tokens) or token1 is not None:
                 self.investigate("Invalid use of MARlea NULL:", self.tokenizer.check_token_at_cursor(-1)[1])
@@ -662,9 +527,7 @@ class MARleaParser(Parser):
             self.investigate("Invalid use of term seperator:", self.tokenizer.check_token_at_cursor(-1)[1])
             return False
 
-        first_term = AleaeMARLeaNode(NodeEnum.TERM, None, None)
-
-        cur_term = first_term
+        chems, coeffs = reaction.chems[side], reaction.coeffs[side]
         token0 = self.expect(NodeEnum.CHEM)
         token1, token2 = None, None
         if token0 is None:
@@ -673,16 +536,15 @@ class MARleaParser(Parser):
 
         while token0 is not None or token1 is not None or token2 is not None:
             if token0 is not None:
-                cur_term.value = None, token0
-                self.found_chems.add(token0[1])
+                chems.append(self.species.intern(token0[1]))
+                coeffs.append("1")
             elif token1 is not None and token2 is not None:
                 if token1[1] == "1":
                     self.investigate("Invalid term:", self.tokenizer.check_token_at_cursor(-3)[1],
                                      self.tokenizer.check_token_at_cursor(-2)[1])
                     return False
-                else:
-                    cur_term.value = token1, token2
-                self.found_chems.add(token2[1])
+                chems.append(self.species.intern(token2[1]))
+                coeffs.append(token1[1])
             elif token1 is None or token2 is None:
                 self.investigate("Invalid term:", self.tokenizer.check_token_at_cursor(-2)[1],
                                  self.tokenizer.check_token_at_cursor(-1)[1])
@@ -697,9 +559,6 @@ class MARleaParser(Parser):
                 if test_token is None or test_token[0] == NodeEnum.TERM_SEP:
                     self.investigate("Invalid use of term separator:", self.tokenizer.check_token_at_cursor(-1)[1])
                     return False
-                elif test_token is not None:
-                    cur_term.children = AleaeMARLeaNode(NodeEnum.TERM, None, None)
-                    cur_term = cur_term.children
             else:
                 if (test_token is not None and test_token[0] != NodeEnum.MARLEA_ARROW
                         and self.tokenizer.get_cursor_pos() < len(self.tokenizer.tokens)):
@@ -712,8 +571,6 @@ class MARleaParser(Parser):
             if token0 is None:
                 token1, token2 = self.expect(NodeEnum.COEFF), self.expect(NodeEnum.CHEM)
             token_aux = self.expect(NodeEnum.TERM_SEP)
-
-        sub_root.children = first_term
         return True
 
 
@@ -723,7 +580,7 @@ def check_aleae_in_line(in_line):
     :param in_line: a list containing the elements of an Aleae initialization statement
     :return: True if line is valid or False if it detects an error
     """
-    threshold_sym = {"LE", "LT", "GE", "GT", "N"}
+    threshold_sym = ALEAE_THRESHOLD_SYMBOLS
     if len(in_line) >= 4:
         print(".in line not three or four elements: ", in_line)
         return False
@@ -765,280 +622,1180 @@ def check_marlea_init(row_in):
     return False
 
 
-def read_aleae_in_file(aleae_in_filename, aether):
+def is_marlea_content_row(row):
+    """Return True if a row of a MARlea file is neither blank nor a comment."""
+    return len(row) > 0 and "//" not in row[1] and "//" not in row[0]
+
+
+def is_marlea_reaction_line(line):
+    """Return True if a line of a MARlea file is certain to hold a reaction in its first column, without parsing it."""
+    comma = line.find(",")
+    return comma >= 0 and '"' not in line and MARLEA_ARROW in line[:comma]
+
+
+def translate_aleae_line(line, species):
     """
-    Read each line from an Aleae input file, pre-process it if needed, and send it to a writer via a queue
-    :param aleae_in_filename: name of Aleae .in file
-    :param aether: list of chemicals that will be converted to a NULL in the reactants
+    Translate a well-formed reaction from an Aleae .r file straight into a MARlea row, without tokenizing or parsing it
+    :param line: line of the .r file
+    :param species: SpeciesTable holding every chemical declared in the .in file
+    :return: the MARlea row of the reaction, or None if the line has to go through the full parser
     """
-    f_init = open_file_read(aleae_in_filename)
-    if f_init is None:
-        input_file_reader_to_converter_queue.put(END_PROCEDURE)
-        input_file_reader_to_output_writer_queue.put(END_PROCEDURE)
-        return
-
-    temp = f_init.readline()
-    while temp != "":                                                           # Convert .in file to beginning of MARlea file
-        temp_row = temp.split(" ")
-        if check_aleae_in_line(temp_row):
-            input_file_reader_to_converter_auxilliary_queue.put(temp_row[0])
+    if ALEAE_FAST_PATTERN.fullmatch(line) is None:
+        return None
 
-            if temp_row[1] != "0" and temp_row[0] not in set(aether):
-                input_file_reader_to_output_writer_queue.put(temp_row[:2])
-            temp = f_init.readline()
-        else:
-            print("Conversion has been halted. Any output MARlea file is considered unsuitable to run.")
-            input_file_reader_to_converter_auxilliary_queue.put(END_PROCEDURE)
-            input_file_reader_to_output_writer_queue.put(END_PROCEDURE)
+    ids, declared, aether, waste_id = species.ids, species.declared, species.aether, species.waste_id
+    reactants, products, rate = line.split(ALEAE_FIELD_SEPARATOR)
+    fields = []
+    for side, is_reactants in ((reactants, True), (products, False)):
+        symbols = side.split()
+        terms = []
+        null_side = False
+        for i in range(0, len(symbols), 2):
+            chem, coeff = symbols[i], symbols[i + 1]
+            chem_id = ids.get(chem)
+            if chem_id is None or not declared[chem_id]:                    # Left to the parser to report or defer
+                return None
+            elif null_side:
+                continue
+            elif aether[chem_id] and is_reactants or chem_id == waste_id:
+                terms.clear()                                               # The whole side becomes a NULL
+                null_side = True
+            elif not aether[chem_id]:
+                terms.append(chem if coeff == "1" else coeff + " " + chem)
+        fields.append(" + ".join(terms) if len(terms) > 0 else MARLEA_NULL)
+    if fields[0] == MARLEA_NULL and fields[1] == MARLEA_NULL:                # Left to the parser to report
+        return None
+    return [fields[0] + " => " + fields[1], " " + rate.strip()]
 
-    f_init.close()
 
-    input_file_reader_to_output_writer_queue.put([])
-    input_file_reader_to_converter_auxilliary_queue.put(END_PROCEDURE)
-    input_file_reader_to_output_writer_queue.put(END_PROCEDURE)
+def report_null_reaction(line):
+    """Report a reaction that would be NULL => NULL in MARlea once the waste and aether chemicals are removed."""
+    print("Reaction is NULL => NULL in MARlea, which MARlea does not accept:", line.strip())
 
 
-def read_aleae_r_file(aleae_r_filename):
+def convert_aleae_reaction(line, species):
     """
-    Read each line from an Aleae .r input file and send it to a converter via a queue
-    :param aleae_r_filename: name of Aleae .r file
+    Tokenize, parse, and convert one reaction from an Aleae .r file
+    :param line: line of the .r file
+    :param species: SpeciesTable holding every chemical declared in the .in file
+    :return: the MARlea row of the reaction or None if the line is invalid
     """
-    f_react = open_file_read(aleae_r_filename)
-    if f_react is None:
-        input_file_reader_to_converter_queue.put(END_PROCEDURE)
-        input_file_reader_to_output_writer_queue.put(END_PROCEDURE)
-        return
+    row = translate_aleae_line(line, species)
+    if row is not None:
+        return row
 
-    temp = f_react.readline()
-    while temp != "":                                                           # Convert .r file to reaction in a MARlea file
-        input_file_reader_to_converter_queue.put(temp)
-        temp = f_react.readline()
+    a_parser = AleaeParser(line, species)
+    if not a_parser.tokenize():                                                 # Tokenize the reaction
+        return None
 
-    input_file_reader_to_converter_queue.put(END_PROCEDURE)
-    f_react.close()
+    aleae_reaction = a_parser.parse_line()                                      # Parse reaction
+    if aleae_reaction is None:
+        return None
 
+    marlea_reaction = AleaeParser.convert_tree_to_marlea(aleae_reaction, species)      # Convert reaction
+    equation = MARleaParser.construct_line(marlea_reaction, species)
+    if equation is None:
+        report_null_reaction(line)
+        return None
+    return [equation, " "+marlea_reaction.rate]
+
+
+def convert_aleae_reaction_timed(line, species, stats):
+    """convert_aleae_reaction() that records how long each of its phases takes in a ConversionStats."""
+    clock = time.perf_counter
+    start = clock()
+    row = translate_aleae_line(line, species)
+    end = clock()
+    stats.phase("fast path", end - start)
+    if row is not None:
+        return row
+
+    a_parser = AleaeParser(line, species)
+    tokenized = a_parser.tokenize()
+    start, end = end, clock()
+    stats.phase("tokenize", end - start)
+    if not tokenized:
+        return None
 
-def aleae_to_marlea_converter(waste, aether):
+    aleae_reaction = a_parser.parse_line()
+    start, end = end, clock()
+    stats.phase("parse", end - start)
+    if aleae_reaction is None:
+        return None
+
+    marlea_reaction = AleaeParser.convert_tree_to_marlea(aleae_reaction, species)
+    start, end = end, clock()
+    stats.phase("convert_tree_to_marlea", end - start)
+    equation = MARleaParser.construct_line(marlea_reaction, species)
+    stats.phase("construct_line", clock() - end)
+    if equation is None:
+        report_null_reaction(line)
+        return None
+    return [equation, " "+marlea_reaction.rate]
+
+
+def translate_marlea_row(row, species):
     """
-    Converts each line from Aleae file into a line from a MARlea file.
-    :param waste: a specified chemical that will be converted to a NULL in the products
-    :param aether: list of chemicals that will be converted to a NULL in the reactants
+    Translate a well-formed reaction row from a MARlea file straight into an Aleae line, without tokenizing or parsing
+    it
+    :param row: the reaction and rate columns of the row
+    :param species: SpeciesTable that chemicals found in the reaction are interned into
+    :return: tuple of the Aleae line and the MARlea reaction, or None if the row has to go through the full parser
     """
+    if MARLEA_FAST_PATTERN.fullmatch(row[0]) is None:
+        return None
 
-    all_chems = set()
-    temp = input_file_reader_to_converter_auxilliary_queue.get()
-    while temp != END_PROCEDURE:                                            # Get all chems to feed to the parser
-        all_chems.add(temp)
-        temp = input_file_reader_to_converter_auxilliary_queue.get()
+    symbols = row[0].split()
+    arrow = symbols.index(MARLEA_ARROW)
+    if symbols[0] == MARLEA_NULL and symbols[arrow + 1] == MARLEA_NULL:     # Rejected by the parser
+        return None
+    marlea_reaction = Reaction()
+    intern, names = species.intern, species.names
+    aether_ids, waste_id = species.aether_ids, species.waste_id
+    new_equ = ''
+    aether_found = False
+    for side, side_symbols in ((ReactionParts.REACTANTS, symbols[:arrow]), (ReactionParts.PRODUCTS, symbols[arrow+1:])):
+        chems = marlea_reaction.chems[side]
+        if side_symbols[0] == MARLEA_NULL:                                  # Substitute the NULL
+            if side == ReactionParts.REACTANTS and len(aether_ids) > 0:
+                new_equ += names[aether_ids[0]] + " 1 "
+                aether_found = True
+            elif side == ReactionParts.PRODUCTS and waste_id != -1:
+                new_equ += names[waste_id] + " 1 "
+            new_equ += ": "
+            continue
+
+        if aether_found:                                                    # The aether catalyzes the reaction
+            new_equ += names[aether_ids[0]] + " 1 "
+        coeff = "1"
+        for symbol in side_symbols:
+            if symbol == MARLEA_TERM_SEPARATOR:
+                continue
+            elif symbol.isdecimal():
+                coeff = symbol
+            else:
+                chems.append(intern(symbol))
+                new_equ += symbol + " " + coeff + " "
+                coeff = "1"
+        new_equ += ": "
+    return new_equ + row[1], marlea_reaction
 
-    temp = input_file_reader_to_converter_queue.get()
-    while temp != END_PROCEDURE:
-        a_parser = AleaeParser(temp, all_chems)
-        if not a_parser.tokenize():                                         # Tokenize the reaction
-            print("Conversion has been halted. Any output MARlea file is considered unsuitable to run.")
-            break
 
-        aleae_tree = a_parser.parse_line()                                  # Parse reaction
-        if aleae_tree is None:
-            print("Conversion has been halted. Any output MARlea file is considered unsuitable to run.")
-            break
+def convert_marlea_reaction(row, species):
+    """
+    Tokenize, parse, and convert one reaction row from a MARlea file
+    :param row: the reaction and rate columns of the row
+    :param species: SpeciesTable that chemicals found in the reaction are interned into
+    :return: tuple of the Aleae line and the parsed MARlea reaction, or None if the row is invalid
+    """
+    result = translate_marlea_row(row, species)
+    if result is not None:
+        return result
 
-        marlea_tree = AleaeParser.convert_tree_to_marlea(aleae_tree, waste, aether)     # Convert reaction
-        if marlea_tree is None:
-            print("Conversion has been halted. Any output MARlea file is considered unsuitable to run.")
-            break
+    m_parser = MARleaParser(row[0], species)                                    # Tokenize the reaction
+    if not m_parser.tokenize():
+        return None
 
-        temp_list = temp.strip().split(ALEAE_FIELD_SEPARATOR)
-        converted_reaction = MARleaParser.construct_line(marlea_tree)
-        converter_to_output_file_writer_queue_0.put([converted_reaction," "+temp_list[2].strip()])
+    marlea_reaction = m_parser.parse_line()                                     # Parse reaction
+    if marlea_reaction is None:
+        return None
 
-        temp = input_file_reader_to_converter_queue.get()
+    aleae_reaction = MARleaParser.convert_tree_to_aleae(marlea_reaction, row[1], species)   # Convert reaction
+    return AleaeParser.construct_line(aleae_reaction, species), marlea_reaction
+
+
+def convert_marlea_reaction_timed(row, species, stats):
+    """convert_marlea_reaction() that records how long each of its phases takes in a ConversionStats."""
+    clock = time.perf_counter
+    start = clock()
+    result = translate_marlea_row(row, species)
+    end = clock()
+    stats.phase("fast path", end - start)
+    if result is not None:
+        return result
+
+    m_parser = MARleaParser(row[0], species)
+    tokenized = m_parser.tokenize()
+    start, end = end, clock()
+    stats.phase("tokenize", end - start)
+    if not tokenized:
+        return None
+
+    marlea_reaction = m_parser.parse_line()
+    start, end = end, clock()
+    stats.phase("parse", end - start)
+    if marlea_reaction is None:
+        return None
 
-    converter_to_output_file_writer_queue_0.put(END_PROCEDURE)
+    aleae_reaction = MARleaParser.convert_tree_to_aleae(marlea_reaction, row[1], species)
+    start, end = end, clock()
+    stats.phase("convert_tree_to_aleae", end - start)
+    line = AleaeParser.construct_line(aleae_reaction, species)
+    stats.phase("construct_line", clock() - end)
+    return line, marlea_reaction
 
 
-def write_marlea_file(MARlea_output_filename):
+class ReactionMemo:
     """
-    Receive any line from the Aleae input file reader and converter and write to the MARlea file.
-    :param MARlea_output_filename: name of MARlea file
+    A bounded memo of converted reactions that evicts the least recently used one once it is full. Reactions are keyed
+    on their text with runs of whitespace collapsed, since the tokenizers only tell whitespace apart from other
+    characters. A memo belongs to a single session, so the waste and aether chemicals and the declared chemicals that
+    its reactions were converted with are the same for every key.
+
+    Looking up and remembering a reaction costs about half as much as converting a well-formed one, so a memo that
+    was hit by fewer than MEMO_MIN_HITS of the last MEMO_WINDOW reactions is bypassed for the next
+    MEMO_BYPASS_WINDOWS windows, after which it is tried again. Networks without repeated lines then barely pay for it.
     """
-    f_MARlea_output = open_file_write(MARlea_output_filename)
-    if f_MARlea_output is None:
-        return
+    def __init__(self, capacity=DEFAULT_MEMO_SIZE):
+        self.capacity = capacity
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.lookups = 0
+        self.window_hits = 0
+        self.window_left = MEMO_WINDOW                                      # Lookups left in the current window
+        self.bypass_left = 0                                                # Reactions left to convert without the memo
+
+    def convert(self, reaction, rate, convert_reaction, *args):
+        """
+        Return the converted reaction remembered for a reaction, or convert it and remember it if it was converted
+        :param reaction: text of the reaction
+        :param rate: text of a rate that is copied into the output as it is, or ''
+        :param convert_reaction: function that converts the reaction from args, returning None if it is invalid
+        """
+        if self.bypass_left > 0:
+            self.bypass_left -= 1
+            return convert_reaction(*args)
+
+        self.lookups += 1
+        self.window_left -= 1
+        if self.window_left == 0:                                           # Decide whether the memo pays off
+            if self.window_hits < MEMO_MIN_HITS:
+                self.bypass_left = MEMO_WINDOW * MEMO_BYPASS_WINDOWS
+            self.window_hits = 0
+            self.window_left = MEMO_WINDOW
+
+        key = " ".join(reaction.split()) + "\0" + rate
+        entries = self.entries
+        result = entries.get(key)
+        if result is not None:
+            self.hits += 1
+            self.window_hits += 1
+            entries.move_to_end(key)
+            return result
+
+        result = convert_reaction(*args)
+        if result is not None:                                              # Invalid reactions halt the conversion
+            entries[key] = result
+            if len(entries) > self.capacity:
+                entries.popitem(last=False)
+        return result
+
+    def report(self):
+        """Return a line describing how often the memo was hit."""
+        hit_rate = 100 * self.hits / self.lookups if self.lookups > 0 else 0.0
+        return ("Reaction memo: " + str(self.hits) + " of " + str(self.lookups) + " reactions looked up were reused ("
+                + format(hit_rate, ".1f") + "% hit rate), " + str(len(self.entries)) + " kept")
+
+
+def convert_marlea_row(row, species, convert_reaction=convert_marlea_reaction):
+    """
+    Convert one reaction row from a MARlea file
+    :param convert_reaction: convert_marlea_reaction or a function like it
+    :return: tuple of the Aleae line and the IDs of the chemicals of the reaction in order, or None if the row is
+    invalid
+    """
+    result = convert_reaction(row, species)
+    if result is None:
+        return None
+    converted_reaction, marlea_reaction = result
+    return converted_reaction, (*marlea_reaction.chems[ReactionParts.REACTANTS],
+                                *marlea_reaction.chems[ReactionParts.PRODUCTS])
+
 
-    writer = csv.writer(f_MARlea_output, "excel")
-    temp = input_file_reader_to_output_writer_queue.get()
-    while temp != END_PROCEDURE:
-        writer.writerow(temp)                                               # Write line from any reader
-        temp = input_file_reader_to_output_writer_queue.get()
+def convert_aleae_lines(lines, species, line_index=None, memo=None, convert_reaction=convert_aleae_reaction):
+    """
+    Convert a chunk of lines from an Aleae .r file, stopping at the first invalid line
+    :param line_index: LineIndex of an incremental conversion, whose rows are reused for lines that did not change
+    :param memo: ReactionMemo of the session, or None to convert every line
+    :param convert_reaction: convert_aleae_reaction or a function like it
+    :return: tuple of (MARlea rows of the lines before any invalid one, whether every line was converted)
+    """
+    rows = []
+    for line in lines:
+        row = None if line_index is None else line_index.lookup(line)
+        if row is None:
+            if memo is None:
+                row = convert_reaction(line, species)
+            else:
+                row = memo.convert(line, '', convert_reaction, line, species)
+        if row is None:
+            return rows, False
+        rows.append(row)
+    return rows, True
 
-    temp = converter_to_output_file_writer_queue_0.get()
-    while temp != END_PROCEDURE:
-        writer.writerow(temp)                                               # Write processed line from converter
-        temp = converter_to_output_file_writer_queue_0.get()
 
-    f_MARlea_output.close()
+worker_species = None                       # SpeciesTable of a worker process, set up by init_conversion_worker()
 
 
-def read_marlea_file(MARlea_input_filename):
+def init_conversion_worker(waste, aether, declared_names, optimistic=False, profile_dir=None):
     """
-    Read each row from a MARlea input file, pre-process said row, and send it to either a converter or writer.
-    :param MARlea_input_filename: name of MARlea file as input
+    Build the SpeciesTable a worker process converts its chunks of reactions with
+    :param profile_dir: directory to write a profile of the worker process into, or None
     """
-    f_MARlea_input = open_file_read(MARlea_input_filename)
-    if f_MARlea_input is None:
-        input_file_reader_to_converter_queue.put(END_PROCEDURE)
-        input_file_reader_to_output_writer_queue.put(END_PROCEDURE)
-        return
-    reader = csv.reader(f_MARlea_input, "excel")
-
-    for row in reader:
-        if len(row) > 0 and "//" not in row[1] and "//" not in row[0]:       # Filter out row without initialized chemicals or reactions
-            if MARLEA_ARROW in row[0]:
-                input_file_reader_to_converter_queue.put(row)                # Send any reactions to the converter
-            elif row[1] != "" and row[0] != "":
-                if check_marlea_init(row):
-                    input_file_reader_to_output_writer_queue.put(row[0].strip() + " " + row[1].strip() + ' N\n')
-                    input_file_reader_to_converter_auxilliary_queue.put(row)
-                else:
-                    print("Conversion has been halted. Any output Aleae file is considered unsuitable to run.")
-                    break
+    global worker_species
+    if profile_dir is not None:
+        profile_worker_process(profile_dir)
+    worker_species = SpeciesTable(waste, aether)
+    for name in declared_names:
+        worker_species.declare(name)
+    if optimistic:
+        worker_species.undeclared_uses = set()
 
-    input_file_reader_to_converter_auxilliary_queue.put(END_PROCEDURE)
-    input_file_reader_to_output_writer_queue.put(END_PROCEDURE)
-    input_file_reader_to_converter_queue.put(END_PROCEDURE)
 
-def marlea_to_aleae_converter(waste, aether):
+def convert_aleae_chunk(lines):
     """
-    Convert a row from the reader into a line for either an Aleae .in file or an Aleae .r file and send it to the
-    appropriate writer.
-    :param waste: a specified chemical that will be converted to a NULL in the products
-    :param aether: list of chemicals that will be converted to a NULL in the reactants
+    Convert a chunk of lines from an Aleae .r file inside a worker process
+    :return: tuple of ((MARlea rows, chemicals used without being declared), diagnostics printed while converting,
+    whether every line was converted)
     """
-    found_chems = dict()
-
-    temp = input_file_reader_to_converter_auxilliary_queue.get()                        # .in output will be incorrect if known chemicals are not found before processing reactions
-    while temp != END_PROCEDURE:
-        found_chems[temp[0]] = temp[1]
-        temp = input_file_reader_to_converter_auxilliary_queue.get()
-
-    temp = input_file_reader_to_converter_queue.get()
-    while temp != END_PROCEDURE:
-        m_parser = MARleaParser(temp[0])                                                # Tokenize the reaction
-        if not m_parser.tokenize():
-            print("Conversion has been halted. Any output Aleae file is considered unsuitable to run.")
-            break
-
-        marlea_tree = m_parser.parse_line()                                             # Parse reaction
-        if marlea_tree is None:
-            print("Conversion has been halted. Any output Aleae file is considered unsuitable to run.")
-            break
-
-        aleae_tree = MARleaParser.convert_tree_to_aleae(marlea_tree, temp[1], waste, aether)        # Convert reaction
-        if aleae_tree is None:
-            print("Conversion has been halted. Any output Aleae file is considered unsuitable to run.")
-            break
-
-        converted_reaction = AleaeParser.construct_line(aleae_tree)
-
-        for chem in m_parser.found_chems:
-            if chem not in set(found_chems.keys()):
-                if len(aether) > 0 and chem == aether[0]:                        # Add discovered chemical to found_chems
-                    found_chems[chem] = '1'
-                else:
-                    found_chems[chem] = '0'
-                converter_to_output_file_writer_queue_0.put(chem + " " + found_chems[chem] + ' N\n')
-        converter_to_output_file_writer_queue_1.put(converted_reaction+"\n")
+    diagnostics = io.StringIO()
+    with contextlib.redirect_stdout(diagnostics):
+        rows, converted_all = convert_aleae_lines(lines, worker_species)
 
-        temp = input_file_reader_to_converter_queue.get()
+    undeclared = []
+    if worker_species.undeclared_uses is not None:
+        undeclared = [worker_species.names[chem_id] for chem_id in worker_species.undeclared_uses]
+        worker_species.undeclared_uses.clear()
+    return (rows, undeclared), diagnostics.getvalue(), converted_all
 
-    converter_to_output_file_writer_queue_0.put(END_PROCEDURE)
-    converter_to_output_file_writer_queue_1.put(END_PROCEDURE)
 
-def write_aleae_in_file(aleae_in_filename):
+def convert_marlea_chunk(rows):
     """
-    Receive row from either the reader or converter and write to .in Aleae file
-    :param aleae_in_filename: name of Aleae .in file as output
+    Convert a chunk of reaction rows from a MARlea file inside a worker process. Chemicals that were not initialized
+    in the MARlea file are reported by name in the order they first appear within the chunk.
+    :return: tuple of ((Aleae lines, discovered chemicals), diagnostics printed while converting, whether every row
+    was converted)
     """
-    f_aleae_output_in = open_file_write(aleae_in_filename)
-    if f_aleae_output_in is None:
-        return
+    lines, discovered, seen = [], [], set()
+    diagnostics = io.StringIO()
+    with contextlib.redirect_stdout(diagnostics):
+        for row in rows:
+            result = convert_marlea_reaction(row, worker_species)
+            if result is None:
+                return (lines, discovered), diagnostics.getvalue(), False
+
+            converted_reaction, marlea_reaction = result
+            for side in (ReactionParts.REACTANTS, ReactionParts.PRODUCTS):
+                for chem_id in marlea_reaction.chems[side]:
+                    if not worker_species.declared[chem_id] and chem_id not in seen:
+                        seen.add(chem_id)
+                        discovered.append(worker_species.names[chem_id])
+            lines.append(converted_reaction+"\n")
+    return (lines, discovered), diagnostics.getvalue(), True
+
+
+class ConversionSession:
+    """
+    A single conversion from Aleae files to a MARlea file or vice versa. Every session owns the queues used for
+    inter-thread communication and the threads of its stages, so any number of sessions can run concurrently in one
+    process without sharing leftover items.
+
+    Readers and converters are generators that yield chunks (lists) of up to chunk_size lines or rows. Sequential
+    execution chains them straight into a writer, which pulls one chunk at a time through the whole conversion. Pipelined
+    execution runs every stage in its own thread and passes the chunks through queues that hold at most queue_capacity
+    chunks, so a stage that gets ahead waits for the next one. Either way, memory use does not grow with the size of the
+    input files. Writers buffer flush_size bytes of output before writing them.
 
-    temp = input_file_reader_to_output_writer_queue.get()
-    while temp != END_PROCEDURE:
-        f_aleae_output_in.write(temp)
-        temp = input_file_reader_to_output_writer_queue.get()                       # Write line from reader
+    Reactions converted in the converter stage are remembered in a ReactionMemo of memo_size reactions, so repeated
+    lines are only converted once. A memo_size of 0 disables it.
 
-    temp = converter_to_output_file_writer_queue_0.get()
-    while temp != END_PROCEDURE:
-        f_aleae_output_in.write(temp)                                               # Write lines from converter
-        temp = converter_to_output_file_writer_queue_0.get()
+    Setting cancel_event, a threading.Event, from another thread stops the readers at their next chunk. The writers
+    then discard what they wrote, so existing output files are left untouched.
 
-    f_aleae_output_in.close()
+    Given a ConversionStats, the session measures its stages, queues, and the phases of converting reactions in this
+    thread into it. Without one, the stages and queues are left as they are. Given a ConversionProfiler, every stage
+    thread and worker process is profiled.
+    """
+    def __init__(self, waste='', aether=None, chunk_size=DEFAULT_CHUNK_SIZE, queue_capacity=DEFAULT_QUEUE_CAPACITY,
+                 flush_size=DEFAULT_FLUSH_SIZE, memo_size=DEFAULT_MEMO_SIZE, cancel_event=None, stats=None,
+                 profiler=None):
+        self.waste = waste
+        self.aether = [] if aether is None else list(aether)
+        self.aether_names = frozenset(self.aether)                          # Built once for the readers
+        self.chunk_size = chunk_size
+        self.flush_size = flush_size
+        self.species = SpeciesTable(self.waste, self.aether)               # Only ever touched by the converter stage
+        self.stats = stats
+        self.profiler = profiler
+        # Setup queues for inter-thread communication
+        self.input_file_reader_to_converter_queue = self.new_queue("reader_to_converter", queue_capacity)
+        self.input_file_reader_to_output_writer_queue = self.new_queue("reader_to_writer", queue_capacity)
+        self.input_file_reader_to_converter_auxilliary_queue = self.new_queue("reader_to_converter_auxilliary",
+                                                                              queue_capacity)
+        self.converter_to_output_file_writer_queue = self.new_queue("converter_to_writer", queue_capacity)
+        self.marlea_lines_to_read = None                                    # Lines of a MARlea file before an invalid one
+        self.in_file_declared = False                                       # Whether every chemical of the .in file is declared
+        self.line_index = None                                              # LineIndex of an incremental conversion
+        self.memo = ReactionMemo(memo_size) if memo_size > 0 else None
+        self.cancel_event = cancel_event
+        self.threads = []
+        self.success = True
+
+    def new_queue(self, name, capacity):
+        """Return a queue between two stages, which is measured under a name if the session has stats."""
+        return queue.Queue(capacity) if self.stats is None else self.stats.queue(name, capacity)
+
+    def timed(self, name, chunks, part=None):
+        """
+        Return the chunks of a stage, measured under a name if the session has stats
+        :param part: index of the part of each chunk whose items are counted, or None if the chunk is a list of items
+        """
+        return chunks if self.stats is None else self.stats.timed(name, chunks, part)
+
+    def measure(self, name):
+        """Return a context manager measuring a chunk written by a stage, or doing nothing without stats."""
+        return contextlib.nullcontext() if self.stats is None else self.stats.measure(name)
+
+    def count(self, stage, items):
+        """Count a chunk written by a stage that is being measured."""
+        if stage is not None:
+            self.stats.count(stage, items)
+
+    def finish(self):
+        """
+        Report a cancelled conversion once every stage has stopped
+        :return: True if the conversion finished without halting or being cancelled
+        """
+        if self.cancelled():
+            self.success = False
+            print("Conversion has been cancelled. Existing output files were left untouched.")
+        return self.success
+
+    def halt(self, output_format):
+        """Mark the session as failed and notify the user that the output was not written."""
+        self.success = False
+        print("Conversion has been halted. Existing output", output_format, "files were left untouched.")
+
+    def cancelled(self):
+        """Return True if the conversion has been cancelled."""
+        return self.cancel_event is not None and self.cancel_event.is_set()
+
+    def finish_file_write(self, f, filename):
+        """Move an output file into place, or discard it if the conversion has failed or been cancelled."""
+        if not self.success or self.cancelled():
+            discard_file_write(f)
+        else:
+            close_file_write(f, filename)
+
+    def read_chunks(self, f):
+        """
+        Read an open file in blocks of about READ_BLOCK_SIZE characters and yield lists of up to chunk_size lines,
+        stopping early if the conversion is cancelled
+        """
+        lines = f.readlines(READ_BLOCK_SIZE)
+        while len(lines) > 0:
+            for i in range(0, len(lines), self.chunk_size):
+                if self.cancelled():
+                    return
+                yield lines if len(lines) <= self.chunk_size else lines[i:i + self.chunk_size]
+            lines = f.readlines(READ_BLOCK_SIZE)
+
+    @staticmethod
+    def iter_queue(q):
+        """Yield chunks from a queue until the end of the procedure is reached."""
+        chunk = q.get()
+        while chunk != END_PROCEDURE:
+            yield chunk
+            chunk = q.get()
 
+    @staticmethod
+    def feed(chunks, *queues):
+        """
+        Put every chunk a stage yields on the queue of the next stage, then mark the end of the queue. A stage that
+        feeds more than one queue yields a tuple with one chunk for each queue.
+        """
+        for parts in chunks:
+            for q, part in zip(queues, parts if len(queues) > 1 else (parts, )):
+                q.put(part)
+        for q in queues:
+            q.put(END_PROCEDURE)
 
-def write_aleae_r_file(aleae_r_filename):
+    @staticmethod
+    def drain(chunks):
+        """Consume what is left of a stage's input, so that a bounded queue never leaves its reader waiting."""
+        for _ in chunks:
+            pass
+
+    def read_aleae_in_file(self, aleae_in_filename):
+        """
+        Read each line from an Aleae input file and pre-process it
+        :param aleae_in_filename: name of Aleae .in file
+        :return: generator of (chemical names, MARlea initialization rows) chunks
+        """
+        f_init = open_file_read(aleae_in_filename)
+        if f_init is None:
+            self.success = False
+            return
+
+        for chunk in self.read_chunks(f_init):                                  # Convert .in file to beginning of MARlea file
+            chems, rows = [], []
+            halted = False
+            for temp in chunk:
+                temp_row = temp.split(" ")
+                if not check_aleae_in_line(temp_row):
+                    self.halt("MARlea")
+                    halted = True
+                    break
+
+                chems.append(temp_row[0])
+                if temp_row[1] != "0" and temp_row[0] not in self.aether_names:
+                    rows.append(temp_row[:2])
+
+            yield chems, rows
+            if halted:
+                break
+        f_init.close()
+
+        yield [], [[]]                                                          # Blank row before the reactions
+
+    def read_aleae_r_file(self, aleae_r_filename):
+        """
+        Read chunks of lines from an Aleae .r input file
+        :param aleae_r_filename: name of Aleae .r file
+        :return: generator of chunks of reaction lines
+        """
+        f_react = open_file_read(aleae_r_filename)
+        if f_react is None:
+            self.success = False
+            return
+
+        yield from self.read_chunks(f_react)                                    # Convert .r file to reaction in a MARlea file
+        f_react.close()
+
+    def declare_aleae_chems(self, in_chunks):
+        """Declare the chemicals of each chunk read from an Aleae .in file and yield its MARlea rows."""
+        for chems, rows in in_chunks:
+            for chem in chems:
+                self.species.declare(chem)
+            yield rows
+
+    def convert_in_parallel(self, chunks, workers, convert_chunk, output_format):
+        """
+        Send chunks of reactions to a pool of worker processes and yield what they converted in the original order. At
+        most two chunks per worker are in flight, and nothing after the first invalid reaction is yielded.
+        :param chunks: chunks of reactions to convert
+        :param workers: number of worker processes
+        :param convert_chunk: module-level function run by a worker on each chunk
+        :param output_format: name of the output format, used when the conversion is halted
+        :return: generator of the converted part of each chunk
+        """
+        declared_names = [name for name, declared in zip(self.species.names, self.species.declared) if declared]
+        optimistic = self.species.undeclared_uses is not None
+        profile_dir = None if self.profiler is None else self.profiler.directory
+        pending = deque()
+        failed = False
+
+        def collect_chunk():
+            converted, diagnostics, converted_all = pending.popleft().result()
+            print(diagnostics, end='')
+            return converted, not converted_all
+
+        with ProcessPoolExecutor(workers, initializer=init_conversion_worker,
+                                 initargs=(self.waste, self.aether, declared_names, optimistic, profile_dir)) as executor:
+            for chunk in chunks:
+                pending.append(executor.submit(convert_chunk, chunk))
+                if len(pending) > 2 * workers:
+                    converted, failed = collect_chunk()
+                    yield converted
+                    if failed:
+                        break
+
+            while len(pending) > 0 and not failed:
+                converted, failed = collect_chunk()
+                yield converted
+            for future in pending:                                              # Skip anything after a halt
+                future.cancel()
+
+        if failed:
+            self.halt(output_format)
+
+    def aleae_to_marlea_converter(self, line_chunks, workers=1):
+        """
+        Converts each line from Aleae file into a line from a MARlea file. Every chemical of the .in file must already
+        be declared.
+        :param line_chunks: chunks of lines from the .r file
+        :param workers: number of worker processes to convert reactions with, or 1 to convert them in this thread. An
+        incremental conversion always converts them in this thread.
+        :return: generator of chunks of MARlea rows
+        """
+        if workers > 1 and self.line_index is None:
+            species = self.species
+            for rows, undeclared in self.convert_in_parallel(line_chunks, workers, convert_aleae_chunk, "MARlea"):
+                if species.undeclared_uses is not None:
+                    for name in undeclared:
+                        species.undeclared_uses.add(species.intern(name))
+                yield rows
+            return
+
+        convert_reaction = convert_aleae_reaction
+        if self.stats is not None:
+            convert_reaction = functools.partial(convert_aleae_reaction_timed, stats=self.stats)
+        for chunk in line_chunks:
+            rows, converted_all = convert_aleae_lines(chunk, self.species, self.line_index, self.memo, convert_reaction)
+            yield rows
+            if not converted_all:
+                self.halt("MARlea")
+                return
+
+    def declare_queued_chems(self, block=True):
+        """
+        Declare the chemicals sent by the .in file reader
+        :param block: True to wait for the end of the .in file, or False to only declare the chemicals already queued
+        """
+        while not self.in_file_declared:
+            try:
+                chems = self.input_file_reader_to_converter_auxilliary_queue.get(block)
+            except queue.Empty:
+                return
+
+            if chems == END_PROCEDURE:
+                self.in_file_declared = True
+            else:
+                for chem in chems:
+                    self.species.declare(chem)
+
+    def declare_before_each_chunk(self, line_chunks):
+        """
+        Yield chunks of lines, first declaring whatever chemicals the .in file reader has sent so far. Once the .in file
+        has been read, the chemicals used by the chunks before are checked before each chunk, so a missing chemical
+        halts the conversion within a chunk or so of the reaction that uses it.
+        """
+        for chunk in line_chunks:
+            self.declare_queued_chems(block=False)
+            if self.in_file_declared and not self.check_undeclared_uses():
+                return
+            yield chunk
+
+    def check_undeclared_uses(self):
+        """
+        Halt if a chemical used before it was declared never got declared in the .in file
+        :return: True if every chemical used so far is declared
+        """
+        species = self.species
+        missing = [chem_id for chem_id in sorted(species.undeclared_uses) if not species.declared[chem_id]]
+        species.undeclared_uses.clear()                                     # Declared ones need no second check
+        for chem_id in missing:
+            print("Chem missing in .in file:", "'" + species.names[chem_id] + "'")
+        if len(missing) > 0:
+            self.halt("MARlea")
+        return len(missing) == 0
+
+    def aleae_to_marlea_converter_stage(self, workers=1, optimistic=False):
+        """
+        Converter thread of a pipelined Aleae to MARlea conversion
+        :param workers: number of worker processes to convert reactions with, or 1 to convert them in this thread
+        :param optimistic: True to convert reactions while the .in file is still being read and check the chemicals
+        they use once it has been read
+        """
+        line_chunks = self.iter_queue(self.input_file_reader_to_converter_queue)
+        if optimistic:
+            self.species.undeclared_uses = set()
+            converted = self.aleae_to_marlea_converter(self.declare_before_each_chunk(line_chunks), workers)
+        else:
+            self.declare_queued_chems()                                         # Get all chems to feed to the parser
+            converted = self.aleae_to_marlea_converter(line_chunks, workers)
+
+        self.feed(self.timed("aleae_to_marlea_converter", converted), self.converter_to_output_file_writer_queue)
+        self.drain(line_chunks)
+        if optimistic and self.success:
+            self.declare_queued_chems()
+            self.check_undeclared_uses()
+
+    def write_marlea_file(self, MARlea_output_filename, *row_chunks):
+        """
+        Write chunks of rows to the MARlea file.
+        :param MARlea_output_filename: name of MARlea file
+        :param row_chunks: iterables of chunks of rows, written one after another
+        """
+        f_MARlea_output = open_file_write(MARlea_output_filename, self.flush_size)
+        if f_MARlea_output is None:
+            self.success = False
+            for chunks in row_chunks:
+                self.drain(chunks)
+            return
+
+        writer = csv.writer(f_MARlea_output, "excel")
+        try:
+            for chunks in row_chunks:
+                for chunk in chunks:
+                    with self.measure("write_marlea_file") as stage:
+                        writer.writerows(chunk)
+                    self.count(stage, len(chunk))
+        except BaseException:
+            discard_file_write(f_MARlea_output)
+            raise
+        self.finish_file_write(f_MARlea_output, MARlea_output_filename)
+
+    def join_spooled_output(self, output_filename, spool_filenames):
+        """
+        Write temporary files that parts of the output were written to into the output file, then remove them. Nothing
+        is written if the conversion has failed or been cancelled.
+        """
+        if not self.success or self.cancelled():
+            f_output = None
+        else:
+            f_output = open_file_write(output_filename, self.flush_size)
+            self.success = f_output is not None
+        if f_output is not None:
+            with self.measure("join_spooled_output"):
+                for spool_filename in spool_filenames:
+                    with open(spool_filename, "r", newline='') as f_spool:
+                        shutil.copyfileobj(f_spool, f_output)
+                close_file_write(f_output, output_filename)
+
+        for spool_filename in spool_filenames:
+            os.remove(spool_filename)
+
+    def read_marlea_init(self, MARlea_input_filename):
+        """
+        Read the initialization rows of a MARlea input file. Reading stops at the first invalid row, and only the lines
+        before it are later read for reactions. Lines that certainly hold a reaction are skipped without being parsed.
+        :param MARlea_input_filename: name of MARlea file as input
+        :return: generator of (Aleae .in lines, initialization rows) chunks
+        """
+        self.marlea_lines_to_read = 0
+        f_MARlea_input = open_file_read(MARlea_input_filename)
+        if f_MARlea_input is None:
+            self.success = False
+            return
+
+        self.marlea_lines_to_read = None
+        lines_read = 0
+        for chunk in self.read_chunks(f_MARlea_input):
+            init_lines, init_rows = [], []
+            indices = [i for i, line in enumerate(chunk) if not is_marlea_reaction_line(line)]
+            for i, row in zip(indices, csv.reader([chunk[i] for i in indices], "excel")):
+                if is_marlea_content_row(row) and MARLEA_ARROW not in row[0] and row[1] != "" and row[0] != "":
+                    if check_marlea_init(row):
+                        init_lines.append(row[0].strip() + " " + row[1].strip() + ' N\n')
+                        init_rows.append(row)
+                    else:
+                        self.halt("Aleae")
+                        self.marlea_lines_to_read = lines_read + i
+                        break
+
+            yield init_lines, init_rows
+            if self.marlea_lines_to_read is not None:
+                break
+            lines_read += len(chunk)
+        f_MARlea_input.close()
+
+    def read_marlea_reactions(self, MARlea_input_filename):
+        """
+        Read the reaction rows of a MARlea input file once its initialization rows have been read. Only lines that
+        contain an arrow or a quote are parsed.
+        :param MARlea_input_filename: name of MARlea file as input
+        :return: generator of chunks of reaction rows
+        """
+        lines_left = self.marlea_lines_to_read
+        if lines_left == 0:
+            return
+        f_MARlea_input = open_file_read(MARlea_input_filename)
+        if f_MARlea_input is None:
+            self.success = False
+            return
+
+        for chunk in self.read_chunks(f_MARlea_input):
+            if lines_left is not None:
+                chunk = chunk[:lines_left]
+                lines_left -= len(chunk)
+
+            candidates = [line for line in chunk if MARLEA_ARROW in line or '"' in line]
+            reactions = [row for row in csv.reader(candidates, "excel")
+                         if is_marlea_content_row(row) and MARLEA_ARROW in row[0]]
+            if len(reactions) > 0:
+                yield reactions
+            if lines_left == 0:
+                break
+        f_MARlea_input.close()
+
+    def read_marlea_file(self, MARlea_input_filename):
+        """Reader thread of a pipelined MARlea to Aleae conversion, which reads the file once for each kind of row."""
+        self.feed(self.timed("read_marlea_init", self.read_marlea_init(MARlea_input_filename), 0),
+                  self.input_file_reader_to_output_writer_queue, self.input_file_reader_to_converter_auxilliary_queue)
+        self.feed(self.timed("read_marlea_reactions", self.read_marlea_reactions(MARlea_input_filename)),
+                  self.input_file_reader_to_converter_queue)
+
+    def declare_marlea_chems(self, init_chunks):
+        """Declare the chemicals of each chunk of MARlea initialization rows and yield its Aleae .in lines."""
+        for init_lines, init_rows in init_chunks:
+            for row in init_rows:
+                self.species.declare(row[0].strip())
+            yield init_lines
+
+    def initialize_discovered_chem(self, chem_id, in_lines):
+        """Mark a chemical found in a MARlea reaction as initialized and add its .in line to in_lines."""
+        species = self.species
+        species.declared[chem_id] = 1
+        amount = ' 1' if len(species.aether_ids) > 0 and chem_id == species.aether_ids[0] else ' 0'
+        in_lines.append(species.names[chem_id] + amount + ' N\n')
+
+    def initialize_row_chems(self, row, in_lines):
+        """
+        Initialize the discovered chemicals of a reaction row that was converted before, without converting it again.
+        Every symbol of a valid MARlea reaction is separated by whitespace, so its chemicals are the symbols that are
+        not an arrow, a NULL, a plus, or a coefficient.
+        """
+        species = self.species
+        ids, declared = species.ids, species.declared
+        for symbol in row[0].split():
+            chem_id = ids.get(symbol)
+            if chem_id is not None and declared[chem_id]:
+                continue
+            if symbol != MARLEA_ARROW and symbol != MARLEA_NULL and symbol != MARLEA_TERM_SEPARATOR \
+                    and not symbol.isdecimal():
+                self.initialize_discovered_chem(species.intern(symbol), in_lines)
+
+    def marlea_to_aleae_converter(self, row_chunks, workers=1):
+        """
+        Convert rows of MARlea reactions into lines for an Aleae .r file, along with .in lines for chemicals that were
+        not initialized. Every initialized chemical must already be declared, or the .in output will be incorrect.
+        :param row_chunks: chunks of reaction rows
+        :param workers: number of worker processes to convert reactions with, or 1 to convert them in this thread. An
+        incremental conversion always converts them in this thread.
+        :return: generator of (Aleae .in lines, Aleae .r lines) chunks
+        """
+        species, line_index, memo = self.species, self.line_index, self.memo
+        if workers > 1 and line_index is None:
+            for lines, discovered in self.convert_in_parallel(row_chunks, workers, convert_marlea_chunk, "Aleae"):
+                in_lines = []
+                for name in discovered:
+                    chem_id = species.intern(name)
+                    if not species.declared[chem_id]:                           # Initialize a discovered chemical
+                        self.initialize_discovered_chem(chem_id, in_lines)
+                yield in_lines, lines
+            return
+
+        convert_row = convert_marlea_row
+        if self.stats is not None:
+            convert_row = functools.partial(convert_marlea_row, convert_reaction=functools.partial(
+                convert_marlea_reaction_timed, stats=self.stats))
+        for chunk in row_chunks:
+            in_lines, lines = [], []
+            halted = False
+            for row in chunk:
+                if line_index is not None:
+                    converted_reaction = line_index.lookup(row[0] + "\0" + row[1])
+                    if converted_reaction is not None:                          # Unchanged since the last conversion
+                        self.initialize_row_chems(row, in_lines)
+                        lines.append(converted_reaction+"\n")
+                        continue
+
+                if memo is None:
+                    result = convert_row(row, species)
+                else:
+                    result = memo.convert(row[0], row[1], convert_row, row, species)
+                if result is None:
+                    halted = True
+                    break
+
+                converted_reaction, chem_ids = result
+                for chem_id in chem_ids:
+                    if not species.declared[chem_id]:                           # Initialize a discovered chemical
+                        self.initialize_discovered_chem(chem_id, in_lines)
+                lines.append(converted_reaction+"\n")
+
+            yield in_lines, lines
+            if halted:
+                self.halt("Aleae")
+                return
+
+    def marlea_to_aleae_converter_stage(self, workers=1):
+        """Converter thread of a pipelined MARlea to Aleae conversion."""
+        for init_rows in self.iter_queue(self.input_file_reader_to_converter_auxilliary_queue):
+            for row in init_rows:
+                self.species.declare(row[0].strip())
+
+        row_chunks = self.iter_queue(self.input_file_reader_to_converter_queue)
+        self.feed(self.timed("marlea_to_aleae_converter", self.marlea_to_aleae_converter(row_chunks, workers), 1),
+                  self.converter_to_output_file_writer_queue)
+        self.drain(row_chunks)
+
+    def write_aleae_files(self, aleae_in_filename, aleae_r_filename, init_line_chunks, converted_chunks):
+        """
+        Write chunks of initialization lines to the .in Aleae file, followed by the chunks of .in and .r lines from the
+        converter
+        :param aleae_in_filename: name of Aleae .in file as output
+        :param aleae_r_filename: name of Aleae .r file as output
+        :param init_line_chunks: chunks of .in lines of initialized chemicals
+        :param converted_chunks: (Aleae .in lines, Aleae .r lines) chunks
+        """
+        f_aleae_output_in = open_file_write(aleae_in_filename, self.flush_size)
+        f_aleae_output_r = open_file_write(aleae_r_filename, self.flush_size) if f_aleae_output_in is not None else None
+        if f_aleae_output_r is None:
+            self.success = False
+            if f_aleae_output_in is not None:
+                discard_file_write(f_aleae_output_in)
+            self.drain(init_line_chunks)
+            self.drain(converted_chunks)
+            return
+
+        try:
+            for chunk in init_line_chunks:
+                with self.measure("write_aleae_files") as stage:
+                    f_aleae_output_in.writelines(chunk)                         # Write lines from reader
+                self.count(stage, len(chunk))
+            for in_lines, lines in converted_chunks:
+                with self.measure("write_aleae_files") as stage:
+                    f_aleae_output_in.writelines(in_lines)                      # Write lines from converter
+                    f_aleae_output_r.writelines(lines)
+                self.count(stage, len(in_lines) + len(lines))
+        except BaseException:
+            discard_file_write(f_aleae_output_in)
+            discard_file_write(f_aleae_output_r)
+            raise
+        self.finish_file_write(f_aleae_output_in, aleae_in_filename)
+        self.finish_file_write(f_aleae_output_r, aleae_r_filename)
+
+    def run_threads(self, stages):
+        """
+        Run each stage in its own thread and wait for all of them to finish
+        :param stages: list of (name, function, argument list) triples, where the name is given to the thread and to
+        its profile
+        """
+        self.threads = [Thread(None, stage, name, args) if self.profiler is None
+                        else Thread(None, self.profiler.run, name, (name, stage, *args)) for name, stage, args in stages]
+        for thread in self.threads:
+            thread.start()
+        for thread in self.threads:
+            thread.join()
+
+    def start_a_to_m_conversion(self, aleae_in_filename, aleae_r_filename, marlea_filename, pipeline_enabled,
+                                workers=1, optimistic=False):
+        """
+        Convert a pair of Aleae files into a MARlea file. With optimistic pipelined execution, reactions are converted
+        while the .in file is still being read, so the initialization rows and the reactions are spooled to separate
+        temporary files that are joined into the MARlea file at the end.
+        :return: True if the conversion finished without halting or being cancelled
+        """
+        if pipeline_enabled and optimistic:
+            spool_filenames = []
+            for _ in range(2):
+                spool_fd, spool_filename = tempfile.mkstemp(".csv")
+                os.close(spool_fd)
+                spool_filenames.append(spool_filename)
+            self.run_threads([("read_aleae_in_file", self.feed,
+                               [self.timed("read_aleae_in_file", self.read_aleae_in_file(aleae_in_filename), 0),
+                                self.input_file_reader_to_converter_auxilliary_queue,
+                                self.input_file_reader_to_output_writer_queue]),
+                              ("read_aleae_r_file", self.feed,
+                               [self.timed("read_aleae_r_file", self.read_aleae_r_file(aleae_r_filename)),
+                                self.input_file_reader_to_converter_queue]),
+                              ("aleae_to_marlea_converter", self.aleae_to_marlea_converter_stage, [workers, True]),
+                              ("write_marlea_init_spool", self.write_marlea_file,
+                               [spool_filenames[0], self.iter_queue(self.input_file_reader_to_output_writer_queue)]),
+                              ("write_marlea_reaction_spool", self.write_marlea_file,
+                               [spool_filenames[1], self.iter_queue(self.converter_to_output_file_writer_queue)])])
+            self.join_spooled_output(marlea_filename, spool_filenames)
+        elif pipeline_enabled:
+            self.run_threads([("read_aleae_in_file", self.feed,
+                               [self.timed("read_aleae_in_file", self.read_aleae_in_file(aleae_in_filename), 0),
+                                self.input_file_reader_to_converter_auxilliary_queue,
+                                self.input_file_reader_to_output_writer_queue]),
+                              ("read_aleae_r_file", self.feed,
+                               [self.timed("read_aleae_r_file", self.read_aleae_r_file(aleae_r_filename)),
+                                self.input_file_reader_to_converter_queue]),
+                              ("aleae_to_marlea_converter", self.aleae_to_marlea_converter_stage, [workers, ]),
+                              ("write_marlea_file", self.write_marlea_file,
+                               [marlea_filename, self.iter_queue(self.input_file_reader_to_output_writer_queue),
+                                self.iter_queue(self.converter_to_output_file_writer_queue)])])
+        else:
+            in_chunks = self.timed("read_aleae_in_file", self.read_aleae_in_file(aleae_in_filename), 0)
+            line_chunks = self.timed("read_aleae_r_file", self.read_aleae_r_file(aleae_r_filename))
+            self.write_marlea_file(marlea_filename, self.declare_aleae_chems(in_chunks),
+                                   self.timed("aleae_to_marlea_converter",
+                                              self.aleae_to_marlea_converter(line_chunks, workers)))
+        return self.finish()
+
+    def start_m_to_a_conversion(self, aleae_in_filename, aleae_r_filename, marlea_filename, pipeline_enabled,
+                                workers=1):
+        """
+        Convert a MARlea file into a pair of Aleae files
+        :return: True if the conversion finished without halting or being cancelled
+        """
+        if pipeline_enabled:
+            self.run_threads([("read_marlea_file", self.read_marlea_file, [marlea_filename, ]),
+                              ("marlea_to_aleae_converter", self.marlea_to_aleae_converter_stage, [workers, ]),
+                              ("write_aleae_files", self.write_aleae_files,
+                               [aleae_in_filename, aleae_r_filename,
+                                self.iter_queue(self.input_file_reader_to_output_writer_queue),
+                                self.iter_queue(self.converter_to_output_file_writer_queue)])])
+        else:
+            init_chunks = self.timed("read_marlea_init", self.read_marlea_init(marlea_filename), 0)
+            row_chunks = self.timed("read_marlea_reactions", self.read_marlea_reactions(marlea_filename))
+            self.write_aleae_files(aleae_in_filename, aleae_r_filename, self.declare_marlea_chems(init_chunks),
+                                   self.timed("marlea_to_aleae_converter",
+                                              self.marlea_to_aleae_converter(row_chunks, workers), 1))
+        return self.finish()
+
+
+def convert_with_cache(mode, input_filenames, output_filenames, waste, aether, convert, index_file=None):
     """
-    Receive row from either the converter and write to .r Aleae file
-    :param aleae_r_filename:
-    :return:
+    Copy the outputs of a conversion from the cache if it has been done before, or run it and cache its outputs
+    :param mode: 'a-to-m' or 'm-to-a'
+    :param input_filenames: paths of the input files
+    :param output_filenames: paths of the output files
+    :param convert: function that runs the conversion and returns True if it finished without halting
+    :param index_file: path of the index an incremental conversion writes next to its output, or None. The index
+    is cached along with the outputs, so the next incremental conversion can use it after a cache hit.
+    :return: True if the outputs came from the cache or the conversion finished without halting
     """
-    f_aleae_output_r = open_file_write(aleae_r_filename)
-    if f_aleae_output_r is None:
-        return
+    conversion_cache = ConversionCache()
+    key = conversion_cache.key(mode, input_filenames, waste, [] if aether is None else aether)
+    cached_filenames = output_filenames if index_file is None else output_filenames + [index_file]
+    if key is not None and conversion_cache.fetch(key, cached_filenames):
+        return True
 
-    temp = converter_to_output_file_writer_queue_1.get()
-    while temp != END_PROCEDURE:
-        f_aleae_output_r.write(temp)                                                # Write converted line
-        temp = converter_to_output_file_writer_queue_1.get()
+    success = convert()
+    if success and key is not None:                                         # Halted conversions are never cached
+        if index_file is not None and not os.path.isfile(index_file):
+            cached_filenames = output_filenames
+        conversion_cache.store(key, cached_filenames)
+    return success
 
-    f_aleae_output_r.close()
 
+def note_conversion(stats, session):
+    """Record in a ConversionStats that a session converted the network, and how often its memo was hit."""
+    if stats is None:
+        return
+    stats.converted = True
+    if session.memo is not None:
+        stats.memo = {"hits": session.memo.hits, "lookups": session.memo.lookups}
 
-def start_a_to_m_conversion(aleae_in_filename, aleae_r_filename, marlea_filename, waste, aether, pipeline_enabled):
-    if pipeline_enabled:
-        reader_in_thread = Thread(None, read_aleae_in_file, None, [aleae_in_filename, aether, ])
-        reader_r_thread = Thread(None, read_aleae_r_file, None, [aleae_r_filename, ])
-        converter_thread = Thread(None, aleae_to_marlea_converter, None, [waste, aether, ])
-        writer_thread = Thread(None, write_marlea_file, None, [marlea_filename, ])
 
-        reader_in_thread.start()
-        reader_r_thread.start()
-        converter_thread.start()
-        writer_thread.start()
+def report_stats(stats, stats_filename, trace_filename):
+    """
+    Report what was measured during a conversion
+    :param stats_filename: None, '' to print the stats, or the name of a JSON file to write them to (--stats)
+    :param trace_filename: None or the name of a file to write the Chrome trace to (--trace)
+    """
+    if stats is None:
+        return
+    try:
+        if stats_filename == "":
+            print(stats.report())
+        elif stats_filename is not None:
+            stats.write_json(stats_filename)
+        if trace_filename is not None:
+            stats.write_trace(trace_filename)
+    except OSError as e:
+        print("Error: Could not write", e.filename + ":", e.strerror)
+
+
+def make_profiler(profile_dir):
+    """Return a ConversionProfiler writing into the directory given with --profile, or None if none was given."""
+    if profile_dir is None:
+        return None
+    try:
+        return ConversionProfiler(profile_dir)
+    except OSError as e:
+        print("Error: Could not use", profile_dir, "for profiles:", e.strerror)
+        exit(-1)
+
 
-        reader_in_thread.join()
-        reader_r_thread.join()
-        converter_thread.join()
-        writer_thread.join()
+def start_a_to_m_conversion(aleae_in_filename, aleae_r_filename, marlea_filename, waste, aether, pipeline_enabled,
+                            workers=1, chunk_size=DEFAULT_CHUNK_SIZE, optimistic=False, flush_size=DEFAULT_FLUSH_SIZE,
+                            use_cache=True, incremental=False, memo_size=DEFAULT_MEMO_SIZE, memo_stats=False,
+                            cancel_event=None, stats=None, profiler=None):
+    """
+    Convert a pair of Aleae files into a MARlea file in a new session, or copy the MARlea file from the cache if the
+    same files were converted with the same waste and aether before
+    :param incremental: True to reuse the rows of .r lines that did not change since the last incremental conversion
+    to the same MARlea file, and to index the new MARlea file for the next one
+    :param memo_size: number of converted reactions remembered for repeated lines, or 0 to convert every line
+    :param memo_stats: True to print how often the memo was hit
+    :param cancel_event: threading.Event that cancels the conversion when it is set, leaving the output untouched
+    :param stats: ConversionStats that the time spent in each stage, phase, and queue is measured into
+    :param profiler: ConversionProfiler that profiles every thread and worker process of the conversion
+    :return: True on success
+    """
+    def convert():
+        session = ConversionSession(waste, aether, chunk_size, flush_size=flush_size, memo_size=memo_size,
+                                    cancel_event=cancel_event, stats=stats, profiler=profiler)
+        if incremental:
+            if workers > 1:
+                print("Note: --workers is not used by incremental conversions, which convert reactions in one process")
+            session.line_index = a_to_m_index(aleae_in_filename, marlea_filename, waste, aether)
+        start_conversion = session.start_a_to_m_conversion
+        if profiler is not None:
+            start_conversion = functools.partial(profiler.run, MAIN_PROFILE, start_conversion)
+        success = start_conversion(aleae_in_filename, aleae_r_filename, marlea_filename, pipeline_enabled, workers,
+                                   optimistic)
+        if incremental and success:                                         # Failed conversions keep the old output
+            session.line_index.save(marlea_filename, marlea_filename)
+        if memo_stats and session.memo is not None:
+            print(session.memo.report())
+        note_conversion(stats, session)
+        if profiler is not None:
+            profiler.write_summary()
+        return success
+
+    start = time.perf_counter()
+    if not use_cache:
+        success = convert()
     else:
-        read_aleae_in_file(aleae_in_filename, aether)
-        read_aleae_r_file(aleae_r_filename)
-        aleae_to_marlea_converter(waste, aether)
-        write_marlea_file(marlea_filename)
-
-
-def start_m_to_a_conversion(aleae_in_filename, aleae_r_filename, marlea_filename, waste, aether, pipeline_enabled):
-    if pipeline_enabled:
-        reader_thread = Thread(None, read_marlea_file, None, [marlea_filename, ])
-        converter_thread = Thread(None, marlea_to_aleae_converter, None, [waste, aether, ])
-        writer_thread_in = Thread(None, write_aleae_in_file, None, [aleae_in_filename, ])
-        writer_thread_r = Thread(None, write_aleae_r_file, None, [aleae_r_filename, ])
-
-        reader_thread.start()
-        converter_thread.start()
-        writer_thread_in.start()
-        writer_thread_r.start()
-
-        reader_thread.join()
-        converter_thread.join()
-        writer_thread_in.join()
-        writer_thread_r.join()
+        success = convert_with_cache("a-to-m", [aleae_in_filename, aleae_r_filename], [marlea_filename], waste,
+                                     aether, convert, index_filename(marlea_filename) if incremental else None)
+    if stats is not None:
+        stats.wall = time.perf_counter() - start
+    return success
+
+
+def start_m_to_a_conversion(aleae_in_filename, aleae_r_filename, marlea_filename, waste, aether, pipeline_enabled,
+                            workers=1, chunk_size=DEFAULT_CHUNK_SIZE, flush_size=DEFAULT_FLUSH_SIZE, use_cache=True,
+                            incremental=False, memo_size=DEFAULT_MEMO_SIZE, memo_stats=False, cancel_event=None,
+                            stats=None, profiler=None):
+    """
+    Convert a MARlea file into a pair of Aleae files in a new session, or copy the Aleae files from the cache if the
+    same file was converted with the same waste and aether before
+    :param incremental: True to reuse the .r lines of reaction rows that did not change since the last incremental
+    conversion to the same .r file, and to index the new .r file for the next one
+    :param memo_size: number of converted reactions remembered for repeated rows, or 0 to convert every row
+    :param memo_stats: True to print how often the memo was hit
+    :param cancel_event: threading.Event that cancels the conversion when it is set, leaving the output untouched
+    :param stats: ConversionStats that the time spent in each stage, phase, and queue is measured into
+    :param profiler: ConversionProfiler that profiles every thread and worker process of the conversion
+    :return: True on success
+    """
+    def convert():
+        session = ConversionSession(waste, aether, chunk_size, flush_size=flush_size, memo_size=memo_size,
+                                    cancel_event=cancel_event, stats=stats, profiler=profiler)
+        if incremental:
+            if workers > 1:
+                print("Note: --workers is not used by incremental conversions, which convert reactions in one process")
+            session.line_index = m_to_a_index(aleae_r_filename, waste, aether)
+        start_conversion = session.start_m_to_a_conversion
+        if profiler is not None:
+            start_conversion = functools.partial(profiler.run, MAIN_PROFILE, start_conversion)
+        success = start_conversion(aleae_in_filename, aleae_r_filename, marlea_filename, pipeline_enabled, workers)
+        if incremental and success:
+            session.line_index.save(aleae_r_filename, aleae_r_filename)
+        if memo_stats and session.memo is not None:
+            print(session.memo.report())
+        note_conversion(stats, session)
+        if profiler is not None:
+            profiler.write_summary()
+        return success
+
+    start = time.perf_counter()
+    if not use_cache:
+        success = convert()
     else:
-        read_marlea_file(marlea_filename)
-        marlea_to_aleae_converter(waste, aether)
-        write_aleae_in_file(aleae_in_filename)
-        write_aleae_r_file(aleae_r_filename)
+        success = convert_with_cache("m-to-a", [marlea_filename], [aleae_in_filename, aleae_r_filename], waste,
+                                     aether, convert, index_filename(aleae_r_filename) if incremental else None)
+    if stats is not None:
+        stats.wall = time.perf_counter() - start
+    return success
 
 
 def scan_args():
@@ -1052,6 +1809,8 @@ def scan_args():
 
     input_files = []
     pipeline_enabled = False
+    workers = 1
+    chunk_size = DEFAULT_CHUNK_SIZE
     output_files = []
 
     if sys.version_info.major < 3 and sys.version_info.minor < 8:
@@ -1065,24 +1824,90 @@ def scan_args():
     a_to_m_parser = subparsers.add_parser("a-to-m", usage="Convert Aleae files into MARlea files", help="Convert Aleae files to an MARlea equivalent")
     a_to_m_parser.add_argument("-i", "--input", action='store', nargs=2, required=True, help="Paths to the .in and .r Aleae files")
     a_to_m_parser.add_argument("-p", "--pipeline_enable", action='store_true', help="Enable pipelined Execution of file conversion")
+    a_to_m_parser.add_argument("-w", "--workers", action='store', type=int, default=1, help="Number of worker processes that convert reactions in parallel")
+    a_to_m_parser.add_argument("-c", "--chunk_size", action='store', type=int, default=DEFAULT_CHUNK_SIZE, help="Number of lines passed between stages at a time")
+    a_to_m_parser.add_argument("--flush_size", action='store', type=int, default=DEFAULT_FLUSH_SIZE, help="Bytes of output buffered before they are written, or 1 to write every line as it comes")
+    a_to_m_parser.add_argument("--optimistic", action='store_true', help="With pipelined execution, convert reactions while the .in file is still being read")
     a_to_m_parser.add_argument("-o", "--output", action='store', required=True, help="Path to new or preexisting MARlea file")
+    a_to_m_parser.add_argument("--memo_size", action='store', type=int, default=DEFAULT_MEMO_SIZE, help="Number of converted reactions remembered for repeated lines, or 0 to convert every line")
+    a_to_m_parser.add_argument("--memo_stats", action='store_true', help="Print how often remembered reactions were reused")
+    a_to_m_parser.add_argument("--stats", action='store', nargs='?', const='', metavar="FILE", help="Print the time spent in each stage, phase, and queue, or write it as JSON to FILE")
+    a_to_m_parser.add_argument("--trace", action='store', metavar="FILE", help="Write a timeline of every chunk in each stage to FILE in the Chrome trace-event format")
+    a_to_m_parser.add_argument("--profile", action='store', metavar="DIR", help="Profile each stage thread and worker process, writing their pstats files and a merged summary to DIR")
+    a_to_m_parser.add_argument("--incremental", action='store_true', help="Only convert the .r lines that changed since the last incremental conversion to the output")
+    a_to_m_parser.add_argument("--no_cache", action='store_true', help="Convert even if the output is cached, and do not cache it")
+    a_to_m_parser.add_argument("--clear_cache", action='store_true', help="Empty the conversion cache before converting")
     a_to_m_parser.add_argument("--waste", action='store', required=False, help="A chemical that is the waste products of reactions")
     a_to_m_parser.add_argument("--aether", action='store', nargs='*', help="A list of chemicals that enable continous production of other chemicals")
 
     m_to_a_parser = subparsers.add_parser("m-to-a", usage="Convert MARlea files into Aleae files", help="Convert MARlea file to Aleae equivalents")
     m_to_a_parser.add_argument("-i", "--input", action='store', required=True, help="Paths to .csv MARlea file")
     m_to_a_parser.add_argument("-p", "--pipeline_enable", action='store_true', help="Enable pipelined Execution of file conversion")
+    m_to_a_parser.add_argument("-w", "--workers", action='store', type=int, default=1, help="Number of worker processes that convert reactions in parallel")
+    m_to_a_parser.add_argument("-c", "--chunk_size", action='store', type=int, default=DEFAULT_CHUNK_SIZE, help="Number of lines passed between stages at a time")
+    m_to_a_parser.add_argument("--flush_size", action='store', type=int, default=DEFAULT_FLUSH_SIZE, help="Bytes of output buffered before they are written, or 1 to write every line as it comes")
     m_to_a_parser.add_argument("-o", "--output", action='store', nargs=2, required=True, help="Paths to new or preexisting .in and .r Aleae files")
+    m_to_a_parser.add_argument("--memo_size", action='store', type=int, default=DEFAULT_MEMO_SIZE, help="Number of converted reactions remembered for repeated lines, or 0 to convert every line")
+    m_to_a_parser.add_argument("--memo_stats", action='store_true', help="Print how often remembered reactions were reused")
+    m_to_a_parser.add_argument("--stats", action='store', nargs='?', const='', metavar="FILE", help="Print the time spent in each stage, phase, and queue, or write it as JSON to FILE")
+    m_to_a_parser.add_argument("--trace", action='store', metavar="FILE", help="Write a timeline of every chunk in each stage to FILE in the Chrome trace-event format")
+    m_to_a_parser.add_argument("--profile", action='store', metavar="DIR", help="Profile each stage thread and worker process, writing their pstats files and a merged summary to DIR")
+    m_to_a_parser.add_argument("--incremental", action='store_true', help="Only convert the reaction rows that changed since the last incremental conversion to the output")
+    m_to_a_parser.add_argument("--no_cache", action='store_true', help="Convert even if the output is cached, and do not cache it")
+    m_to_a_parser.add_argument("--clear_cache", action='store_true', help="Empty the conversion cache before converting")
     m_to_a_parser.add_argument("--waste", action='store', required=False, help="A chemical that is the waste products of reactions")
     m_to_a_parser.add_argument("--aether", action='store', nargs='*', help="A list of chemicals that enable continous production of other chemicals")
 
+    batch_parser = subparsers.add_parser("batch", usage="Convert every network in a directory tree", help="Convert all Aleae and MARlea networks found in a directory tree")
+    batch_parser.add_argument("-i", "--input", action='store', required=True, help="Path to the directory searched for .in/.r pairs and .csv files")
+    batch_parser.add_argument("-p", "--pipeline_enable", action='store_true', help="Enable pipelined Execution of each file conversion")
+    batch_parser.add_argument("-o", "--output", action='store', required=True, help="Path to the directory converted files are written to")
+    batch_parser.add_argument("-m", "--mode", action='store', choices=["a-to-m", "m-to-a", "all"], default="all", help="Which networks to convert")
+    batch_parser.add_argument("-j", "--jobs", action='store', type=int, help="Number of worker processes (defaults to the number of cores)")
+    batch_parser.add_argument("--no_cache", action='store_true', help="Convert even if the output is cached, and do not cache it")
+    batch_parser.add_argument("--clear_cache", action='store_true', help="Empty the conversion cache before converting")
+    batch_parser.add_argument("--waste", action='store', required=False, help="A chemical that is the waste products of reactions")
+    batch_parser.add_argument("--aether", action='store', nargs='*', help="A list of chemicals that enable continous production of other chemicals")
+
+    watch_parser = subparsers.add_parser("watch", usage="Convert a network again every time it changes", help="Watch the input file(s) of a network and convert them again on every change")
+    watch_parser.add_argument("-m", "--mode", action='store', choices=["a-to-m", "m-to-a"], required=True, help="Which way to convert the network")
+    watch_parser.add_argument("-i", "--input", action='store', nargs='+', required=True, help="Paths to the .in and .r Aleae files, or to the .csv MARlea file")
+    watch_parser.add_argument("-p", "--pipeline_enable", action='store_true', help="Enable pipelined Execution of each file conversion")
+    watch_parser.add_argument("-o", "--output", action='store', nargs='+', required=True, help="Path to the MARlea file, or paths to the .in and .r Aleae files")
+    watch_parser.add_argument("--interval", action='store', type=float, default=0.5, help="Seconds between checks of the input file(s)")
+    watch_parser.add_argument("--no_cache", action='store_true', help="Convert even if the output is cached, and do not cache it")
+    watch_parser.add_argument("--clear_cache", action='store_true', help="Empty the conversion cache before converting")
+    watch_parser.add_argument("--waste", action='store', required=False, help="A chemical that is the waste products of reactions")
+    watch_parser.add_argument("--aether", action='store', nargs='*', help="A list of chemicals that enable continous production of other chemicals")
+
+    daemon_parser = subparsers.add_parser("daemon", usage="Take conversion jobs over HTTP", help="Run a daemon that takes conversion jobs over HTTP on localhost or a Unix domain socket")
+    daemon_parser.add_argument("--port", action='store', type=int, default=8765, help="Localhost port to listen on")
+    daemon_parser.add_argument("--socket", action='store', help="Path of a Unix domain socket to listen on instead of a port")
+    daemon_parser.add_argument("-j", "--jobs", action='store', type=int, help="Number of worker processes (defaults to the number of cores)")
+    daemon_parser.add_argument("--no_cache", action='store_true', help="Convert even if the output is cached, and do not cache it")
+    daemon_parser.add_argument("--clear_cache", action='store_true', help="Empty the conversion cache before starting")
+
+    compile_parser = subparsers.add_parser("compile", usage="Compile a network into a binary file", help="Compile Aleae or MARlea files into a binary network that files can be emitted from without parsing")
+    compile_parser.add_argument("-i", "--input", action='store', nargs='+', required=True, help="Paths to the .in and .r Aleae files, or to the .csv MARlea file")
+    compile_parser.add_argument("-o", "--output", action='store', required=True, help="Path to the compiled .crnb file")
+    compile_parser.add_argument("--waste", action='store', required=False, help="A chemical that is the waste products of reactions")
+    compile_parser.add_argument("--aether", action='store', nargs='*', help="A list of chemicals that enable continous production of other chemicals")
+
+    emit_parser = subparsers.add_parser("emit", usage="Write the files of a compiled network", help="Write Aleae or MARlea files from a compiled network")
+    emit_parser.add_argument("-i", "--input", action='store', required=True, help="Path to the compiled .crnb file")
+    emit_parser.add_argument("-o", "--output", action='store', nargs='+', required=True, help="Path to a MARlea file, or paths to .in and .r Aleae files")
+
     gui_parser = subparsers.add_parser("gui", usage="summons the gui", help="Summon the program's graphical user interface")
     gui_parser.add_argument("-v", "--verbose", action='store_true', help="This argument has no function at the moment")
 
     parsed_args = main_parser.parse_args(sys.argv[1:])  # Extract some of the arguments from the command-line input
     input_mode = parsed_args.command
 
-    if input_mode is not None and input_mode != "gui":
+    if input_mode == "daemon":
+        use_cache = not parsed_args.no_cache
+        if parsed_args.clear_cache:
+            ConversionCache().clear()
+    elif input_mode is not None and input_mode != "gui" and input_mode != "emit":
         if parsed_args.waste is not None:
             waste_local = parsed_args.waste
 
@@ -1095,11 +1920,91 @@ def scan_args():
 
         input_files = parsed_args.input                             # Extract the rest of the command-line input
         output_files = parsed_args.output
-        pipeline_enabled = parsed_args.pipeline_enable
+        if input_mode != "compile":
+            pipeline_enabled = parsed_args.pipeline_enable
+            use_cache = not parsed_args.no_cache
+            if parsed_args.clear_cache:
+                ConversionCache().clear()
+
+    if input_mode == "a-to-m" or input_mode == "m-to-a":
+        workers = parsed_args.workers
+        chunk_size = parsed_args.chunk_size
+        if workers < 1:
+            print("Error: Number of workers must be at least one")
+            exit(-1)
+        elif chunk_size < 1:
+            print("Error: Chunk size must be at least one")
+            exit(-1)
+        elif parsed_args.flush_size < 1:
+            print("Error: Flush size must be at least one")
+            exit(-1)
+        elif parsed_args.memo_size < 0:
+            print("Error: Memo size must not be negative")
+            exit(-1)
 
     if input_mode is None or input_mode == "gui":
-        gui_root.mainloop()
+        from gui import run_gui                                     # Tk is only loaded when the gui is summoned
+        run_gui()
         exit(0)
+    elif input_mode == "batch":
+        from batch import run_batch
+        if parsed_args.jobs is not None and parsed_args.jobs < 1:
+            print("Error: Number of jobs must be at least one")
+            exit(-1)
+        if not run_batch(input_files, output_files, parsed_args.mode, waste_local, aether_local, pipeline_enabled,
+                         parsed_args.jobs, use_cache):
+            exit(-1)
+    elif input_mode == "daemon":
+        from daemon import run_daemon
+        if parsed_args.jobs is not None and parsed_args.jobs < 1:
+            print("Error: Number of jobs must be at least one")
+            exit(-1)
+        if not run_daemon(parsed_args.port, parsed_args.socket, parsed_args.jobs, use_cache):
+            exit(-1)
+    elif input_mode == "watch":
+        from watch import run_watch
+        aleae_files, marlea_files = (input_files, output_files) if parsed_args.mode == "a-to-m" else (output_files, input_files)
+        if len(aleae_files) != 2 or len(marlea_files) != 1:
+            print("Error: Expected a .in and a .r Aleae file and one MARlea file")
+            exit(-1)
+        elif ".in" in aleae_files[1] and ".r" in aleae_files[0]:
+            aleae_files.reverse()
+        elif not (".in" in aleae_files[0] and ".r" in aleae_files[1]):
+            print("Error: Invalid Aleae file type")
+            exit(-1)
+        if ".csv" not in marlea_files[0]:
+            print("Error: Invalid MARlea file type")
+            exit(-1)
+        elif parsed_args.interval <= 0:
+            print("Error: Interval must be positive")
+            exit(-1)
+
+        if not run_watch(parsed_args.mode, input_files, output_files, waste_local, aether_local, pipeline_enabled,
+                         parsed_args.interval, use_cache):
+            exit(-1)
+    elif input_mode == "compile" or input_mode == "emit":
+        from compiled import COMPILED_SUFFIX, compile_network, emit_network
+        compiled_filename, network_files = (output_files, input_files) if input_mode == "compile" \
+            else (parsed_args.input, parsed_args.output)
+        if len(network_files) == 2:
+            if ".in" in network_files[1] and ".r" in network_files[0]:
+                network_files.reverse()
+            elif not (".in" in network_files[0] and ".r" in network_files[1]):
+                print("Error: Invalid Aleae file type")
+                exit(-1)
+        elif len(network_files) != 1 or ".csv" not in network_files[0]:
+            print("Error: Expected a .in and a .r Aleae file or one MARlea file")
+            exit(-1)
+        if COMPILED_SUFFIX not in compiled_filename:
+            print("Error: Invalid compiled network file type")
+            exit(-1)
+
+        if input_mode == "compile":
+            success = compile_network(network_files, compiled_filename, waste_local, aether_local)
+        else:
+            success = emit_network(compiled_filename, network_files)
+        if not success:
+            exit(-1)
     elif input_mode == "a-to-m":
         if ".in" in input_files[0] and ".r" in input_files[1]:
             aleae_in_filename = input_files[0]
@@ -1116,8 +2021,17 @@ def scan_args():
             print("Error: Invalid output file type")
             exit(-1)
 
-        start_a_to_m_conversion(aleae_in_filename, aleae_r_filename, marlea_filename, waste_local, aether_local,
-                         pipeline_enabled)
+        stats = None
+        if parsed_args.stats is not None or parsed_args.trace is not None:
+            stats = ConversionStats(trace=parsed_args.trace is not None)
+        profiler = make_profiler(parsed_args.profile)
+        success = start_a_to_m_conversion(aleae_in_filename, aleae_r_filename, marlea_filename, waste_local,
+                                          aether_local, pipeline_enabled, workers, chunk_size, parsed_args.optimistic,
+                                          parsed_args.flush_size, use_cache, parsed_args.incremental,
+                                          parsed_args.memo_size, parsed_args.memo_stats, stats=stats, profiler=profiler)
+        report_stats(stats, parsed_args.stats, parsed_args.trace)
+        if not success:
+            exit(-1)
     elif input_mode == "m-to-a":
         if ".in" in output_files[0] or ".r" in output_files[1]:
             aleae_in_filename = output_files[0]
@@ -1134,11 +2048,21 @@ def scan_args():
             print("Error: Invalid input file type")
             exit(-1)
 
-        start_m_to_a_conversion(aleae_in_filename, aleae_r_filename, marlea_filename, waste_local, aether_local,
-                         pipeline_enabled)
+        stats = None
+        if parsed_args.stats is not None or parsed_args.trace is not None:
+            stats = ConversionStats(trace=parsed_args.trace is not None)
+        profiler = make_profiler(parsed_args.profile)
+        success = start_m_to_a_conversion(aleae_in_filename, aleae_r_filename, marlea_filename, waste_local,
+                                          aether_local, pipeline_enabled, workers, chunk_size, parsed_args.flush_size,
+                                          use_cache, parsed_args.incremental, parsed_args.memo_size,
+                                          parsed_args.memo_stats, stats=stats, profiler=profiler)
+        report_stats(stats, parsed_args.stats, parsed_args.trace)
+        if not success:
+            exit(-1)
     else:
         print("Error: Invalid command.")
         exit(-1)
 
 
-scan_args()
+if __name__ == "__main__":
+    scan_args()
@@ -0,0 +1,337 @@
+"""
+Name: AwesomeNova
+Updated at: 10/17/2026
+
+Conversion daemon for converter.py. The daemon keeps a pool of warm worker processes and takes conversion jobs over HTTP,
+either on a localhost port or on a Unix domain socket, so a program that converts many networks starts Python once
+instead of once per network.
+
+POST /convert takes a job as a JSON object:
+    "mode": "a-to-m" or "m-to-a"
+    "input": paths of the .in and .r files (a-to-m) or of the .csv file (m-to-a), with
+    "output": paths of the .csv file (a-to-m) or of the .in and .r files (m-to-a)
+    or instead of both, "content": {"in": ..., "r": ...} (a-to-m) or {"csv": ...} (m-to-a) to send the input inline
+    "waste": waste chemical, "aether": list of aether chemicals, "pipeline": true for pipelined execution (optional)
+and answers with {"success": ..., "diagnostics": ..., "seconds": ...}, along with "content" holding the output files
+when the input was sent inline. Paths are taken relative to the directory the daemon was started in, must have the
+extensions of the files they stand for, and the input files must exist.
+
+Jobs must be sent with "Content-Type: application/json" and a Host of 127.0.0.1 or localhost. Requests carrying an
+Origin header come from a web page and are refused, so a page open in a browser cannot overwrite files through the
+daemon.
+
+GET /stats answers with the number of queued, running, and finished jobs and the latencies of the recent ones.
+
+This is the template for starting the daemon:
+'python converter.py daemon [--port] [--socket] [--jobs] [--no_cache]'
+"""
+import contextlib
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import stat
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import converter
+
+A_TO_M = "a-to-m"
+M_TO_A = "m-to-a"
+DEFAULT_PORT = 8765
+LATENCY_SAMPLES = 1000                      # Recent jobs that latencies are reported over
+INPUT_NAMES = {A_TO_M: ("in", "r"), M_TO_A: ("csv", )}
+OUTPUT_NAMES = {A_TO_M: ("csv", ), M_TO_A: ("in", "r")}
+LOCAL_HOSTS = ("127.0.0.1", "localhost")
+
+
+def init_daemon_worker():
+    """Leave Ctrl+C to the daemon itself, which shuts the worker processes down."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def run_job(job):
+    """
+    Run a conversion job inside a worker process, capturing anything the converter prints
+    :param job: tuple of (mode, input paths, output paths, waste, aether, pipeline_enabled, use_cache)
+    :return: tuple of (success, seconds taken, captured diagnostics)
+    """
+    mode, input_files, output_files, waste, aether, pipeline_enabled, use_cache = job
+    diagnostics = io.StringIO()
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(diagnostics):
+        try:
+            if mode == A_TO_M:
+                success = converter.start_a_to_m_conversion(input_files[0], input_files[1], output_files[0], waste,
+                                                            aether, pipeline_enabled, use_cache=use_cache)
+            else:
+                success = converter.start_m_to_a_conversion(output_files[0], output_files[1], input_files[0], waste,
+                                                            aether, pipeline_enabled, use_cache=use_cache)
+        except Exception as e:                                              # One broken job must not end the worker
+            print(type(e).__name__ + ":", e)
+            success = False
+    return success, time.perf_counter() - start, diagnostics.getvalue()
+
+
+def run_inline_job(job):
+    """
+    Run a conversion job whose input files were sent inline, in a temporary directory inside a worker process
+    :param job: tuple of (mode, dict of input file contents, waste, aether, pipeline_enabled, use_cache)
+    :return: tuple of (success, seconds taken, captured diagnostics, dict of output file contents)
+    """
+    mode, contents, waste, aether, pipeline_enabled, use_cache = job
+    outputs = {}
+    with tempfile.TemporaryDirectory() as directory:
+        input_files = [os.path.join(directory, "network." + name) for name in INPUT_NAMES[mode]]
+        output_files = [os.path.join(directory, "converted." + name) for name in OUTPUT_NAMES[mode]]
+        for filename, name in zip(input_files, INPUT_NAMES[mode]):
+            with open(filename, "w", newline='') as f:
+                f.write(contents[name])
+
+        success, elapsed, diagnostics = run_job((mode, input_files, output_files, waste, aether, pipeline_enabled,
+                                                 use_cache))
+        if success:
+            for filename, name in zip(output_files, OUTPUT_NAMES[mode]):
+                with open(filename, "r", newline='') as f:
+                    outputs[name] = f.read()
+        diagnostics = diagnostics.replace(directory + os.sep, "")          # The paths mean nothing to the client
+    return success, elapsed, diagnostics, outputs
+
+
+def parse_job(request, use_cache):
+    """
+    Check a job sent to the daemon and turn it into the arguments of a worker function
+    :param request: the decoded JSON object of the job
+    :param use_cache: reuse and store converted networks in the conversion cache
+    :return: tuple of (worker function, job tuple)
+    """
+    if not isinstance(request, dict):
+        raise ValueError("A job must be a JSON object")
+    mode = request.get("mode")
+    if mode not in INPUT_NAMES:
+        raise ValueError("mode must be 'a-to-m' or 'm-to-a'")
+
+    waste = request.get("waste") or ''
+    aether = request.get("aether") or []
+    if not isinstance(waste, str) or not isinstance(aether, list) or not all(isinstance(a, str) for a in aether):
+        raise ValueError("waste must be a string and aether a list of strings")
+    elif waste in aether:
+        raise ValueError("Aether chemical " + waste + " is the same as the waste chemical")
+    pipeline_enabled = bool(request.get("pipeline", False))
+
+    if "content" in request:
+        contents = request["content"]
+        if not isinstance(contents, dict) or not all(isinstance(contents.get(name), str) for name in INPUT_NAMES[mode]):
+            raise ValueError("content must hold the " + " and ".join(INPUT_NAMES[mode]) + " files as strings")
+        return run_inline_job, (mode, {name: contents[name] for name in INPUT_NAMES[mode]}, waste, aether,
+                                pipeline_enabled, use_cache)
+
+    input_files, output_files = request.get("input"), request.get("output")
+    for files, names, kind in ((input_files, INPUT_NAMES[mode], "input"), (output_files, OUTPUT_NAMES[mode], "output")):
+        if not isinstance(files, list) or len(files) != len(names) or not all(isinstance(f, str) for f in files):
+            raise ValueError(kind + " must be a list of paths to the " + " and ".join(names) + " files")
+        for filename, name in zip(files, names):
+            if os.path.splitext(filename)[1] != "." + name:
+                raise ValueError(kind + " file " + filename + " is not a ." + name + " file")
+    for filename in input_files:
+        if not os.path.isfile(filename):
+            raise ValueError("Input file " + filename + " does not exist")
+    return run_job, (mode, input_files, output_files, waste, aether, pipeline_enabled, use_cache)
+
+
+def summarize(samples):
+    """Return the mean, median, 95th percentile, and maximum of a list of seconds."""
+    if len(samples) == 0:
+        return {"mean": None, "p50": None, "p95": None, "max": None}
+    samples = sorted(samples)
+    return {"mean": sum(samples) / len(samples), "p50": samples[len(samples) // 2],
+            "p95": samples[min(len(samples) - 1, len(samples) * 95 // 100)], "max": samples[-1]}
+
+
+class DaemonStats:
+    """Counts of the jobs sent to the daemon and the timings of recent ones, shared by the request threads."""
+    def __init__(self, workers):
+        self.lock = threading.Lock()
+        self.workers = workers
+        self.started = time.time()
+        self.pending = 0                                                    # Jobs queued or running
+        self.succeeded = 0
+        self.failed = 0
+        self.latencies = deque(maxlen=LATENCY_SAMPLES)                      # From receiving a job to answering it
+        self.conversion_times = deque(maxlen=LATENCY_SAMPLES)               # Spent converting inside a worker
+
+    def begin_job(self):
+        with self.lock:
+            self.pending += 1
+
+    def end_job(self, success, latency, conversion_time):
+        with self.lock:
+            self.pending -= 1
+            if success:
+                self.succeeded += 1
+            else:
+                self.failed += 1
+            self.latencies.append(latency)
+            if conversion_time is not None:
+                self.conversion_times.append(conversion_time)
+
+    def snapshot(self):
+        """Return the stats as a JSON object."""
+        with self.lock:
+            queued = max(0, self.pending - self.workers)
+            return {"workers": self.workers, "uptime": time.time() - self.started, "queued": queued,
+                    "running": self.pending - queued, "succeeded": self.succeeded, "failed": self.failed,
+                    "latency": summarize(list(self.latencies)),
+                    "conversion_time": summarize(list(self.conversion_times))}
+
+
+class ConversionRequestHandler(BaseHTTPRequestHandler):
+    """Answers the requests of one connection to the daemon."""
+    protocol_version = "HTTP/1.1"                                           # Clients may keep their connection open
+    disable_nagle_algorithm = True                                          # Answers go out as soon as they are written
+
+    def send_json(self, status, body):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path == "/stats":
+            self.send_json(200, self.server.stats.snapshot())
+        else:
+            self.send_json(404, {"error": "Unknown path " + self.path})
+
+    def refuse_request(self):
+        """
+        Check that a job comes from a local program and not from a web page open in a browser
+        :return: tuple of (status, error) to answer with, or None if the job can be taken
+        """
+        host = self.headers.get("Host", "")
+        if self.headers.get("Origin") is not None or host.rsplit(":", 1)[0] not in LOCAL_HOSTS:
+            return 403, "Jobs are only taken from local programs"
+        if self.headers.get_content_type() != "application/json":
+            return 415, "Jobs must be sent as application/json"
+
+        length = self.headers.get("Content-Length")
+        if length is None:
+            return 411, "Content-Length is required"
+        elif not length.strip().isdigit():
+            return 400, "Invalid Content-Length " + length
+        return None
+
+    def do_POST(self):
+        refusal = self.refuse_request()
+        if refusal is not None:
+            self.send_json(refusal[0], {"error": refusal[1]})
+            self.close_connection = True                                    # The body was not read
+            return
+        try:
+            request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        except ValueError as e:
+            self.send_json(400, {"error": "Invalid JSON: " + str(e)})
+            return
+        if self.path != "/convert":
+            self.send_json(404, {"error": "Unknown path " + self.path})
+            return
+        try:
+            run, job = parse_job(request, self.server.use_cache)
+        except ValueError as e:
+            self.send_json(400, {"error": str(e)})
+            return
+
+        stats = self.server.stats
+        start = time.perf_counter()
+        stats.begin_job()
+        try:
+            result = self.server.executor.submit(run, job).result()
+        except Exception as e:                                              # A worker process died
+            stats.end_job(False, time.perf_counter() - start, None)
+            self.send_json(500, {"error": type(e).__name__ + ": " + str(e)})
+            return
+        stats.end_job(result[0], time.perf_counter() - start, result[1])
+
+        body = {"success": result[0], "seconds": result[1], "diagnostics": result[2]}
+        if run is run_inline_job:
+            body["content"] = result[3]
+        self.send_json(200, body)
+
+    def log_message(self, format, *args):
+        pass                                                                # Requests are counted in /stats instead
+
+
+class UnixConversionRequestHandler(ConversionRequestHandler):
+    """ConversionRequestHandler for connections to a Unix domain socket, which has no Nagle algorithm to disable."""
+    disable_nagle_algorithm = False
+
+
+class ConversionServer(ThreadingHTTPServer):
+    """HTTP server that hands the jobs it receives to a pool of worker processes."""
+    daemon_threads = True
+    handler_class = ConversionRequestHandler
+
+    def __init__(self, address, executor, stats, use_cache):
+        self.executor = executor
+        self.stats = stats
+        self.use_cache = use_cache
+        super().__init__(address, self.handler_class)
+
+
+class UnixConversionServer(ConversionServer):
+    """ConversionServer listening on a Unix domain socket."""
+    address_family = socket.AF_UNIX
+    handler_class = UnixConversionRequestHandler
+
+    def server_bind(self):
+        socketserver.TCPServer.server_bind(self)                            # There is no host name to look up
+        self.server_name = "localhost"
+        self.server_port = 0
+
+
+def run_daemon(port=DEFAULT_PORT, socket_path=None, jobs=None, use_cache=True):
+    """
+    Take conversion jobs over HTTP until interrupted with Ctrl+C
+    :param port: localhost port to listen on, unless socket_path is given
+    :param socket_path: path of a Unix domain socket to listen on instead of a port
+    :param jobs: number of worker processes, defaulting to the number of cores
+    :param use_cache: reuse and store converted networks in the conversion cache
+    :return: False if the daemon could not start listening, otherwise True once interrupted
+    """
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    stats = DaemonStats(jobs)
+    where = socket_path if socket_path is not None else "http://127.0.0.1:" + str(port)
+
+    with ProcessPoolExecutor(jobs, initializer=init_daemon_worker) as executor:
+        try:
+            if socket_path is not None:
+                with contextlib.suppress(OSError):
+                    if stat.S_ISSOCK(os.stat(socket_path).st_mode):        # Left behind by a daemon that was killed
+                        os.remove(socket_path)
+                server = UnixConversionServer(socket_path, executor, stats, use_cache)
+            else:
+                server = ConversionServer(("127.0.0.1", port), executor, stats, use_cache)
+        except OSError as e:
+            print("Error: Could not listen on", where + ":", e)
+            return False
+
+        print("Listening on", where, "with", jobs, "worker process(es) (press Ctrl+C to stop)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            if socket_path is not None:
+                os.remove(socket_path)
+    print("Daemon stopped")
+    return True
@@ -0,0 +1,210 @@
+"""
+Name: AwesomeNova
+Updated at: 10/17/2026
+
+The gui for converter.py. None of the widgets are created until run_gui() is called, so importing converter.py or
+this file never initializes Tk. The gui is summoned with 'python converter.py gui'.
+"""
+import tkinter
+from tkinter import Tk, ttk, StringVar, BooleanVar, filedialog, messagebox
+
+from converter import start_a_to_m_conversion, start_m_to_a_conversion
+
+
+class ConverterGui:
+    def __init__(self):
+        self.root = Tk()                                                    # Set up the gui
+        self.root.title("Aleae-MARlea File Converter")
+        self.root.minsize(500, 300)
+        button_frame = ttk.Frame(self.root, padding="8 8 12 12")
+        self.file_frame = ttk.Frame(self.root, padding="8 8 12 12")
+        waste_aether_frame = ttk.Frame(self.root, padding="8 8 12 12")
+        conversion_button_frame = ttk.Frame(self.root, padding="8 8 12 12")
+        button_frame.grid(column=0, row=0, sticky=(tkinter.N, tkinter.W, tkinter.E, tkinter.S))
+        self.file_frame.grid(column=1, row=0)
+        waste_aether_frame.grid(column=0, row=1)
+        conversion_button_frame.grid(column= 1, row=1)
+        self.root.columnconfigure(0, weight=1)
+        self.root.columnconfigure(1, weight=1)
+        self.root.columnconfigure(2, weight=1)
+        self.root.rowconfigure(list(range(10)), weight=1)
+
+        radio_button_label = ttk.Label(button_frame, text="Conversion mode select:")
+        radio_button_label.grid(column=0, row=0, sticky=tkinter.W)
+        flag_label = ttk.Label(button_frame, text="Select enable flags:")
+        flag_label.grid(column=0, row=4, sticky=tkinter.W)
+
+        self.input_label = ttk.Label(self.file_frame, text="Input Files")
+        self.output_label = ttk.Label(self.file_frame, text="Output Files")
+        self.selected_input_in_file_label = ttk.Label(self.file_frame, text="Selected File:")
+        self.selected_input_r_file_label = ttk.Label(self.file_frame, text="Selected File:")
+        self.selected_input_marlea_file_label = ttk.Label(self.file_frame, text="Selected File:")
+        self.selected_output_in_file_label = ttk.Label(self.file_frame, text="Selected File:")
+        self.selected_output_r_file_label = ttk.Label(self.file_frame, text="Selected File:")
+        self.selected_output_marlea_file_label = ttk.Label(self.file_frame, text="Selected File:")
+
+        waste_aether_label = ttk.Label(waste_aether_frame, text="Enter waste and aether chemicals \n(Separate aether chemicals by whitespace)")
+        waste_label = ttk.Label(waste_aether_frame, text="Waste:")
+        aether_label = ttk.Label(waste_aether_frame, text="Aether:")
+
+        self.input_mode = StringVar()
+
+        self.a_to_m_aleae_file_in = ""                                      # Initialize gui file variables
+        self.a_to_m_aleae_file_r = ""
+        self.a_to_m_marlea_file = ""
+
+        self.m_to_a_marlea_file = ""
+        self.m_to_a_aleae_file_in = ""
+        self.m_to_a_aleae_file_r = ""
+
+        self.pipeline_enable = BooleanVar()
+
+        self.waste = StringVar()
+        self.aether = StringVar()
+
+        self.a_to_m_in_buttons = ttk.Button(self.file_frame, text="Open File", command=self.open_file_dialog_in)
+        self.a_to_m_r_buttons = ttk.Button(self.file_frame, text="Open File", command=self.open_file_dialog_r)
+        self.a_to_m_out_btn = ttk.Button(self.file_frame, text="Create File", command=self.save_file_dialog_csv)
+
+        self.m_to_a_buttons = ttk.Button(self.file_frame, text="Open File", command=self.open_file_dialog_csv)
+        self.m_to_a_in_out_btn = ttk.Button(self.file_frame, text="Create File", command=self.save_file_dialog_in)
+        self.m_to_a_r_out_btn = ttk.Button(self.file_frame, text="Create File", command=self.save_file_dialog_r)
+
+        # Set up the buttons and checkboxes for the gui
+        a_to_m_check = ttk.Radiobutton(button_frame, text='Aleae to MARlea', variable=self.input_mode, value='a-to-m', command=self.aleae_to_marlea_btns)
+        m_to_a_check = ttk.Radiobutton(button_frame, text='MARlea to Aleae', variable=self.input_mode, value='m-to-a', command=self.marlea_to_aleae_btns)
+        a_to_m_check.grid(column=0, row=1, sticky=tkinter.SW)
+        m_to_a_check.grid(column=0, row=2, sticky=tkinter.SW)
+
+        pipeline_widget = ttk.Checkbutton(button_frame, text="Enable pipelined execution", variable=self.pipeline_enable, onvalue=True, offvalue=False)
+        pipeline_widget.grid(column=0, row=6, sticky=tkinter.SW)
+
+        waste_aether_label.grid(column=2, row=0)
+        waste_entry = ttk.Entry(waste_aether_frame, textvariable=self.waste)
+        waste_entry.grid(column=2, row=1, sticky=tkinter.NW)
+        waste_label.grid(column=1, row=1, sticky=tkinter.E)
+        aether_entry = ttk.Entry(waste_aether_frame, textvariable=self.aether)
+        aether_label.grid(column=1, row=2, sticky=tkinter.E)
+        aether_entry.grid(column=2, row=2, sticky=tkinter.NW)
+
+        confirm_btn = ttk.Button(self.root, text="Start Conversion", command=self.start_conversion)
+        confirm_btn.grid(column=1, row=1)
+
+    def mainloop(self):
+        self.root.mainloop()
+
+    def open_file_dialog_in(self):
+        """Prompt the user with an open file dialog and set the .in file variable to user input."""
+        self.a_to_m_aleae_file_in = filedialog.askopenfilename(title="Select a File", filetypes=[("Aleae initialization files", "*.in")])
+        if self.a_to_m_aleae_file_in:
+            self.selected_input_in_file_label.config(text=f"Selected File: {self.a_to_m_aleae_file_in}")
+
+    def open_file_dialog_r(self):
+        """Prompt the user with an open file dialog and set the .r file variable to user input."""
+        self.a_to_m_aleae_file_r = filedialog.askopenfilename(title="Select a File", filetypes=[("Aleae reaction files", "*.r")])
+        if self.a_to_m_aleae_file_r:
+            self.selected_input_r_file_label.config(text=f"Selected File: {self.a_to_m_aleae_file_r}")
+
+    def open_file_dialog_csv(self):
+        """Prompt the user with a open file dialog and set the .csv file variable to user input."""
+        self.m_to_a_marlea_file = filedialog.askopenfilename(title="Select a File", filetypes=[("MARlea files", "*.csv")])
+        if self.m_to_a_marlea_file:
+            self.selected_input_marlea_file_label.config(text=f"Selected File: {self.m_to_a_marlea_file}")
+
+    def save_file_dialog_in(self):
+        """Prompt the user with a save file dialog and set the .in file variable for output."""
+        self.m_to_a_aleae_file_in = filedialog.asksaveasfilename(title="Select a File", filetypes=[("Aleae initialization files", "*.in")])
+        if self.m_to_a_aleae_file_in:
+            self.selected_output_in_file_label.config(text=f"Selected File: {self.m_to_a_aleae_file_in}")
+
+    def save_file_dialog_r(self):
+        """Prompt the user with an save file dialog and set the .r file variable for output."""
+        self.m_to_a_aleae_file_r = filedialog.asksaveasfilename(title="Select a File", filetypes=[("Aleae reaction files", "*.r")])
+        if self.m_to_a_aleae_file_r:
+            self.selected_output_r_file_label.config(text=f"Selected File: {self.m_to_a_aleae_file_r}")
+
+    def save_file_dialog_csv(self):
+        """Prompt the user with a save file dialog and set the .csv file variable for output."""
+        self.a_to_m_marlea_file = filedialog.asksaveasfilename(title="Select a File", filetypes=[("MARlea files", "*.csv")])
+        if self.a_to_m_marlea_file:
+            self.selected_output_marlea_file_label.config(text=f"Selected File: {self.a_to_m_marlea_file}")
+
+    def aleae_to_marlea_btns(self):
+        """Setup and change buttons when a-to-m mode is set."""
+        self.selected_input_marlea_file_label.grid_remove()
+        self.selected_output_in_file_label.grid_remove()
+        self.selected_output_r_file_label.grid_remove()
+        self.m_to_a_buttons.grid_remove()
+        self.m_to_a_r_out_btn.grid_remove()
+        self.m_to_a_in_out_btn.grid_remove()
+
+        self.input_label.grid(column=1, row=0, sticky=tkinter.S)
+        self.selected_input_in_file_label.grid(column=1, row=1, sticky=tkinter.W)
+        self.selected_input_r_file_label.grid(column=1, row=2, sticky=tkinter.W)
+        self.output_label.grid(column=1, row=3, sticky=tkinter.S)
+
+        self.selected_output_marlea_file_label.grid(column=1, row=4, sticky=tkinter.W)
+        self.a_to_m_in_buttons.grid(column=0, row=1, sticky=tkinter.E)
+        self.a_to_m_r_buttons.grid(column=0, row=2, sticky=tkinter.E)
+        self.a_to_m_out_btn.grid(column=0, row=4, sticky=tkinter.N)
+
+    def marlea_to_aleae_btns(self):
+        """Setup and change buttons when m-to-a mode is set."""
+        self.a_to_m_in_buttons.grid_remove()
+        self.a_to_m_r_buttons.grid_remove()
+        self.a_to_m_out_btn.grid_remove()
+        self.selected_input_in_file_label.grid_remove()
+        self.selected_input_r_file_label.grid_remove()
+        self.selected_output_marlea_file_label.grid_remove()
+
+        self.input_label.grid(column=1, row=0, sticky=tkinter.S)
+        self.selected_input_marlea_file_label.grid(column=1, row=1, sticky=tkinter.W)
+        self.output_label.grid(column=1, row=2, sticky=tkinter.S)
+
+        self.selected_output_in_file_label.grid(column=1, row=3, sticky=tkinter.W)
+        self.selected_output_r_file_label.grid(column=1, row=4, sticky=tkinter.W)
+        self.m_to_a_buttons.grid(column=0, row=1, sticky=tkinter.E)
+        self.m_to_a_in_out_btn.grid(column=0, row=3, sticky=tkinter.N)
+        self.m_to_a_r_out_btn.grid(column=0, row=4, sticky=tkinter.N)
+
+    def start_conversion(self):
+        """The entry point for gui execution. """
+        if self.input_mode.get() == "":
+            return
+
+        if "," in self.aether.get() or "//" in self.aether.get():
+            messagebox.showerror(title="Invalid aether terms", message="Please enter aether terms as instructed.")
+            return
+        elif len(self.waste.get().split()) > 1 or "," in self.waste.get() or "//" in self.waste.get():
+            messagebox.showerror(title="Invalid waste term", message="Please enter only one waste term. No commas or '//' strings.")
+            return
+
+        if self.input_mode.get() == "a-to-m":
+            if self.a_to_m_aleae_file_in == "" or self.a_to_m_aleae_file_r == "" or self.a_to_m_marlea_file == "":
+                messagebox.showerror(title="Missing files", message="All files need to be entered.")
+                return
+            else:
+                success = start_a_to_m_conversion(
+                    self.a_to_m_aleae_file_in, self.a_to_m_aleae_file_r, self.a_to_m_marlea_file,
+                    self.waste.get().strip(), self.aether.get().split(), self.pipeline_enable.get())
+        elif self.input_mode.get() == "m-to-a":
+            if self.m_to_a_marlea_file == "" or self.m_to_a_aleae_file_in == "" or self.m_to_a_aleae_file_r == "":
+                messagebox.showerror(title="Missing files", message="All files need to be entered.")
+                return
+            else:
+                success = start_m_to_a_conversion(
+                    self.m_to_a_aleae_file_in, self.m_to_a_aleae_file_r, self.m_to_a_marlea_file,
+                    self.waste.get().strip(), self.aether.get().split(), self.pipeline_enable.get())
+        else:
+            return
+
+        if not success:
+            messagebox.showerror(title="Conversion Halted", message="The input files could not be converted, and "
+                                 "existing output files were left untouched. See the console for what went wrong.")
+            return
+        messagebox.showinfo(title="Conversion Complete", message="Input files have been converted.")
+
+
+def run_gui():
+    """Build the gui and hand control over to Tk until the window is closed."""
+    ConverterGui().mainloop()
@@ -0,0 +1,175 @@
+"""
+Name: AwesomeNova
+Updated at: 10/17/2026
+
+Fingerprint indexes for incremental conversions with converter.py. After an incremental conversion, an index holding a
+fingerprint of every reaction line (or MARlea reaction row) of the input, in order, is written next to the output as
+<output>.idx. The next incremental conversion to the same output looks up the fingerprint of each of its reactions in
+the index and copies the converted reaction from the old output when it is found, so only the reactions that changed
+are tokenized, parsed, and converted.
+
+An index is only used when the output it describes is unchanged and was converted with the same mode, waste and aether
+chemicals, and version of converter.py. For a-to-m, the .in file must be unchanged as well, since it decides which
+reactions are valid.
+"""
+import csv
+import hashlib
+import json
+import os
+
+from cache import CONVERTER_FILENAME, hash_file
+
+INDEX_SUFFIX = ".idx"
+INDEX_VERSION = 1
+FINGERPRINT_SIZE = 8                        # Bytes of the hash of a reaction kept in the index
+
+
+def index_filename(output_filename):
+    """Return the path of the index kept next to an output file."""
+    return output_filename + INDEX_SUFFIX
+
+
+def fingerprint(text):
+    """Return the fingerprint of a reaction line or row."""
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=FINGERPRINT_SIZE).digest()
+
+
+def file_digest(filename):
+    """Return the SHA-256 hex digest of a file, or None if it cannot be read."""
+    digest = hashlib.sha256()
+    try:
+        hash_file(digest, filename)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def settings_key(mode, waste, aether, in_filename=None):
+    """
+    Hash everything besides the reactions themselves that decides how a reaction is converted
+    :param mode: 'a-to-m' or 'm-to-a'
+    :param in_filename: path of the Aleae .in file of an a-to-m conversion
+    :return: the key of the settings, or None if a file cannot be read
+    """
+    parts = [mode, waste, *aether, file_digest(CONVERTER_FILENAME)]
+    if in_filename is not None:
+        parts.append(file_digest(in_filename))
+    if None in parts:
+        return None
+    return hashlib.sha256("\0".join(parts).encode("utf-8", "surrogatepass")).hexdigest()
+
+
+class LineIndex:
+    """
+    The reactions of the previous conversion to an output, looked up by fingerprint, and the fingerprints of every
+    reaction looked up during this conversion, in order. old_lines holds the converted line of each reaction of the
+    previous conversion in the order of its fingerprints.
+    """
+    def __init__(self, key, old_fingerprints=(), old_lines=()):
+        self.key = key
+        self.old_positions = {fp: i for i, fp in enumerate(old_fingerprints)}
+        self.old_lines = old_lines
+        self.fingerprints = []
+        self.reused = 0
+
+    def lookup(self, text):
+        """
+        Record the fingerprint of a reaction and find its converted line in the previous output
+        :param text: the reaction line or row, as the conversion reads it
+        :return: the converted line from the previous output, or None if the reaction has to be converted
+        """
+        fp = fingerprint(text)
+        self.fingerprints.append(fp)
+        position = self.old_positions.get(fp)
+        if position is None:
+            return None
+        self.reused += 1
+        return self.old_lines[position]
+
+    def save(self, output_filename, indexed_filename):
+        """
+        Write the index of this conversion next to its output
+        :param output_filename: the output file the index is named after
+        :param indexed_filename: the output file holding one converted line per fingerprint, at its end
+        """
+        if self.key is None:
+            return
+        header = {"version": INDEX_VERSION, "key": self.key, "output": file_digest(indexed_filename),
+                  "count": len(self.fingerprints)}
+        filename = index_filename(output_filename)
+        temp_filename = filename + "." + str(os.getpid()) + ".tmp"
+        try:
+            with open(temp_filename, "wb") as f:
+                f.write(json.dumps(header).encode() + b"\n")
+                f.write(b"".join(self.fingerprints))
+            os.replace(temp_filename, filename)
+        except OSError:
+            print("Index file " + filename + " failed to be written.")
+
+
+def remove_index(output_filename):
+    """Remove the index of an output that is no longer described by it."""
+    try:
+        os.remove(index_filename(output_filename))
+    except OSError:
+        pass
+
+
+def load_index(output_filename, indexed_filename, key):
+    """
+    Read the index kept next to an output and the converted lines it points to
+    :param output_filename: the output file the index is named after
+    :param indexed_filename: the output file holding one converted line per fingerprint, at its end
+    :param key: settings key of this conversion
+    :return: tuple of the fingerprints and the converted lines of the previous conversion, or None if there is no index
+    that can be used
+    """
+    try:
+        with open(index_filename(output_filename), "rb") as f:
+            header = json.loads(f.readline())
+            fingerprints_data = f.read()
+    except (OSError, ValueError):
+        return None
+
+    count = header.get("count", -1)
+    if header.get("version") != INDEX_VERSION or key is None or header.get("key") != key \
+            or len(fingerprints_data) != count * FINGERPRINT_SIZE \
+            or header.get("output") != file_digest(indexed_filename):       # The output was changed or replaced
+        return None
+
+    try:
+        with open(indexed_filename, "r", newline='') as f:
+            lines = f.readlines()
+    except (OSError, UnicodeDecodeError):
+        return None
+    if len(lines) < count:
+        return None
+
+    fingerprints = [fingerprints_data[i:i + FINGERPRINT_SIZE] for i in range(0, len(fingerprints_data), FINGERPRINT_SIZE)]
+    return fingerprints, lines[len(lines) - count:]
+
+
+def a_to_m_index(aleae_in_filename, marlea_filename, waste, aether):
+    """
+    Set up the index of an incremental Aleae to MARlea conversion. Fingerprints are taken of the .r lines, and each
+    points to the MARlea row of the reaction.
+    """
+    key = settings_key("a-to-m", waste, aether, aleae_in_filename)
+    previous = load_index(marlea_filename, marlea_filename, key)
+    if previous is None:
+        return LineIndex(key)
+    fingerprints, lines = previous
+    return LineIndex(key, fingerprints, list(csv.reader(lines, "excel")))
+
+
+def m_to_a_index(aleae_r_filename, waste, aether):
+    """
+    Set up the index of an incremental MARlea to Aleae conversion. Fingerprints are taken of the reaction and rate
+    columns of the reaction rows, and each points to the .r line of the reaction.
+    """
+    key = settings_key("m-to-a", waste, aether)
+    previous = load_index(aleae_r_filename, aleae_r_filename, key)
+    if previous is None:
+        return LineIndex(key)
+    fingerprints, lines = previous
+    return LineIndex(key, fingerprints, [line[:-1] for line in lines])      # Without the newline
@@ -0,0 +1,292 @@
+"""
+Name: AwesomeNova
+Updated at: 10/17/2026
+
+Instrumentation of conversions for converter.py, reported with --stats. A ConversionStats collects:
+    for each stage (readers, converter, writers): wall and CPU time, and the chunks and items it handed on
+    for each phase of converting a reaction (fast path, tokenize, parse, convert_tree_to_*, construct_line): how often
+    it ran and how long it took
+    for each queue between pipelined stages: how many chunks it held at most, and how long stages waited to put chunks
+    on it and to get chunks off it
+Stages nest when one pulls chunks from another in the same thread, so the time of a stage excludes the time of the
+stages nested inside it.
+
+A ConversionStats made with trace=True also records a span for every chunk each stage produces or writes, and for
+every wait on a queue of at least TRACE_MIN_WAIT seconds, which write_trace() saves in the Chrome trace-event format.
+Loaded into a trace viewer (chrome://tracing or https://ui.perfetto.dev), it shows one row per stage thread, so gaps
+where a stage waited on another one stand out.
+
+A ConversionProfiler runs cProfile inside each stage thread and each worker process of a conversion, which profiling
+converter.py from the outside cannot do, and writes a pstats file for each of them along with a merged summary.
+
+Conversions only pay for this when they are given a ConversionStats.
+"""
+import cProfile
+import json
+import multiprocessing.util
+import os
+import pstats
+import queue
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+TRACE_MIN_WAIT = 0.0001                     # Shorter waits on a queue are left out of traces
+MAIN_PROFILE = "main"                       # Profile of the thread that starts a conversion
+PER_THREAD_PROFILING = sys.version_info < (3, 12)   # Later versions run one profiler at a time, seeing every thread
+SUMMARY_ENTRIES = 30                        # Functions listed in each table of a profile summary
+
+
+class StageStats:
+    __slots__ = ("wall", "cpu", "chunks", "items")
+
+    def __init__(self):
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.chunks = 0
+        self.items = 0
+
+
+class PhaseStats:
+    __slots__ = ("calls", "seconds")
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+
+
+class InstrumentedQueue(queue.Queue):
+    """
+    A queue that records how full it gets and how long put() and get() wait. Each end is used by a single thread.
+    Given a ConversionStats that traces, waits of at least TRACE_MIN_WAIT seconds are added to the trace.
+    """
+    def __init__(self, maxsize=0, name='', stats=None):
+        super().__init__(maxsize)
+        self.name = name
+        self.stats = stats if stats is not None and stats.events is not None else None
+        self.high_water = 0
+        self.puts = 0
+        self.put_blocked = 0.0
+        self.get_blocked = 0.0
+
+    def put(self, item, block=True, timeout=None):
+        start = time.perf_counter()
+        super().put(item, block, timeout)
+        waited = time.perf_counter() - start
+        self.put_blocked += waited
+        self.puts += 1
+        self.high_water = max(self.high_water, self.qsize())
+        if self.stats is not None and waited >= TRACE_MIN_WAIT:
+            self.stats.span("put " + self.name, "queue", start, waited)
+
+    def get(self, block=True, timeout=None):
+        start = time.perf_counter()
+        try:
+            return super().get(block, timeout)
+        finally:
+            waited = time.perf_counter() - start
+            self.get_blocked += waited
+            if self.stats is not None and waited >= TRACE_MIN_WAIT:
+                self.stats.span("get " + self.name, "queue", start, waited)
+
+
+class ConversionStats:
+    """Everything measured during one conversion. See the module docstring."""
+    def __init__(self, trace=False):
+        self.stages = {}
+        self.phases = {}
+        self.queues = {}
+        self.wall = 0.0                                                     # Of the whole conversion
+        self.converted = False                                              # False if the output came from the cache
+        self.memo = None                                                    # Hits and lookups of the reaction memo
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.origin = time.perf_counter()                                   # Time 0 of the trace
+        self.events = [] if trace else None                                 # (name, category, start, duration, thread)
+        self.thread_stages = {}                                             # Thread ID -> stages run in it
+
+    def stage(self, name):
+        """Return the StageStats of a stage, adding it if it is new."""
+        with self.lock:
+            return self.stages.setdefault(name, StageStats())
+
+    def queue(self, name, maxsize):
+        """Return a new InstrumentedQueue that is reported under a name."""
+        q = InstrumentedQueue(maxsize, name, self)
+        self.queues[name] = q
+        return q
+
+    def count(self, stage, items):
+        """Count a chunk of items handed on by a stage. The two writers of an optimistic conversion share a stage."""
+        with self.lock:
+            stage.chunks += 1
+            stage.items += items
+
+    def phase(self, name, seconds):
+        """Record one run of a phase. Phases are only run by the converter stage."""
+        phase = self.phases.get(name)
+        if phase is None:
+            phase = self.phases[name] = PhaseStats()
+        phase.calls += 1
+        phase.seconds += seconds
+
+    def span(self, name, category, start, duration):
+        """Add a span of the current thread to the trace, starting at a time.perf_counter() value."""
+        self.events.append((name, category, start, duration, threading.get_ident()))
+
+    @contextmanager
+    def measure(self, name):
+        """Add the wall and CPU time spent in a block, minus the time of the stages nested in it, to a stage."""
+        stage = self.stage(name)
+        frames = self.local.__dict__.setdefault("frames", [])
+        frame = [0.0, 0.0]                                                  # Time of the nested stages
+        frames.append(frame)
+        start_wall, start_cpu = time.perf_counter(), time.thread_time()
+        try:
+            yield stage
+        finally:
+            wall, cpu = time.perf_counter() - start_wall, time.thread_time() - start_cpu
+            frames.pop()
+            if len(frames) > 0:
+                frames[-1][0] += wall
+                frames[-1][1] += cpu
+            with self.lock:
+                stage.wall += wall - frame[0]
+                stage.cpu += cpu - frame[1]
+            if self.events is not None:
+                thread_stages = self.thread_stages.setdefault(threading.get_ident(), [])
+                if name not in thread_stages:
+                    thread_stages.append(name)
+                self.span(name, "stage", start_wall, wall)
+
+    def timed(self, name, chunks, part=None):
+        """
+        Return the chunks of a stage, measuring the time it takes to produce each of them. The stage is added right
+        away, so stages are reported in the order they were set up in.
+        :param part: index of the part of each chunk whose items are counted, or None if the chunk is a list of items
+        """
+        return self.time_chunks(name, self.stage(name), chunks, part)
+
+    def time_chunks(self, name, stage, chunks, part):
+        chunks = iter(chunks)
+        while True:
+            with self.measure(name):
+                chunk = next(chunks, None)
+            if chunk is None:
+                return
+            self.count(stage, len(chunk if part is None else chunk[part]))
+            yield chunk
+
+    def as_dict(self):
+        """Return the stats as a JSON object."""
+        return {"wall_seconds": self.wall, "converted": self.converted,
+                "stages": {name: {"wall_seconds": s.wall, "cpu_seconds": s.cpu, "chunks": s.chunks, "items": s.items}
+                           for name, s in self.stages.items()},
+                "phases": {name: {"calls": p.calls, "seconds": p.seconds} for name, p in self.phases.items()},
+                "queues": {name: {"capacity": q.maxsize, "high_water": q.high_water, "puts": q.puts,
+                                  "put_blocked_seconds": q.put_blocked, "get_blocked_seconds": q.get_blocked}
+                           for name, q in self.queues.items() if q.puts > 0},
+                "memo": self.memo}
+
+    def write_trace(self, filename):
+        """
+        Write the trace in the Chrome trace-event format, with times in microseconds. Each thread is named after the
+        stages that ran in it.
+        """
+        pid = os.getpid()
+        events = [{"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": ", ".join(names)}}
+                  for tid, names in self.thread_stages.items()]
+        events.extend({"name": name, "cat": category, "ph": "X", "pid": pid, "tid": tid,
+                       "ts": (start - self.origin) * 1e6, "dur": duration * 1e6}
+                      for name, category, start, duration, tid in self.events)
+        with open(filename, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+    def write_json(self, filename):
+        with open(filename, "w") as f:
+            json.dump(self.as_dict(), f, indent=2)
+
+    def report(self):
+        """Return the stats as a table."""
+        lines = [f"Conversion stats: {self.wall:.3f}s wall"]
+        if not self.converted:
+            lines.append("The output was copied from the conversion cache, so nothing was converted")
+            return "\n".join(lines)
+
+        lines.append(f"{'Stage':<30}{'wall s':>10}{'cpu s':>10}{'chunks':>10}{'items':>12}")
+        for name, s in self.stages.items():
+            lines.append(f"{name:<30}{s.wall:>10.3f}{s.cpu:>10.3f}{s.chunks:>10,}{s.items:>12,}")
+        if len(self.phases) > 0:
+            lines.append(f"{'Phase':<30}{'calls':>10}{'total s':>10}{'us/call':>10}")
+            for name, p in self.phases.items():
+                lines.append(f"{name:<30}{p.calls:>10,}{p.seconds:>10.3f}{p.seconds / p.calls * 1e6:>10.2f}")
+        queues = [(name, q) for name, q in self.queues.items() if q.puts > 0]  # Sequential execution uses none
+        if len(queues) > 0:
+            lines.append(f"{'Queue':<30}{'capacity':>10}{'high':>10}{'put wait s':>12}{'get wait s':>12}")
+            for name, q in queues:
+                lines.append(f"{name:<30}{q.maxsize:>10}{q.high_water:>10}{q.put_blocked:>12.3f}{q.get_blocked:>12.3f}")
+        if self.memo is not None:
+            lines.append(f"Reaction memo: {self.memo['hits']:,} hits of {self.memo['lookups']:,} lookups")
+        return "\n".join(lines)
+
+
+def profile_worker_process(directory):
+    """Profile the rest of the life of a worker process, writing worker-<pid>.pstats into a directory as it exits."""
+    if not PER_THREAD_PROFILING and sys.monitoring.get_tool(sys.monitoring.PROFILER_ID) is not None:
+        sys.monitoring.set_events(sys.monitoring.PROFILER_ID, 0)           # The parent's profiler was copied by fork
+        sys.monitoring.free_tool_id(sys.monitoring.PROFILER_ID)
+    profile = cProfile.Profile()
+    multiprocessing.util.Finalize(None, profile.dump_stats, (os.path.join(directory, f"worker-{os.getpid()}.pstats"), ),
+                                  exitpriority=0)
+    profile.enable()
+
+
+class ConversionProfiler:
+    """
+    Profiles a conversion with cProfile and writes what it finds into a directory:
+        <stage>.pstats for each stage thread, and main.pstats for the thread that started the conversion
+        worker-<pid>.pstats for each worker process converting reactions
+        merged.pstats and summary.txt, holding all of them together
+    Profiles left in the directory by an earlier conversion are removed first.
+    Python 3.12 and later only run one profiler at a time, which sees every thread, so main.pstats then holds the stage
+    threads as well.
+    """
+    def __init__(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        for filename in os.listdir(directory):
+            if filename.endswith(".pstats") or filename == "summary.txt":   # Left by an earlier profile
+                os.remove(os.path.join(directory, filename))
+        self.directory = directory
+        self.filenames = []
+        self.lock = threading.Lock()
+
+    def run(self, name, function, *args):
+        """Call a function, profiling it as a stage under a name, and return what it returns."""
+        if not PER_THREAD_PROFILING and name != MAIN_PROFILE:
+            return function(*args)
+        profile = cProfile.Profile()
+        try:
+            return profile.runcall(function, *args)
+        finally:
+            filename = os.path.join(self.directory, name + ".pstats")
+            profile.dump_stats(filename)
+            with self.lock:
+                self.filenames.append(filename)
+
+    def write_summary(self):
+        """Merge the profiles of the stages and worker processes, and summarize them in summary.txt."""
+        filenames = self.filenames + sorted(os.path.join(self.directory, filename)
+                                            for filename in os.listdir(self.directory)
+                                            if filename.startswith("worker-") and filename.endswith(".pstats"))
+        summary_filename = os.path.join(self.directory, "summary.txt")
+        with open(summary_filename, "w") as f:
+            f.write("Profiles merged into merged.pstats:\n")
+            for filename in filenames:
+                f.write(f"    {os.path.basename(filename):<40}{pstats.Stats(filename).total_tt:>10.3f}s\n")
+
+            merged = pstats.Stats(*filenames, stream=f)
+            merged.dump_stats(os.path.join(self.directory, "merged.pstats"))
+            merged.sort_stats(pstats.SortKey.TIME).print_stats(SUMMARY_ENTRIES)
+            merged.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(SUMMARY_ENTRIES)
+        print("Wrote profiles of", len(filenames), "threads and processes to", self.directory, "(see summary.txt)")
@@ -0,0 +1,90 @@
+"""
+Name: AwesomeNova
+Updated at: 10/17/2026
+
+Reproduces reactions that become NULL => NULL in MARlea, either because both of their sides are empty or because the
+aether and waste chemicals are all they hold. MARlea and m-to-a reject such a reaction, so a-to-m and emitting a
+MARlea file from a compiled network must halt on it instead of writing a file that cannot be converted back. Valid
+networks still round-trip from Aleae to MARlea and back.
+
+This is the template for running the tests from the root of the repo:
+'python -m unittest discover tests' or 'python -m pytest tests'
+"""
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+import compiled
+import converter
+
+IN_LINES = "A 1 N\nB 1 N\n"
+VALID_LINES = "A 1 : B 1 : 1\nB 1 : A 1 : 2\n"
+NULL_REACTIONS = {"empty sides": ": : 3\n", "only the aether": "A 1 : A 1 : 5\n"}
+
+
+class NullReactionTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def write(self, name, text):
+        with open(self.path(name), "w", newline='') as f:
+            f.write(text)
+        return self.path(name)
+
+    def convert(self, r_lines, pipeline_enabled=False, workers=1):
+        """Run a-to-m with A as the aether chemical and return whether it succeeded and what it printed."""
+        diagnostics = io.StringIO()
+        with contextlib.redirect_stdout(diagnostics):
+            success = converter.start_a_to_m_conversion(self.write("net.in", IN_LINES), self.write("net.r", r_lines),
+                                                        self.path("net.csv"), '', ["A"], pipeline_enabled, workers,
+                                                        use_cache=False)
+        return success, diagnostics.getvalue()
+
+    def test_valid_network_round_trips(self):
+        success, _ = self.convert(VALID_LINES)
+        self.assertTrue(success)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertTrue(converter.start_m_to_a_conversion(self.path("back.in"), self.path("back.r"),
+                                                              self.path("net.csv"), '', ["A"], False,
+                                                              use_cache=False))
+
+    def test_m_to_a_rejects_null_reactions(self):
+        self.write("null.csv", "B,1\r\n\r\nNULL => NULL, 3\r\n")
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertFalse(converter.start_m_to_a_conversion(self.path("null.in"), self.path("null.r"),
+                                                               self.path("null.csv"), '', ["A"], False,
+                                                               use_cache=False))
+
+    def test_a_to_m_halts_on_null_reactions(self):
+        for name, line in NULL_REACTIONS.items():
+            for pipeline_enabled, workers in ((False, 1), (True, 1), (False, 2)):
+                with self.subTest(name, pipeline_enabled=pipeline_enabled, workers=workers):
+                    if os.path.exists(self.path("net.csv")):
+                        os.remove(self.path("net.csv"))
+                    success, diagnostics = self.convert(VALID_LINES + line, pipeline_enabled, workers)
+                    self.assertFalse(success)
+                    self.assertIn("NULL => NULL", diagnostics)
+                    self.assertIn(line.strip(), diagnostics)
+                    self.assertFalse(os.path.exists(self.path("net.csv")))
+
+    def test_emit_halts_on_null_reactions(self):
+        for name, line in NULL_REACTIONS.items():
+            with self.subTest(name):
+                diagnostics = io.StringIO()
+                with contextlib.redirect_stdout(diagnostics):
+                    self.assertTrue(compiled.compile_network([self.write("net.in", IN_LINES),
+                                                              self.write("net.r", VALID_LINES + line)],
+                                                             self.path("net.crnb"), '', ["A"]))
+                    self.assertFalse(compiled.emit_network(self.path("net.crnb"), [self.path("net.csv")]))
+                self.assertIn(line.strip(), diagnostics.getvalue())
+                self.assertFalse(os.path.exists(self.path("net.csv")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+"""
+Name: AwesomeNova
+Updated at: 10/17/2026
+
+Watch mode for converter.py. The input file(s) of one network are polled for changes, and every time they are saved the
+network is converted again in the same process. Conversions are incremental (see incremental.py), so once the process
+is warm a save only costs converting the reactions that changed.
+
+This is the template for watching a network:
+'python converter.py watch <--mode> a-to-m|m-to-a <--input> <input file(s)> <--output> <output file(s)> [--interval] [-p] [--no_cache] [--waste] [--aether]'
+"""
+import os
+import time
+
+import converter
+
+A_TO_M = "a-to-m"
+M_TO_A = "m-to-a"
+DEFAULT_INTERVAL = 0.5                      # Seconds between polls of the input files
+
+
+def file_signature(filenames):
+    """Return the size and modification time of each file, or None for a file that does not exist at the moment."""
+    signature = []
+    for filename in filenames:
+        try:
+            stat = os.stat(filename)
+            signature.append((stat.st_size, stat.st_mtime_ns))
+        except OSError:
+            signature.append(None)
+    return tuple(signature)
+
+
+def wait_for_change(filenames, last_signature, interval):
+    """
+    Poll files until they change and then stay the same for a whole interval, so that a file is not converted while
+    an editor is still saving it
+    :return: the signature of the files once they settled
+    """
+    while True:
+        time.sleep(interval)
+        signature = file_signature(filenames)
+        if signature == last_signature or None in signature:               # Unchanged, or replaced mid-save
+            continue
+        time.sleep(interval)
+        if file_signature(filenames) == signature:
+            return signature
+
+
+def convert_network(mode, input_filenames, output_filenames, waste, aether, pipeline_enabled, use_cache):
+    """
+    Convert the watched network incrementally and report how it went
+    :return: True if the conversion finished without halting
+    """
+    start = time.perf_counter()
+    try:
+        if mode == A_TO_M:
+            success = converter.start_a_to_m_conversion(input_filenames[0], input_filenames[1], output_filenames[0],
+                                                        waste, aether, pipeline_enabled, use_cache=use_cache,
+                                                        incremental=True)
+        else:
+            success = converter.start_m_to_a_conversion(output_filenames[0], output_filenames[1], input_filenames[0],
+                                                        waste, aether, pipeline_enabled, use_cache=use_cache,
+                                                        incremental=True)
+    except Exception as e:                                                  # A bad save must not end the watch
+        print(type(e).__name__ + ":", e)
+        success = False
+    elapsed = time.perf_counter() - start
+
+    print(time.strftime("%H:%M:%S"), "Converted" if success else "Failed to convert", " ".join(input_filenames),
+          f"in {elapsed:.3f}s")
+    return success
+
+
+def run_watch(mode, input_filenames, output_filenames, waste='', aether=None, pipeline_enabled=False,
+              interval=DEFAULT_INTERVAL, use_cache=True):
+    """
+    Convert a network, then convert it again every time its input file(s) change until interrupted with Ctrl+C
+    :param mode: 'a-to-m' or 'm-to-a'
+    :param input_filenames: the .in and .r files for a-to-m, or the MARlea file for m-to-a
+    :param output_filenames: the MARlea file for a-to-m, or the .in and .r files for m-to-a
+    :param waste: a specified chemical that will be converted to a NULL in the products
+    :param aether: list of chemicals that will be converted to a NULL in the reactants
+    :param pipeline_enabled: enable pipelined execution of each conversion
+    :param interval: seconds between polls of the input files
+    :param use_cache: reuse and store converted networks in the conversion cache
+    :return: False if an input file does not exist, otherwise True once interrupted
+    """
+    for filename in input_filenames:
+        if not os.path.isfile(filename):
+            print("Error: Input file", filename, "does not exist")
+            return False
+
+    aether = [] if aether is None else aether
+    print("Watching", " ".join(input_filenames), "(press Ctrl+C to stop)")
+    signature = file_signature(input_filenames)
+    try:
+        while True:
+            convert_network(mode, input_filenames, output_filenames, waste, aether, pipeline_enabled, use_cache)
+            signature = wait_for_change(input_filenames, signature, interval)
+    except KeyboardInterrupt:
+        print("Stopped watching", " ".join(input_filenames))
+    return True